@@ -8,6 +8,7 @@ to provide inspiration and insights to current students.
 Key Features:
 - Load anonymized alumni success stories from CSV
 - Match similar profiles using skills, stream, and background
+- Vectorized matching over pre-encoded skill/stream/tier arrays
 - Provide testimonials and outcome data
 - Privacy-first approach with anonymized data
 
@@ -25,9 +26,46 @@ import warnings
 import hashlib
 from collections import Counter
 
+try:
+    from .skill_vocab import get_skill_vocabulary
+    from .catalog_stats import CachedStats, StatsSpec, column, upsert_rows
+except ImportError:
+    # Fallback for direct execution
+    from skill_vocab import get_skill_vocabulary
+    from catalog_stats import CachedStats, StatsSpec, column, upsert_rows
+
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
+TIER_MAP = {'Tier-1': 1, 'Tier-2': 2, 'Tier-3': 3}
+
+
+def _alumni_summary(agg) -> Dict[str, Any]:
+    """Build the alumni statistics summary from its aggregates."""
+    return {
+        'total_stories': agg.rows,
+        'unique_companies': agg.nunique('company_name'),
+        'outcome_distribution': agg.distribution('outcome'),
+        'stream_distribution': agg.distribution('stream'),
+        'tier_distribution': agg.distribution('college_tier'),
+        'year_distribution': agg.distribution('year'),
+        'avg_testimonial_length': agg.mean('testimonial_length'),
+        'companies_with_multiple_stories': sum(1 for count in agg.counts['company_name'].values() if count > 1)
+    }
+
+
+ALUMNI_STATS_SPEC = StatsSpec(
+    finalize=_alumni_summary,
+    counts={
+        'company_name': column('company_name'),
+        'outcome': column('outcome'),
+        'stream': column('stream'),
+        'college_tier': column('college_tier'),
+        'year': column('year')
+    },
+    sums={'testimonial_length': lambda df: df['testimonial'].str.len()}
+)
+
 
 class AlumniManager:
     """
@@ -46,6 +84,8 @@ class AlumniManager:
         """
         self.data_dir = data_dir
         self.alumni_df = None
+        self._index_source = None
+        self._statistics = CachedStats(ALUMNI_STATS_SPEC)
         
         logger.info("🔧 Alumni Manager initialized")
     
@@ -76,6 +116,10 @@ class AlumniManager:
             # Normalize and validate the data
             self.alumni_df = self._normalize_alumni_data(self.alumni_df)
             
+            # Pre-encode profiles for vectorized matching
+            if not self.alumni_df.empty:
+                self._build_match_index()
+            
             return self.alumni_df
             
         except Exception as e:
@@ -152,6 +196,44 @@ class AlumniManager:
         profile_string = f"{row.get('skills', '')}{row.get('stream', '')}{row.get('college_tier', '')}{row.get('year', 2024)}"
         return hashlib.md5(profile_string.encode()).hexdigest()[:12]
     
+    def _build_match_index(self):
+        """
+        Pre-encode alumni profiles into arrays for vectorized similarity matching.
+        
+        Skills are interned to shared vocabulary ids and stored CSR-style
+        (indptr/indices), streams are encoded against their unique values and
+        tiers as integers.
+        """
+        df = self.alumni_df
+        vocab = get_skill_vocabulary()
+        encoded = [vocab.encode_text(skills_str) for skills_str in df['skills'].astype(str)]
+        
+        indptr = np.zeros(len(encoded) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(ids) for ids in encoded])
+        self._skill_indices = np.concatenate(encoded) if encoded else np.zeros(0, dtype=np.int32)
+        self._skill_counts = np.diff(indptr)
+        self._skill_rows = np.repeat(np.arange(len(df)), self._skill_counts)
+        
+        streams = df['stream'].astype(str).str.lower()
+        stream_codes, self._unique_streams = pd.factorize(streams)
+        self._stream_codes = stream_codes
+        
+        self._tier_nums = df['college_tier'].map(TIER_MAP).fillna(2).to_numpy(dtype=np.int64)
+        
+        # Output records are fixed per alumni, so build them once
+        self._alumni_records = [
+            {
+                'title': row.title,
+                'company_name': row.company_name,
+                'outcome': row.outcome,
+                'testimonial': row.testimonial,
+                'year': int(row.year)
+            }
+            for row in df[['title', 'company_name', 'outcome', 'testimonial', 'year']].itertuples(index=False)
+        ]
+        
+        self._index_source = df
+    
     def similar_alumni(self, student_features: Dict[str, Any], max_results: int = 3) -> List[Dict[str, Any]]:
         """
         Find similar alumni stories based on student profile.
@@ -167,43 +249,78 @@ class AlumniManager:
             logger.warning("⚠️  No alumni data available")
             return []
         
-        student_skills = set(str(student_features.get('skills', '')).lower().split(','))
-        student_skills = {s.strip() for s in student_skills if s.strip()}
+        if self._index_source is not self.alumni_df:
+            self._build_match_index()
+        
+        student_skills = set(get_skill_vocabulary().split(student_features.get('skills', '')))
         student_stream = student_features.get('stream', '').lower()
         student_tier = student_features.get('college_tier', 'Tier-2')
         
-        logger.info(f"🔍 Finding similar alumni for: {student_stream} student with {len(student_skills)} skills")
+        logger.info("🔍 Finding similar alumni for: %s student with %d skills", student_stream, len(student_skills))
         
-        similarities = []
+        similarity = self._similarity_scores(student_skills, student_stream, student_tier)
         
-        for _, alumni in self.alumni_df.iterrows():
-            # Calculate similarity score
-            similarity = self._calculate_similarity(
-                student_skills, student_stream, student_tier, alumni
-            )
-            
-            if similarity > 0.1:  # Minimum similarity threshold
-                alumni_dict = {
-                    'title': alumni['title'],
-                    'company_name': alumni['company_name'],
-                    'outcome': alumni['outcome'],
-                    'testimonial': alumni['testimonial'],
-                    'year': int(alumni['year']),
-                    'similarity_score': similarity
-                }
-                similarities.append(alumni_dict)
-        
-        # Sort by similarity and return top results
-        similarities.sort(key=lambda x: x['similarity_score'], reverse=True)
-        results = similarities[:max_results]
-        
-        # Remove similarity score from final results (internal use only)
-        for result in results:
-            result.pop('similarity_score', None)
-        
-        logger.info(f"✅ Found {len(results)} similar alumni stories")
+        # Minimum similarity threshold
+        candidates = np.flatnonzero(similarity > 0.1)
+        
+        if len(candidates) > max_results > 0:
+            # Keep everything tied with the k-th best so the stable order below is exact
+            kth = np.partition(similarity[candidates], len(candidates) - max_results)[len(candidates) - max_results]
+            candidates = candidates[similarity[candidates] >= kth]
+        
+        # Sort by similarity (descending, stable) and return top results
+        order = np.lexsort((candidates, -similarity[candidates]))
+        results = [dict(self._alumni_records[i]) for i in candidates[order][:max_results]]
+        
+        logger.info("✅ Found %d similar alumni stories", len(results))
         return results
     
+    def _similarity_scores(self, student_skills: Set[str], student_stream: str, 
+                           student_tier: str) -> np.ndarray:
+        """
+        Calculate similarity between a student and every alumni profile at once.
+        
+        Args:
+            student_skills: Set of student skills
+            student_stream: Student's academic stream
+            student_tier: Student's college tier
+            
+        Returns:
+            Array of similarity scores (0-1) aligned with alumni_df rows
+        """
+        n_alumni = len(self._skill_counts)
+        score = np.zeros(n_alumni, dtype=np.float64)
+        
+        # Skills similarity (Jaccard index)
+        if student_skills:
+            vocab = get_skill_vocabulary()
+            known_ids = [i for i in (vocab.lookup(s) for s in student_skills) if i >= 0]
+            if known_ids:
+                hits = np.isin(self._skill_indices, known_ids)
+                intersection = np.bincount(self._skill_rows[hits], minlength=n_alumni)
+            else:
+                intersection = np.zeros(n_alumni, dtype=np.int64)
+            union = len(student_skills) + self._skill_counts - intersection
+            has_skills = self._skill_counts > 0
+            skills_similarity = np.divide(
+                intersection, union, out=np.zeros(n_alumni, dtype=np.float64), where=has_skills
+            )
+            score += skills_similarity * 0.6  # 60% weight for skills
+        
+        # Stream similarity (evaluated once per distinct stream)
+        if student_stream:
+            stream_match = np.array([
+                bool(stream) and (student_stream in stream or stream in student_stream)
+                for stream in self._unique_streams
+            ], dtype=bool)
+            score += np.where(stream_match[self._stream_codes], 0.3, 0.0)  # 30% weight for stream match
+        
+        # College tier similarity (±1 tier gets partial credit)
+        tier_diff = np.abs(self._tier_nums - TIER_MAP.get(student_tier, 2))
+        score += np.select([tier_diff == 0, tier_diff == 1], [0.1, 0.05], 0.0)
+        
+        return np.minimum(1.0, score)
+    
     def _calculate_similarity(self, student_skills: Set[str], student_stream: str, 
                             student_tier: str, alumni: pd.Series) -> float:
         """
@@ -221,8 +338,7 @@ class AlumniManager:
         score = 0.0
         
         # Skills similarity (Jaccard index)
-        alumni_skills = set(str(alumni['skills']).lower().split(','))
-        alumni_skills = {s.strip() for s in alumni_skills if s.strip()}
+        alumni_skills = set(get_skill_vocabulary().split(alumni['skills']))
         
         if student_skills and alumni_skills:
             intersection = student_skills.intersection(alumni_skills)
@@ -237,10 +353,8 @@ class AlumniManager:
                 score += 0.3  # 30% weight for stream match
         
         # College tier similarity (±1 tier gets partial credit)
-        alumni_tier = alumni['college_tier']
-        tier_map = {'Tier-1': 1, 'Tier-2': 2, 'Tier-3': 3}
-        student_tier_num = tier_map.get(student_tier, 2)
-        alumni_tier_num = tier_map.get(alumni_tier, 2)
+        student_tier_num = TIER_MAP.get(student_tier, 2)
+        alumni_tier_num = TIER_MAP.get(alumni['college_tier'], 2)
         
         tier_diff = abs(student_tier_num - alumni_tier_num)
         if tier_diff == 0:
@@ -260,22 +374,36 @@ class AlumniManager:
         if self.alumni_df is None or self.alumni_df.empty:
             return {}
         
-        stats = {
-            'total_stories': len(self.alumni_df),
-            'unique_companies': self.alumni_df['company_name'].nunique(),
-            'outcome_distribution': self.alumni_df['outcome'].value_counts().to_dict(),
-            'stream_distribution': self.alumni_df['stream'].value_counts().to_dict(),
-            'tier_distribution': self.alumni_df['college_tier'].value_counts().to_dict(),
-            'year_distribution': self.alumni_df['year'].value_counts().to_dict(),
-            'avg_testimonial_length': float(self.alumni_df['testimonial'].str.len().mean()),
-            'companies_with_multiple_stories': len(
-                self.alumni_df.groupby('company_name').size()[
-                    self.alumni_df.groupby('company_name').size() > 1
-                ]
-            )
-        }
+        return self._statistics.get(self.alumni_df)
+    
+    @property
+    def statistics_version(self) -> int:
+        """Version of the cached summary statistics (changes whenever they do)."""
+        return self._statistics.version
+    
+    def add_alumni(self, rows: pd.DataFrame) -> int:
+        """
+        Append alumni stories.
+        
+        The summary statistics are updated from the new rows only; the match
+        index is rebuilt on the next similarity query.
+        
+        Args:
+            rows: Raw alumni rows (same columns as the CSV)
+            
+        Returns:
+            int: Number of stories added
+        """
+        rows = self._normalize_alumni_data(rows.copy())
+        if rows.empty:
+            return 0
+        
+        alumni_df, _, rows = upsert_rows(self.alumni_df, rows)
+        self._statistics.update(self.alumni_df, alumni_df, None, rows)
+        self.alumni_df = alumni_df
         
-        return stats
+        logger.info(f"🔄 Added {len(rows)} alumni stories")
+        return len(rows)
     
     def _create_sample_alumni_data(self) -> pd.DataFrame:
         """
@@ -9,6 +9,8 @@ Key Features:
 - Load application statistics from CSV
 - Normalize and validate statistics data
 - Compute derived metrics like selection ratio and demand pressure
+  (whole-column NumPy expressions)
+- Compact float32 market features aligned with any internship id order
 - Integrate with recommendation pipeline
 
 Author: Senior ML Engineer
@@ -23,10 +25,106 @@ from typing import Dict, List, Optional, Any
 import logging
 import warnings
 
+try:
+    from .catalog_stats import CachedStats, StatsSpec, column, upsert_rows
+except ImportError:
+    # Fallback for direct execution
+    from catalog_stats import CachedStats, StatsSpec, column, upsert_rows
+
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
 
+# Market feature columns exported by ApplicationStatsLoader.aligned_features
+MARKET_FEATURE_COLUMNS = ('applicants_total', 'positions_available', 'selection_ratio', 'demand_pressure')
+
+
+def selection_ratios(applicants_total: np.ndarray,
+                     applicants_selected: np.ndarray,
+                     historical_rate: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Vectorized selection ratio (see ApplicationStatsLoader.compute_selection_ratio).
+    
+    A valid historical rate (0.0 to 1.0) wins; otherwise selected / total,
+    and 0.0 when there are no applicants.
+    
+    Args:
+        applicants_total: Applicants per internship
+        applicants_selected: Selected applicants per internship
+        historical_rate: Optional historical selection rates (NaN when unknown)
+        
+    Returns:
+        np.ndarray: float64 selection ratios
+    """
+    total = np.asarray(applicants_total, dtype=np.float64)
+    selected = np.asarray(applicants_selected, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = np.where(total > 0, selected / total, 0.0)
+    
+    if historical_rate is not None:
+        historical = np.asarray(historical_rate, dtype=np.float64)
+        valid = (historical >= 0.0) & (historical <= 1.0)  # NaN compares False
+        ratios = np.where(valid, historical, ratios)
+    return ratios
+
+
+def demand_pressures(applicants_total: np.ndarray, positions_available: np.ndarray) -> np.ndarray:
+    """
+    Vectorized demand pressure (see ApplicationStatsLoader.compute_demand_pressure).
+    
+    Zero positions give inf when there are applicants and 0.0 otherwise.
+    
+    Args:
+        applicants_total: Applicants per internship
+        positions_available: Open positions per internship
+        
+    Returns:
+        np.ndarray: float64 applicants per position
+    """
+    total = np.asarray(applicants_total, dtype=np.float64)
+    positions = np.asarray(positions_available, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pressure = total / positions
+    no_positions = positions == 0
+    pressure[no_positions] = np.where(total[no_positions] > 0, np.inf, 0.0)
+    return pressure
+
+
+def _application_summary(agg) -> Dict[str, Any]:
+    """Build the application statistics summary from its aggregates."""
+    return {
+        'total_internships': agg.rows,
+        'active_internships': agg.flag('active'),
+        'inactive_internships': agg.flag('inactive'),
+        'total_applicants': int(agg.total('applicants_total')),
+        'total_positions': int(agg.total('positions_available')),
+        'total_selected': int(agg.total('applicants_selected')),
+        'avg_selection_ratio': agg.mean('selection_ratio'),
+        'avg_demand_pressure': agg.mean('demand_pressure'),
+        'high_demand_internships': agg.flag('high_demand'),
+        'low_competition_internships': agg.flag('low_competition')
+    }
+
+
+APPLICATION_STATS_SPEC = StatsSpec(
+    finalize=_application_summary,
+    sums={
+        'applicants_total': column('applicants_total'),
+        'positions_available': column('positions_available'),
+        'applicants_selected': column('applicants_selected'),
+        'selection_ratio': column('selection_ratio'),
+        # Infinite pressure (applicants but no positions) is left out of the mean
+        'demand_pressure': lambda df: df['demand_pressure'].replace([float('inf')], np.nan)
+    },
+    flags={
+        'active': lambda df: df['positions_available'] > 0,
+        'inactive': lambda df: df['positions_available'] == 0,
+        'high_demand': lambda df: df['demand_pressure'] > 10,
+        'low_competition': lambda df: df['demand_pressure'] < 5
+    }
+)
+
+
 class ApplicationStatsLoader:
     """
     Application statistics loader and processor for PMIS.
@@ -44,6 +142,9 @@ class ApplicationStatsLoader:
         """
         self.data_dir = data_dir
         self.stats_df = None
+        self._statistics = CachedStats(APPLICATION_STATS_SPEC)
+        self._active_mask = None
+        self._aligned = None
         
         logger.info("🔧 Application Stats Loader initialized")
     
@@ -133,17 +234,17 @@ class ApplicationStatsLoader:
         # Ensure applicants_selected <= applicants_total
         df['applicants_selected'] = np.minimum(df['applicants_selected'], df['applicants_total'])
         
-        # Compute selection ratio
-        df['selection_ratio'] = df.apply(self.compute_selection_ratio, axis=1)
-        
-        # Compute demand pressure
-        df['demand_pressure'] = df.apply(self.compute_demand_pressure, axis=1)
+        # Derived metrics as whole-column expressions (an out-of-range historical rate is ignored)
+        historical_rate = pd.to_numeric(df['historical_selection_rate'], errors='coerce')
+        df['selection_ratio'] = selection_ratios(
+            df['applicants_total'].to_numpy(), df['applicants_selected'].to_numpy(), historical_rate.to_numpy()
+        )
+        df['demand_pressure'] = demand_pressures(
+            df['applicants_total'].to_numpy(), df['positions_available'].to_numpy()
+        )
         
         # Validate historical_selection_rate
-        if 'historical_selection_rate' in df.columns:
-            df['historical_selection_rate'] = pd.to_numeric(
-                df['historical_selection_rate'], errors='coerce'
-            ).clip(lower=0.0, upper=1.0)
+        df['historical_selection_rate'] = historical_rate.clip(lower=0.0, upper=1.0)
         
         logger.info("✅ Application statistics normalized successfully")
         return df
@@ -212,6 +313,48 @@ class ApplicationStatsLoader:
         
         return stats.iloc[0].to_dict()
     
+    def aligned_features(self, internship_ids: Any) -> Dict[str, np.ndarray]:
+        """
+        Market features aligned with a sequence of internship IDs.
+        
+        Lets scoring read market features by row index (e.g. aligned with the
+        internship feature store) instead of per-internship lookups. The first
+        statistics row wins for duplicated IDs, like get_stats_for_internship.
+        The de-duplicated ID lookup and feature columns are cached until the
+        statistics table is replaced, so a call costs O(len(internship_ids)).
+        
+        Args:
+            internship_ids: Internship IDs defining the row order
+            
+        Returns:
+            Dict with 'has_stats' (bool) and float32 arrays for
+            MARKET_FEATURE_COLUMNS (NaN where an internship has no statistics)
+        """
+        n_rows = len(internship_ids)
+        features = {'has_stats': np.zeros(n_rows, dtype=bool)}
+        for col in MARKET_FEATURE_COLUMNS:
+            features[col] = np.full(n_rows, np.nan, dtype=np.float32)
+        
+        if self.stats_df is None or self.stats_df.empty:
+            return features
+        
+        cached = self._aligned
+        if cached is None or cached[0] is not self.stats_df:
+            stats = self.stats_df.drop_duplicates('internship_id', keep='first')
+            rows = {internship_id: row for row, internship_id in enumerate(stats['internship_id'].astype(str))}
+            columns = {col: stats[col].to_numpy(dtype=np.float64) for col in MARKET_FEATURE_COLUMNS}
+            cached = (self.stats_df, rows, columns)
+            self._aligned = cached
+        _, rows, columns = cached
+        
+        positions = np.fromiter((rows.get(str(internship_id), -1) for internship_id in internship_ids),
+                                dtype=np.intp, count=n_rows)
+        found = positions >= 0
+        features['has_stats'] = found
+        for col in MARKET_FEATURE_COLUMNS:
+            features[col][found] = columns[col][positions[found]]
+        return features
+    
     def get_active_internships_only(self, internship_ids: List[str]) -> List[str]:
         """
         Filter internship IDs to only include those with available positions.
@@ -225,19 +368,48 @@ class ApplicationStatsLoader:
         if self.stats_df is None or self.stats_df.empty:
             return internship_ids
         
-        active_stats = self.stats_df[
-            (self.stats_df['internship_id'].isin(internship_ids)) & 
-            (self.stats_df['positions_available'] > 0)
-        ]
+        flags = self._active_flags(internship_ids)
+        active_ids = [internship_id for internship_id, active in zip(internship_ids, flags) if active]
+        
+        logger.info("📊 Filtered to %d active internships out of %d", len(active_ids), len(internship_ids))
+        return active_ids
+    
+    def active_mask(self, internships_df: pd.DataFrame) -> np.ndarray:
+        """
+        Boolean mask of catalog rows with available positions.
         
-        active_ids = active_stats['internship_id'].tolist()
+        Same rule as get_active_internships_only, aligned with the rows of
+        internships_df and cached until either table is replaced, so callers
+        filter with one mask AND per request.
         
-        # Include internships not in stats (assume they're active)
-        missing_ids = [id for id in internship_ids if id not in self.stats_df['internship_id'].values]
-        active_ids.extend(missing_ids)
+        Args:
+            internships_df: Internship catalog (internship_id column)
+            
+        Returns:
+            np.ndarray: bool mask, True for active internships
+        """
+        cached = self._active_mask
+        if cached is not None and cached[0] is self.stats_df and cached[1] is internships_df:
+            return cached[2]
         
-        logger.info(f"📊 Filtered to {len(active_ids)} active internships out of {len(internship_ids)}")
-        return active_ids
+        if self.stats_df is None or self.stats_df.empty:
+            mask = np.ones(len(internships_df), dtype=bool)
+        else:
+            mask = self._active_flags(internships_df['internship_id'])
+        
+        self._active_mask = (self.stats_df, internships_df, mask)
+        logger.info("📊 Active internship mask: %d of %d internships", int(mask.sum()), len(mask))
+        return mask
+    
+    def _active_flags(self, internship_ids: Any) -> np.ndarray:
+        """
+        Active flag per ID: positions_available > 0 in any statistics row,
+        or no statistics at all (assumed active).
+        """
+        ids = pd.Index(internship_ids)
+        stats_ids = self.stats_df['internship_id']
+        open_ids = stats_ids[self.stats_df['positions_available'] > 0]
+        return np.asarray(~ids.isin(stats_ids) | ids.isin(open_ids), dtype=bool)
     
     def get_statistics_summary(self) -> Dict[str, Any]:
         """
@@ -249,20 +421,35 @@ class ApplicationStatsLoader:
         if self.stats_df is None or self.stats_df.empty:
             return {}
         
-        summary = {
-            'total_internships': len(self.stats_df),
-            'active_internships': len(self.stats_df[self.stats_df['positions_available'] > 0]),
-            'inactive_internships': len(self.stats_df[self.stats_df['positions_available'] == 0]),
-            'total_applicants': self.stats_df['applicants_total'].sum(),
-            'total_positions': self.stats_df['positions_available'].sum(),
-            'total_selected': self.stats_df['applicants_selected'].sum(),
-            'avg_selection_ratio': self.stats_df['selection_ratio'].mean(),
-            'avg_demand_pressure': self.stats_df['demand_pressure'].replace([float('inf')], np.nan).mean(),
-            'high_demand_internships': len(self.stats_df[self.stats_df['demand_pressure'] > 10]),
-            'low_competition_internships': len(self.stats_df[self.stats_df['demand_pressure'] < 5])
-        }
+        return self._statistics.get(self.stats_df)
+    
+    @property
+    def statistics_version(self) -> int:
+        """Version of the cached summary statistics (changes whenever they do)."""
+        return self._statistics.version
+    
+    def update_stats(self, rows: pd.DataFrame) -> int:
+        """
+        Insert or replace statistics rows by internship_id.
+        
+        The summary statistics are updated from the changed rows only.
+        
+        Args:
+            rows: Raw statistics rows (same columns as the CSV)
+            
+        Returns:
+            int: Number of rows written
+        """
+        rows = self.normalize_stats(rows.copy())
+        if rows.empty:
+            return 0
+        
+        stats_df, removed, rows = upsert_rows(self.stats_df, rows, key='internship_id')
+        self._statistics.update(self.stats_df, stats_df, removed, rows)
+        self.stats_df = stats_df
         
-        return summary
+        logger.info(f"🔄 Updated application statistics: {len(rows)} rows ({len(removed)} replaced)")
+        return len(rows)
     
     def _create_sample_stats(self) -> pd.DataFrame:
         """
@@ -0,0 +1,203 @@
+"""
+PMIS Active Candidate Index Module
+=================================
+
+This module keeps the set of internships eligible for ranking as a cached
+index instead of re-filtering the catalog on every request. None of the
+eligibility rules depend on the student:
+
+- positions available (ApplicationStatsLoader.active_mask)
+- is_active flag (when the catalog has one)
+- application deadline not passed (opt-in, see Environment)
+
+The index holds the eligible catalog row positions ordered by
+internship_id, the matching DataFrame slice (materialized once) and
+memoized per-candidate-set lookups such as rows in the feature store. It is
+rebuilt only when the catalog or the statistics table is replaced, or when
+the day changes.
+
+Key Features:
+- One eligibility pass per data version and day
+- Candidate rows ordered by internship_id (deterministic tie order)
+- Memoized component row lookups (feature store, success block, fusion)
+- Vectorized deadline and is_active checks
+
+Environment:
+- ENFORCE_APPLICATION_DEADLINES: Drop internships whose application_deadline
+  has passed (default false); a deadline stays open through its own day
+
+Author: Senior ML + Platform Engineer
+Date: September 24, 2025
+"""
+
+import os
+import logging
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# is_active values that mark an internship closed (anything else, including missing, is active)
+_INACTIVE_VALUES = ['false', '0', 'no']
+
+
+def enforce_deadlines() -> bool:
+    """Whether expired application deadlines exclude internships (ENFORCE_APPLICATION_DEADLINES)."""
+    return os.getenv("ENFORCE_APPLICATION_DEADLINES", "false").strip().lower() in ("1", "true", "yes")
+
+
+def deadline_open(internships_df: pd.DataFrame, day: date) -> np.ndarray:
+    """
+    Vectorized deadline check (missing or unparseable deadlines stay open).
+
+    Args:
+        internships_df: Internship DataFrame (application_deadline in YYYY-MM-DD)
+        day: Current day
+
+    Returns:
+        Boolean mask, True where applications are still open on `day`
+    """
+    if 'application_deadline' not in internships_df.columns:
+        return np.ones(len(internships_df), dtype=bool)
+    deadlines = pd.to_datetime(internships_df['application_deadline'], format='%Y-%m-%d', errors='coerce')
+    return (deadlines.isna() | (deadlines >= pd.Timestamp(day))).to_numpy(dtype=bool)
+
+
+def is_active_mask(internships_df: pd.DataFrame) -> np.ndarray:
+    """
+    Vectorized is_active check (only explicit false values close an internship).
+
+    Args:
+        internships_df: Internship DataFrame
+
+    Returns:
+        Boolean mask, True for active internships
+    """
+    if 'is_active' not in internships_df.columns:
+        return np.ones(len(internships_df), dtype=bool)
+    values = internships_df['is_active'].astype(str).str.strip().str.lower()
+    return ~values.isin(_INACTIVE_VALUES).to_numpy(dtype=bool)
+
+
+class ActiveCandidateIndex:
+    """
+    Eligible internships of one catalog version on one day.
+
+    Everything here is shared between requests; callers must not mutate
+    `internships` or memoized values.
+    """
+
+    def __init__(self,
+                 internships_df: pd.DataFrame,
+                 stats_df: Optional[pd.DataFrame],
+                 positions_mask: np.ndarray,
+                 day: date,
+                 check_deadlines: bool = False):
+        """
+        Build the candidate index.
+
+        Args:
+            internships_df: Internship catalog
+            stats_df: Application statistics table the positions mask came from
+            positions_mask: Catalog-aligned mask of internships with positions available
+            day: Day the deadlines are checked against
+            check_deadlines: Drop internships with an expired application deadline
+        """
+        self.source = internships_df
+        self.stats_source = stats_df
+        self.day = day
+        self.check_deadlines = check_deadlines
+
+        mask = np.asarray(positions_mask, dtype=bool) & is_active_mask(internships_df)
+        if check_deadlines:
+            mask &= deadline_open(internships_df, day)
+
+        # Secondary sort key for deterministic ordering of tied scores
+        rows = np.flatnonzero(mask)
+        ids = internships_df['internship_id'].to_numpy()[rows]
+        if len(ids) > 1 and not (ids[:-1] <= ids[1:]).all():
+            rows = rows[np.argsort(ids, kind='stable')]
+
+        self.rows = rows
+        self.internships = internships_df.iloc[rows]
+        self._memo: Dict[Hashable, Any] = {}
+
+        logger.info(f"✅ Built active candidate index: {len(rows)} of {len(internships_df)} internships ({day})")
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def is_current(self, internships_df: pd.DataFrame, stats_df: Optional[pd.DataFrame],
+                   day: date, check_deadlines: bool) -> bool:
+        """Whether the index was built from these tables, on this day, with these rules."""
+        return (self.source is internships_df and self.stats_source is stats_df
+                and self.day == day and self.check_deadlines == check_deadlines)
+
+    def memoize(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the memoized value for key, computing it on first use.
+
+        Args:
+            key: Memo key
+            compute: Zero-argument function producing the value
+
+        Returns:
+            Memoized value
+        """
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = compute()
+            self._memo[key] = value
+            return value
+
+    def rows_in(self, component: Any) -> np.ndarray:
+        """
+        Candidate rows in a catalog-aligned component (memoized per component).
+
+        Args:
+            component: Object with rows_for(internship_ids), e.g. the feature store
+
+        Returns:
+            Row positions in the component (-1 for unknown ids)
+        """
+        return self.memoize(
+            ('rows', component),
+            lambda: component.rows_for(self.internships['internship_id'].tolist())
+        )
+
+
+if __name__ == "__main__":
+    # Demo the candidate index against per-request filtering
+    import time
+
+    print("🚀 PMIS Active Candidate Index Demo")
+    print("=" * 50)
+
+    rng = np.random.default_rng(7)
+    n = 20000
+    catalog = pd.DataFrame({
+        'internship_id': [f"INT_{i:05d}" for i in rng.permutation(n)],
+        'is_active': rng.random(n) > 0.05,
+        'application_deadline': pd.Timestamp('2025-09-01') + pd.to_timedelta(rng.integers(0, 60, n), unit='D'),
+    })
+    catalog['application_deadline'] = catalog['application_deadline'].dt.strftime('%Y-%m-%d')
+    positions = rng.random(n) > 0.1
+
+    start = time.perf_counter()
+    index = ActiveCandidateIndex(catalog, None, positions, date(2025, 9, 24), check_deadlines=True)
+    print(f"⏱️  Built index in {(time.perf_counter() - start) * 1000:.1f} ms: {len(index)} candidates")
+
+    start = time.perf_counter()
+    for _ in range(100):
+        index.is_current(catalog, None, date(2025, 9, 24), True)
+        candidates = index.internships
+    print(f"⏱️  Cached lookup: {(time.perf_counter() - start) * 10:.4f} ms per request")
+
+    expected = catalog[positions & catalog['is_active']
+                       & (pd.to_datetime(catalog['application_deadline']) >= pd.Timestamp('2025-09-24'))]
+    assert list(candidates['internship_id']) == sorted(expected['internship_id'])
+    print("✅ Candidates match DataFrame filtering")
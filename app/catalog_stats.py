@@ -0,0 +1,266 @@
+"""
+PMIS Catalog Statistics Module
+=============================
+
+This module keeps the summary statistics of the loaded datasets
+(internships, application statistics, interview metadata, alumni) as
+decomposable aggregates: row counts, per-column value counts, sums with
+non-null counts and predicate counts. Every summary the loaders expose is
+derived from these, so it is computed once per data version and served
+from cache afterwards.
+
+A data version is the DataFrame object a loader currently holds: loading
+replaces the object and triggers one full pass on the next read. Row
+changes applied through `CachedStats.update` (see `upsert_rows`) subtract
+the removed rows and add the new ones instead of rescanning the table.
+
+Key Features:
+- One pass per data version, cached summaries afterwards
+- Incremental updates from removed/added rows (upserts by key or appends)
+- Value counts, nunique, sums, means and predicate counts
+- Version counter for callers caching derived output (e.g. /stats)
+
+Author: Senior ML + Platform Engineer
+Date: September 24, 2025
+"""
+
+import threading
+import logging
+from collections import Counter
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# A column extractor returns a Series over the rows, or None when the column is absent
+Extractor = Callable[[pd.DataFrame], Optional[pd.Series]]
+
+
+def column(name: str) -> Extractor:
+    """Extractor for a plain column (None when the column is absent)."""
+    return lambda df: df[name] if name in df.columns else None
+
+
+def upsert_rows(df: Optional[pd.DataFrame], rows: pd.DataFrame,
+                key: Optional[str] = None) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Insert rows into a table, replacing existing rows with the same key.
+
+    Args:
+        df: Current table (None or empty for a new table)
+        rows: Normalized rows to insert (the last one wins per key)
+        key: Key column; None appends without replacing
+
+    Returns:
+        Tuple of (new table, removed rows, inserted rows)
+    """
+    if key is not None:
+        rows = rows.drop_duplicates(key, keep='last')
+    if df is None or df.empty:
+        return rows.reset_index(drop=True), rows.iloc[:0], rows
+    if key is None:
+        return pd.concat([df, rows], ignore_index=True), df.iloc[:0], rows
+    replaced = df[key].isin(rows[key])
+    return pd.concat([df[~replaced], rows], ignore_index=True), df[replaced], rows
+
+
+class StatsSpec:
+    """
+    Aggregates to maintain for a dataset and how to turn them into a summary.
+
+    - counts: name -> extractor; value counts of the non-null values
+    - sums: name -> extractor; sum and count of the non-null numeric values
+    - flags: name -> extractor of a boolean Series; number of True rows
+    - finalize: builds the summary dict from the Aggregates
+    """
+
+    def __init__(self,
+                 finalize: Callable[['Aggregates'], Dict[str, Any]],
+                 counts: Optional[Dict[str, Extractor]] = None,
+                 sums: Optional[Dict[str, Extractor]] = None,
+                 flags: Optional[Dict[str, Extractor]] = None):
+        self.finalize = finalize
+        self.counts = counts or {}
+        self.sums = sums or {}
+        self.flags = flags or {}
+
+
+class Aggregates:
+    """Decomposable aggregates of one dataset (rows can be added and removed)."""
+
+    def __init__(self, spec: StatsSpec):
+        self.spec = spec
+        self.rows = 0
+        self.absent = set()
+        self.counts = {name: Counter() for name in spec.counts}
+        self.sums = {name: [0.0, 0] for name in spec.sums}
+        self.flags = {name: 0 for name in spec.flags}
+
+    def apply(self, df: pd.DataFrame, sign: int = 1):
+        """
+        Add (sign=1) or remove (sign=-1) rows.
+
+        Args:
+            df: Rows to add or remove
+            sign: +1 to add, -1 to remove
+        """
+        if df is None or df.empty:
+            return
+        self.rows += sign * len(df)
+
+        for name, extract in self.spec.counts.items():
+            values = extract(df)
+            if values is None:
+                self.absent.add(name)
+                continue
+            counter = self.counts[name]
+            for value, count in values.dropna().value_counts(sort=False).items():
+                value = value.item() if isinstance(value, np.generic) else value
+                counter[value] += sign * int(count)
+                if counter[value] <= 0:
+                    del counter[value]
+
+        for name, extract in self.spec.sums.items():
+            values = extract(df)
+            if values is None:
+                self.absent.add(name)
+                continue
+            values = pd.to_numeric(values, errors='coerce').dropna()
+            self.sums[name][0] += sign * float(values.sum())
+            self.sums[name][1] += sign * len(values)
+
+        for name, extract in self.spec.flags.items():
+            mask = extract(df)
+            if mask is None:
+                self.absent.add(name)
+                continue
+            self.flags[name] += sign * int(np.count_nonzero(mask.to_numpy(dtype=bool, na_value=False)))
+
+    def present(self, name: str) -> bool:
+        """Whether the aggregate's column exists in the dataset."""
+        return name not in self.absent
+
+    def distribution(self, name: str) -> Dict[Any, int]:
+        """Value counts, most frequent first (like Series.value_counts().to_dict())."""
+        return dict(self.counts[name].most_common())
+
+    def nunique(self, name: str) -> int:
+        """Number of distinct non-null values."""
+        return len(self.counts[name])
+
+    def total(self, name: str) -> float:
+        """Sum of the non-null values."""
+        return self.sums[name][0]
+
+    def mean(self, name: str) -> Optional[float]:
+        """Mean of the non-null values (None when there are none)."""
+        total, count = self.sums[name]
+        return total / count if count else None
+
+    def flag(self, name: str) -> int:
+        """Number of rows where the predicate holds."""
+        return self.flags[name]
+
+
+class CachedStats:
+    """
+    Summary statistics of one dataset, cached per data version.
+
+    Returned summaries are shared; callers must not mutate them.
+    """
+
+    def __init__(self, spec: StatsSpec):
+        self.spec = spec
+        self.version = 0
+        self._source = None
+        self._aggregates = None
+        self._summary = None
+        self._lock = threading.Lock()
+
+    def get(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Get the summary for a dataset, recomputing only for a new data version.
+
+        Args:
+            df: The loader's current DataFrame
+
+        Returns:
+            Summary dict
+        """
+        with self._lock:
+            if df is not self._source:
+                aggregates = Aggregates(self.spec)
+                aggregates.apply(df)
+                self._aggregates = aggregates
+                self._source = df
+                self._summary = None
+                self.version += 1
+            if self._summary is None:
+                self._summary = self.spec.finalize(self._aggregates)
+            return self._summary
+
+    def update(self,
+               previous: Optional[pd.DataFrame],
+               df: pd.DataFrame,
+               removed: Optional[pd.DataFrame],
+               added: Optional[pd.DataFrame]):
+        """
+        Move to a new data version by applying a row change.
+
+        Args:
+            previous: The DataFrame the change was applied to
+            df: The new DataFrame (after the change)
+            removed: Rows no longer present (old values of changed rows)
+            added: Rows added (new values of changed rows)
+        """
+        with self._lock:
+            if self._aggregates is None or self._source is not previous:
+                # Aggregates are not for `previous`; the next read does a full pass
+                return
+            self._aggregates.apply(removed, -1)
+            self._aggregates.apply(added, 1)
+            self._source = df
+            self._summary = None
+            self.version += 1
+
+
+if __name__ == "__main__":
+    # Demo cached and incremental statistics
+    import time
+
+    print("🚀 PMIS Catalog Statistics Demo")
+    print("=" * 50)
+
+    spec = StatsSpec(
+        finalize=lambda agg: {
+            'total': agg.rows,
+            'cities': agg.distribution('city'),
+            'avg_applicants': agg.mean('applicants'),
+            'busy': agg.flag('busy'),
+        },
+        counts={'city': column('city')},
+        sums={'applicants': column('applicants')},
+        flags={'busy': lambda df: df['applicants'] > 100},
+    )
+
+    df = pd.DataFrame({'city': ['pune', 'delhi', 'pune', 'mumbai'] * 25000, 'applicants': np.arange(100000) % 300})
+    stats = CachedStats(spec)
+
+    start = time.perf_counter()
+    summary = stats.get(df)
+    print(f"⏱️  First read: {(time.perf_counter() - start) * 1000:.1f} ms -> {summary}")
+
+    start = time.perf_counter()
+    stats.get(df)
+    print(f"⏱️  Cached read: {(time.perf_counter() - start) * 1e6:.1f} µs")
+
+    changed = df.iloc[:10].assign(applicants=500)
+    new_df = pd.concat([df.iloc[10:], changed])
+    start = time.perf_counter()
+    stats.update(df, new_df, df.iloc[:10], changed)
+    summary = stats.get(new_df)
+    print(f"⏱️  Incremental update: {(time.perf_counter() - start) * 1000:.2f} ms -> {summary}")
+    assert summary == CachedStats(spec).get(new_df)
+    print("✅ Incremental summary matches a full recompute")
@@ -24,6 +24,14 @@ from typing import Dict, List, Set, Optional, Tuple, Any
 from collections import defaultdict
 import warnings
 
+try:
+    from .skill_vocab import get_skill_vocabulary
+    from .metrics import record_cache
+except ImportError:
+    # Fallback for direct execution
+    from skill_vocab import get_skill_vocabulary
+    from metrics import record_cache
+
 warnings.filterwarnings('ignore')
 
 
@@ -227,9 +235,11 @@ class CourseReadinessScorer:
         if self.courses_df is None:
             return
         
+        vocab = get_skill_vocabulary()
         for _, row in self.courses_df.iterrows():
-            skill = row.get('skill', '').lower()
+            skill = vocab.canonical(row.get('skill', ''))
             if skill:
+                vocab.intern(skill)
                 self.skill_course_map[skill].append(row.to_dict())
         
         print(f"✅ Built skill-course mapping for {len(self.skill_course_map)} skills")
@@ -244,12 +254,8 @@ class CourseReadinessScorer:
         Returns:
             Set[str]: Set of parsed strings
         """
-        if pd.isna(text) or text == "":
-            return set()
-        
-        # Split by comma and clean each item
-        items = [item.strip().lower() for item in str(text).split(',')]
-        return set(item for item in items if item)
+        # Split by comma and canonicalize each item through the shared vocabulary
+        return set(get_skill_vocabulary().split(text))
     
     def compute_course_readiness(self, 
                                 student_skills: Set[str], 
@@ -276,13 +282,14 @@ class CourseReadinessScorer:
                 "difficulty_penalty": float in [0,1]
             }
         """
-        # Normalize inputs
-        student_skills = {skill.lower().strip() for skill in student_skills if skill}
-        course_prereq = {prereq.lower().strip() for prereq in course_prereq if prereq}
-        course_keywords = {keyword.lower().strip() for keyword in course_keywords if keyword}
+        # Normalize inputs to canonical vocabulary names
+        canonical = get_skill_vocabulary().canonical
+        student_skills = {canonical(skill) for skill in student_skills if skill}
+        course_prereq = {canonical(prereq) for prereq in course_prereq if prereq}
+        course_keywords = {canonical(keyword) for keyword in course_keywords if keyword}
         
         if student_interests:
-            student_interests = {interest.lower().strip() for interest in student_interests if interest}
+            student_interests = {canonical(interest) for interest in student_interests if interest}
         else:
             student_interests = set()
         
@@ -337,7 +344,8 @@ class CourseReadinessScorer:
                                          student_skills: Set[str], 
                                          missing_skills: List[str], 
                                          student_interests: Optional[Set[str]] = None,
-                                         top_k: int = 3) -> List[Dict[str, Any]]:
+                                         top_k: int = 3,
+                                         readiness_cache: Optional[Dict[Any, Dict[str, float]]] = None) -> List[Dict[str, Any]]:
         """
         Suggest courses for missing skills with readiness scoring.
         
@@ -346,6 +354,8 @@ class CourseReadinessScorer:
             missing_skills: List of skills student needs to develop
             student_interests: Optional set of student interests
             top_k: Maximum number of courses to return
+            readiness_cache: Optional per-request cache of readiness metrics; only
+                valid while student_skills stay the same across calls
             
         Returns:
             List[Dict]: List of course suggestions with readiness metrics
@@ -357,9 +367,11 @@ class CourseReadinessScorer:
         
         # Collect all candidate courses
         candidate_courses = []
+        cache_hits = cache_misses = 0
         
+        vocab = get_skill_vocabulary()
         for missing_skill in missing_skills:
-            skill_lower = missing_skill.lower().strip()
+            skill_lower = vocab.canonical(missing_skill)
             
             # Find courses for this skill
             if skill_lower in self.skill_course_map:
@@ -375,10 +387,21 @@ class CourseReadinessScorer:
                 keywords = self.parse_list(course.get('content_keywords', ''))
                 difficulty = course.get('difficulty', 'Intermediate')
                 
-                # Compute readiness
-                readiness_metrics = self.compute_course_readiness(
-                    student_skills, prereq, keywords, student_interests, difficulty
+                # Compute readiness (reused across calls within the same request)
+                cache_key = (
+                    course.get('skill'), course.get('course_name'), course.get('platform'), difficulty,
+                    frozenset(student_interests) if student_interests else None
                 )
+                if readiness_cache is not None and cache_key in readiness_cache:
+                    readiness_metrics = readiness_cache[cache_key]
+                    cache_hits += 1
+                else:
+                    readiness_metrics = self.compute_course_readiness(
+                        student_skills, prereq, keywords, student_interests, difficulty
+                    )
+                    if readiness_cache is not None:
+                        readiness_cache[cache_key] = readiness_metrics
+                        cache_misses += 1
                 
                 # Apply gate: reject if prereq_coverage < 0.5
                 if readiness_metrics['prereq_coverage'] < 0.5:
@@ -401,6 +424,9 @@ class CourseReadinessScorer:
                 
                 candidate_courses.append(course_suggestion)
         
+        if readiness_cache is not None:
+            record_cache("course_readiness", hits=cache_hits, misses=cache_misses)
+        
         # Sort by readiness score (desc) then success boost (desc)
         candidate_courses.sort(
             key=lambda x: (x['readiness_score'], x['expected_success_boost']), 
@@ -545,11 +571,7 @@ def parse_list(text: str) -> Set[str]:
     Returns:
         Set[str]: Set of parsed strings
     """
-    if pd.isna(text) or text == "":
-        return set()
-    
-    items = [item.strip().lower() for item in str(text).split(',')]
-    return set(item for item in items if item)
+    return set(get_skill_vocabulary().split(text))
 
 
 def compute_course_readiness(student_skills: Set[str],
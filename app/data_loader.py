@@ -16,8 +16,58 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any
 import logging
 
+try:
+    from .fairness import get_fairness_reranker
+    from .search_index import InternshipSearchIndex
+    from .catalog_stats import CachedStats, StatsSpec, column
+except ImportError:
+    # Fallback for direct execution
+    from fairness import get_fairness_reranker
+    from search_index import InternshipSearchIndex
+    from catalog_stats import CachedStats, StatsSpec, column
+
 logger = logging.getLogger(__name__)
 
+
+def _employee_count_flag(predicate):
+    """Company-size predicate over employee_count (absent column -> None)."""
+    return lambda df: predicate(df['employee_count']) if 'employee_count' in df.columns else None
+
+
+def _company_summary(agg) -> Dict[str, Any]:
+    """Build the company statistics summary from its aggregates."""
+    has_employees = agg.present('employee_count')
+    return {
+        'total_internships': agg.rows,
+        'active_internships': agg.flag('active'),
+        'urgent_internships': agg.flag('urgent'),
+        'expired_internships': agg.rows - agg.flag('active'),
+        'unique_companies': agg.nunique('company'),
+        'avg_employee_count': agg.mean('employee_count') if has_employees else 0,
+        'company_size_distribution': {
+            'startups (<50)': agg.flag('startup') if has_employees else 0,
+            'small (50-500)': agg.flag('small') if has_employees else 0,
+            'large (>500)': agg.flag('large') if has_employees else 0
+        },
+        'industry_distribution': agg.distribution('industry') if agg.present('industry') else {},
+        'location_distribution': agg.distribution('location')
+    }
+
+
+COMPANY_STATS_SPEC = StatsSpec(
+    finalize=_company_summary,
+    counts={'company': column('company'), 'industry': column('industry'), 'location': column('location')},
+    sums={'employee_count': column('employee_count')},
+    flags={
+        'active': lambda df: df['is_accepting_applications'] == True,
+        'urgent': lambda df: df['urgent'] == True,
+        'startup': _employee_count_flag(lambda e: e < 50),
+        'small': _employee_count_flag(lambda e: (e >= 50) & (e <= 500)),
+        'large': _employee_count_flag(lambda e: e > 500)
+    }
+)
+
+
 class EnhancedDataLoader:
     """
     Enhanced data loader for PMIS with real-world metadata support.
@@ -40,6 +90,8 @@ class EnhancedDataLoader:
         self.internships_df = None
         self.company_metadata_df = None
         self.reference_date = datetime.now()
+        self._search_index = None
+        self._statistics = CachedStats(COMPANY_STATS_SPEC)
         
         logger.info("🔧 Enhanced Data Loader initialized")
     
@@ -187,8 +239,10 @@ class EnhancedDataLoader:
         else:
             self.internships_df['employability_boost'] = 1.0
         
-        # Calculate fairness score (placeholder - can be enhanced)
-        self.internships_df['fairness_score'] = 0.8  # Default fairness score
+        # Calculate fairness score and protected-group exposure from historical recommendations
+        self.internships_df = get_fairness_reranker().annotate_internships(
+            self.internships_df, self.data_dir
+        )
         
         logger.info("✅ Derived fields calculated successfully")
     
@@ -315,29 +369,22 @@ class EnhancedDataLoader:
         """
         Get statistics about companies and internships.
         
+        Computed once per loaded table and cached (see app.catalog_stats). The
+        catalog changes only by reloading, since the engine's precomputed
+        internship structures are built from it.
+        
         Returns:
             Dict with statistics
         """
         if self.internships_df is None:
             return {}
         
-        stats = {
-            'total_internships': len(self.internships_df),
-            'active_internships': len(self.get_active_internships()),
-            'urgent_internships': len(self.get_urgent_internships()),
-            'expired_internships': len(self.internships_df) - len(self.get_active_internships()),
-            'unique_companies': self.internships_df['company'].nunique(),
-            'avg_employee_count': self.internships_df['employee_count'].mean() if 'employee_count' in self.internships_df.columns else 0,
-            'company_size_distribution': {
-                'startups (<50)': len(self.internships_df[self.internships_df['employee_count'] < 50]) if 'employee_count' in self.internships_df.columns else 0,
-                'small (50-500)': len(self.internships_df[(self.internships_df['employee_count'] >= 50) & (self.internships_df['employee_count'] <= 500)]) if 'employee_count' in self.internships_df.columns else 0,
-                'large (>500)': len(self.internships_df[self.internships_df['employee_count'] > 500]) if 'employee_count' in self.internships_df.columns else 0
-            },
-            'industry_distribution': self.internships_df['industry'].value_counts().to_dict() if 'industry' in self.internships_df.columns else {},
-            'location_distribution': self.internships_df['location'].value_counts().to_dict()
-        }
-        
-        return stats
+        return self._statistics.get(self.internships_df)
+    
+    @property
+    def statistics_version(self) -> int:
+        """Version of the cached summary statistics (changes whenever they do)."""
+        return self._statistics.version
     
     def filter_internships_by_criteria(self, 
                                      min_stipend: float = 0,
@@ -364,42 +411,30 @@ class EnhancedDataLoader:
             logger.error("❌ No internship data loaded")
             return pd.DataFrame()
         
-        filtered_df = self.internships_df.copy()
-        
-        # Filter by stipend
-        filtered_df = filtered_df[
-            (filtered_df['stipend'] >= min_stipend) & 
-            (filtered_df['stipend'] <= max_stipend)
-        ]
-        
-        # Filter by location
-        if locations:
-            filtered_df = filtered_df[filtered_df['location'].isin(locations)]
-        
-        # Filter by domain
-        if domains:
-            filtered_df = filtered_df[filtered_df['domain'].isin(domains)]
-        
-        # Filter by company size
-        if company_sizes:
-            size_conditions = []
-            for size in company_sizes:
-                if size == 'startup':
-                    size_conditions.append(filtered_df['employee_count'] < 50)
-                elif size == 'small':
-                    size_conditions.append((filtered_df['employee_count'] >= 50) & (filtered_df['employee_count'] <= 500))
-                elif size == 'large':
-                    size_conditions.append(filtered_df['employee_count'] > 500)
-            
-            if size_conditions:
-                filtered_df = filtered_df[pd.concat(size_conditions, axis=1).any(axis=1)]
-        
-        # Filter by urgent
-        if urgent_only:
-            filtered_df = filtered_df[filtered_df['urgent'] == True]
+        # Intersect prebuilt bitmap indexes; only the matching rows are materialized
+        rows = self.search_index().query(
+            min_stipend=min_stipend,
+            max_stipend=max_stipend,
+            locations=locations,
+            domains=domains,
+            company_sizes=company_sizes,
+            urgent_only=urgent_only
+        )
+        filtered_df = self.internships_df.iloc[rows]
         
         logger.info(f"📊 Filtered internships: {len(filtered_df)} out of {len(self.internships_df)}")
         return filtered_df
+    
+    def search_index(self) -> InternshipSearchIndex:
+        """
+        Get the search index for the loaded internships (rebuilt when the table is replaced).
+        
+        Returns:
+            InternshipSearchIndex over internships_df
+        """
+        if self._search_index is None or self._search_index.source is not self.internships_df:
+            self._search_index = InternshipSearchIndex(self.internships_df)
+        return self._search_index
 
 
 def load_enhanced_internships(data_dir: str = "data/") -> pd.DataFrame:
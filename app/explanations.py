@@ -0,0 +1,360 @@
+"""
+PMIS Explanation Templates Module
+================================
+
+This module drives recommendation explanations from compiled template
+tables instead of per-recommendation branching. Every sentence the API can
+emit is a template with an id; each explainer is a table that maps a tuple
+of bucketed inputs (skill-match band, CGPA band, market band, missing-skill
+band, ...) to the ordered template ids to emit. All band combinations are
+compiled once at import, so explaining a recommendation is one dict lookup
+plus formatting of the few templates that take parameters. Parameter-free
+sentences are shared string constants.
+
+Batch callers can ask for compact explanations (template id + parameters)
+and render them later with `render_explanations`.
+
+Key Features:
+- Template registry with stable ids
+- Band tables compiled for every band combination
+- Lazy rendering (only for returned recommendations)
+- Compact id + params form for batch payloads
+
+Author: ML Engineer
+Date: September 24, 2025
+"""
+
+import string
+from itertools import product
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Template registry: id -> text. Ids are part of the compact batch format; never reuse one.
+TEMPLATES: Dict[str, str] = {
+    # Fixed engine
+    "skill.excellent": "Excellent skill match ({skill_pct:.0f}%) with internship requirements",
+    "skill.good": "Good skill alignment with {n_skills} relevant skills",
+    "skill.develop": "Opportunity to develop new skills in {domain}",
+    "cgpa.excellent": "Your excellent academic record (CGPA: {cgpa}) makes you a strong candidate",
+    "cgpa.solid": "Your solid academic performance (CGPA: {cgpa}) meets requirements",
+    "cgpa.practical": "Focus on practical skills can compensate for academic scores",
+    "market.low_competition": "Low competition and high selection rate for this position",
+    "market.moderate": "Moderate competition with good selection chances",
+    "market.competitive": "Competitive position - ensure your application stands out",
+    "missing.none": "You meet all skill requirements for this position!",
+    "missing.few": "Only {n_missing} skills to develop for a perfect match",
+
+    # Backup engine reasons
+    "reason.missing.none": "Perfect skill match - all requirements met",
+    "reason.missing.few": "Strong skill match - only {n_missing} skills to develop",
+    "reason.missing.many": "Good potential - {n_missing} skills to develop",
+    "reason.cgpa.excellent": "Excellent CGPA ({cgpa}) highly valued by employers",
+    "reason.cgpa.good": "Good CGPA ({cgpa}) meets company standards",
+    "reason.cgpa.acceptable": "CGPA ({cgpa}) within acceptable range",
+    "reason.stream": "{stream} background is relevant for this role",
+    "reason.tier.top": "Top-tier college background preferred by {company}",
+    "reason.tier.hiring": "Company actively hiring from {college_tier} colleges",
+    "reason.urgent": "🚨 URGENT: Application deadline approaching!",
+
+    # Generic explanations (utils.generate_explanations)
+    "generic.skills": "Strong skill match: {top_skills}",
+    "generic.cgpa.exceptional": "Exceptional CGPA ({cgpa}) significantly increases selection chances",
+    "generic.cgpa.good": "Good CGPA ({cgpa}) meets company standards",
+    "generic.cgpa.acceptable": "CGPA ({cgpa}) is acceptable for this role",
+    "generic.stream": "Your {stream} background aligns well with this role",
+    "generic.tier.1": "Premier college background is highly valued by employers",
+    "generic.tier.2": "Strong college background demonstrates academic capability",
+    "generic.tier.3": "Your potential and skills matter more than college ranking",
+    "generic.tier.other": "Your academic background is suitable",
+    "generic.prob.high": "High success probability indicates excellent fit",
+    "generic.prob.good": "Good success probability suggests strong candidacy",
+    "generic.prob.low": "Consider developing relevant skills to improve chances",
+    "generic.domain.technology": "Tech industry offers excellent growth opportunities",
+    "generic.domain.software": "Software development skills are in high demand",
+    "generic.domain.ai": "AI field is rapidly expanding with great career prospects",
+    "generic.domain.data_science": "Data science expertise is highly sought after",
+    "generic.domain.finance": "Financial sector values analytical and quantitative skills",
+}
+
+
+class ExplanationTemplate:
+    """A compiled template: a constant string, or a format string with named fields."""
+
+    __slots__ = ("id", "text", "fields")
+
+    def __init__(self, template_id: str, text: str):
+        self.id = template_id
+        self.text = text
+        self.fields = tuple(
+            field for _, field, _, _ in string.Formatter().parse(text) if field
+        )
+
+    def render(self, params: Dict[str, Any]) -> str:
+        """Render the template (constant templates skip formatting)."""
+        return self.text.format_map(params) if self.fields else self.text
+
+    def compact(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the id + params form, keeping only the fields this template uses."""
+        return {"id": self.id, "params": {field: params[field] for field in self.fields}}
+
+
+COMPILED_TEMPLATES: Dict[str, ExplanationTemplate] = {
+    template_id: ExplanationTemplate(template_id, text) for template_id, text in TEMPLATES.items()
+}
+
+
+class ExplanationTable:
+    """
+    Maps a tuple of band indices to the templates to emit.
+
+    Each slot lists the template id emitted for each of its bands (None
+    emits nothing). The table is compiled for every band combination, so
+    selection is a single lookup.
+    """
+
+    def __init__(self, slots: Sequence[Sequence[Optional[str]]], limit: int):
+        """
+        Compile the table.
+
+        Args:
+            slots: Per slot, the template id (or None) for each band
+            limit: Maximum number of explanations emitted
+        """
+        self.limit = limit
+        self._table: Dict[Tuple[int, ...], Tuple[ExplanationTemplate, ...]] = {}
+        for key in product(*(range(len(slot)) for slot in slots)):
+            ids = [slot[band] for slot, band in zip(slots, key) if slot[band] is not None]
+            self._table[key] = tuple(COMPILED_TEMPLATES[template_id] for template_id in ids[:limit])
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def select(self, key: Tuple[int, ...]) -> Tuple[ExplanationTemplate, ...]:
+        """Get the templates for a band key."""
+        return self._table[key]
+
+    def explain(self, key: Tuple[int, ...], params: Dict[str, Any], compact: bool = False) -> List[Any]:
+        """
+        Explain one item.
+
+        Args:
+            key: Band indices, one per slot
+            params: Template parameters
+            compact: Return id + params dicts instead of strings
+
+        Returns:
+            List of explanation strings (or compact dicts)
+        """
+        if compact:
+            return [template.compact(params) for template in self._table[key]]
+        return [template.render(params) for template in self._table[key]]
+
+
+def render_explanations(explanations: List[Any]) -> List[str]:
+    """
+    Render compact explanations to strings (strings pass through unchanged).
+
+    Args:
+        explanations: Output of an explainer in compact or string form
+
+    Returns:
+        List of explanation strings
+    """
+    return [
+        COMPILED_TEMPLATES[item["id"]].render(item["params"]) if isinstance(item, dict) else item
+        for item in explanations
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Band functions (comparisons mirror the original branching, including NaN
+# falling through to the lowest band)
+# ---------------------------------------------------------------------------
+
+def _band_above(value: float, high: float, mid: float) -> int:
+    """0 if value > high, 1 if value > mid, else 2."""
+    if value > high:
+        return 0
+    if value > mid:
+        return 1
+    return 2
+
+
+def _band_at_least(value: float, high: float, mid: float) -> int:
+    """0 if value >= high, 1 if value >= mid, else 2."""
+    if value >= high:
+        return 0
+    if value >= mid:
+        return 1
+    return 2
+
+
+def _missing_band(n_missing: int) -> int:
+    """0 if nothing is missing, 1 for one or two skills, else 2."""
+    if n_missing == 0:
+        return 0
+    if n_missing <= 2:
+        return 1
+    return 2
+
+
+# Fixed engine: skill, CGPA, market, missing-skill slots; top 3 emitted
+RECOMMENDATION_TABLE = ExplanationTable([
+    ("skill.excellent", "skill.good", "skill.develop"),
+    ("cgpa.excellent", "cgpa.solid", "cgpa.practical"),
+    ("market.low_competition", "market.moderate", "market.competitive"),
+    ("missing.none", "missing.few", None),
+], limit=3)
+
+
+def recommendation_explanation_key(skill_match_score: float, cgpa: float,
+                                   market_score: float, n_missing: int) -> Tuple[int, int, int, int]:
+    """Get the band key of a recommendation for RECOMMENDATION_TABLE."""
+    return (
+        _band_above(skill_match_score, 0.7, 0.5),
+        _band_at_least(cgpa, 8.5, 7.0),
+        _band_above(market_score, 0.7, 0.5),
+        _missing_band(n_missing)
+    )
+
+
+def explain_recommendation(breakdown: Dict[str, float], cgpa: float, n_skills: int,
+                           domain: str, n_missing: int, compact: bool = False) -> List[Any]:
+    """
+    Explain a fixed-engine recommendation.
+
+    Args:
+        breakdown: Score breakdown (skill_match_score, market_score)
+        cgpa: Student CGPA
+        n_skills: Number of student skills
+        domain: Internship domain
+        n_missing: Number of missing skills
+        compact: Return id + params dicts instead of strings
+
+    Returns:
+        Up to 3 explanations
+    """
+    skill_match = breakdown['skill_match_score']
+    key = recommendation_explanation_key(skill_match, cgpa, breakdown['market_score'], n_missing)
+    params = {
+        "skill_pct": skill_match * 100,
+        "n_skills": n_skills,
+        "domain": domain,
+        "cgpa": cgpa,
+        "n_missing": n_missing
+    }
+    return RECOMMENDATION_TABLE.explain(key, params, compact)
+
+
+# Backup engine reasons: missing-skill, CGPA, stream, tier, urgency slots
+REASON_TABLE = ExplanationTable([
+    ("reason.missing.none", "reason.missing.few", "reason.missing.many"),
+    ("reason.cgpa.excellent", "reason.cgpa.good", "reason.cgpa.acceptable"),
+    ("reason.stream",),
+    ("reason.tier.top", "reason.tier.hiring"),
+    ("reason.urgent", None),
+], limit=5)
+
+
+def explain_reasons(n_missing: int, cgpa: float, stream: str, college_tier: str,
+                    company: str, urgent: bool, compact: bool = False) -> List[Any]:
+    """
+    Generate backup-engine recommendation reasons.
+
+    Args:
+        n_missing: Number of missing skills
+        cgpa: CGPA score
+        stream: Academic stream
+        college_tier: College tier
+        company: Company name
+        urgent: Whether the deadline is urgent
+        compact: Return id + params dicts instead of strings
+
+    Returns:
+        List of reasons
+    """
+    key = (
+        _missing_band(n_missing),
+        _band_at_least(cgpa, 8.5, 7.5),
+        0,
+        0 if college_tier == "Tier-1" else 1,
+        0 if urgent else 1
+    )
+    params = {
+        "n_missing": n_missing,
+        "cgpa": cgpa,
+        "stream": stream,
+        "company": company,
+        "college_tier": college_tier
+    }
+    return REASON_TABLE.explain(key, params, compact)
+
+
+# Generic explanations: skills, CGPA, stream, tier, probability, domain slots; top 4 emitted
+_TIER_BANDS = {"Tier-1": 0, "Tier-2": 1, "Tier-3": 2}
+_DOMAIN_BANDS = {
+    "Technology": 0,
+    "Software": 1,
+    "Artificial Intelligence": 2,
+    "Data Science": 3,
+    "Finance": 4
+}
+
+GENERIC_TABLE = ExplanationTable([
+    ("generic.skills", None),
+    ("generic.cgpa.exceptional", "generic.cgpa.good", "generic.cgpa.acceptable"),
+    ("generic.stream",),
+    ("generic.tier.1", "generic.tier.2", "generic.tier.3", "generic.tier.other"),
+    ("generic.prob.high", "generic.prob.good", "generic.prob.low"),
+    ("generic.domain.technology", "generic.domain.software", "generic.domain.ai",
+     "generic.domain.data_science", "generic.domain.finance", None),
+], limit=4)
+
+
+def explain_generic(student_skills: List[str], cgpa: float, stream: str, college_tier: str,
+                    internship_domain: str, success_prob: float, compact: bool = False) -> List[Any]:
+    """
+    Generate generic recommendation explanations.
+
+    Args:
+        student_skills: Student's skills
+        cgpa: Student's CGPA
+        stream: Academic stream
+        college_tier: College tier
+        internship_domain: Internship domain
+        success_prob: Success probability
+        compact: Return id + params dicts instead of strings
+
+    Returns:
+        Up to 4 explanations
+    """
+    key = (
+        0 if student_skills else 1,
+        _band_at_least(cgpa, 8.5, 7.5),
+        0,
+        _TIER_BANDS.get(college_tier, 3),
+        _band_at_least(success_prob, 0.8, 0.6),
+        _DOMAIN_BANDS.get(internship_domain, 5)
+    )
+    params = {
+        "top_skills": ", ".join(student_skills[:2]) if student_skills else "",
+        "cgpa": cgpa,
+        "stream": stream
+    }
+    return GENERIC_TABLE.explain(key, params, compact)
+
+
+if __name__ == "__main__":
+    # Demo the explanation templates
+    print("🚀 PMIS Explanation Templates Demo")
+    print("=" * 50)
+
+    print(f"📚 {len(TEMPLATES)} templates, "
+          f"{len(RECOMMENDATION_TABLE) + len(REASON_TABLE) + len(GENERIC_TABLE)} compiled band keys")
+
+    breakdown = {"skill_match_score": 0.82, "market_score": 0.6}
+    for line in explain_recommendation(breakdown, 8.7, 5, "Software", 1):
+        print(f"   • {line}")
+
+    compact = explain_recommendation(breakdown, 8.7, 5, "Software", 1, compact=True)
+    print(f"\n📦 Compact: {compact}")
+    print(f"   Rendered: {render_explanations(compact)}")
@@ -0,0 +1,399 @@
+"""
+PMIS Hybrid Score Fusion Module
+==============================
+
+This module fuses the hybrid recommender's signals into the final success
+probability in one vectorized pass over the candidate set. Every signal is
+a score vector aligned with the candidates:
+
+- content_signal: TF-IDF cosine between the student's and the internship's
+  rows of the content-based model (skill-match ratio for students outside
+  the trained matrix)
+- cf_signal: ALS dot product of the student's and the internship's latent
+  factors, clipped to [0, 1] (domain popularity prior for cold starts)
+- fairness_adjustment: small uplift for Tier-2/Tier-3 students
+- demand_adjustment: penalty from ApplicationStatsLoader demand pressure
+- company_signal: company-size uplift from EnhancedDataLoader's
+  employability boost
+
+Internship-side vectors (demand, company, prior, aligned TF-IDF rows and
+item factors) are precomputed when a catalog is bound, so a request only
+computes the student-side products and one weighted sum. The per-item
+`SuccessBreakdown` dict is materialized only for the returned top-K.
+
+Key Features:
+- One weighted, clipped expression over all candidates
+- Configurable signal weights (FUSION_WEIGHTS)
+- Catalog-side signals precomputed once per catalog
+- Lazy per-item breakdowns for the top-K only
+
+Environment:
+- FUSION_WEIGHTS: comma-separated "signal=weight" pairs
+  (default: "base=1.0,content=0.05,cf=0.05,fairness=1.0,company=1.0,demand=1.0")
+
+Author: Senior ML + Platform Engineer
+Date: September 24, 2025
+"""
+
+import os
+import json
+import logging
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models")
+
+DEFAULT_FUSION_WEIGHTS = "base=1.0,content=0.05,cf=0.05,fairness=1.0,company=1.0,demand=1.0"
+
+# Weight name -> breakdown field; demand is subtracted, everything else added
+SIGNAL_FIELDS = {
+    "content": "content_signal",
+    "cf": "cf_signal",
+    "fairness": "fairness_adjustment",
+    "company": "company_signal",
+    "demand": "demand_adjustment",
+}
+
+# Collaborative-filtering prior for students without trained factors
+DOMAIN_POPULARITY = {'ai/ml': 0.9, 'web development': 0.8, 'data science': 0.85, 'mobile apps': 0.7}
+DEFAULT_DOMAIN_POPULARITY = 0.6
+
+FAIRNESS_TIERS = ('Tier-2', 'Tier-3')
+FAIRNESS_UPLIFT = 0.02
+MAX_DEMAND_PENALTY = 0.10
+MAX_COMPANY_UPLIFT = 0.05
+MAX_SUCCESS_PROB = 0.99
+
+
+def parse_fusion_weights(spec: str) -> Dict[str, float]:
+    """
+    Parse a fusion weight spec on top of the defaults.
+
+    Args:
+        spec: Comma-separated "signal=weight" pairs, e.g. "content=0.1,demand=0.5"
+
+    Returns:
+        Dict with a weight for "base" and every signal
+    """
+    weights = {"base": 1.0}
+    weights.update({name: 0.0 for name in SIGNAL_FIELDS})
+    for source in (DEFAULT_FUSION_WEIGHTS, spec):
+        for part in source.split(","):
+            name, sep, weight = part.strip().partition("=")
+            name = name.strip()
+            if not sep or name not in weights:
+                continue
+            try:
+                weights[name] = float(weight)
+            except ValueError:
+                continue
+    return weights
+
+
+def fusion_weights() -> Dict[str, float]:
+    """Get the configured fusion weights (FUSION_WEIGHTS)."""
+    return parse_fusion_weights(os.getenv("FUSION_WEIGHTS", DEFAULT_FUSION_WEIGHTS))
+
+
+def demand_adjustment(demand_pressure: Any) -> np.ndarray:
+    """
+    Demand penalty from applicants per position (log-scaled, capped at 10%).
+
+    Args:
+        demand_pressure: Scalar or array of demand pressures (NaN = unknown)
+
+    Returns:
+        Penalty array of the same shape
+    """
+    pressure = np.asarray(demand_pressure, dtype=np.float64)
+    with np.errstate(invalid='ignore'):
+        penalty = np.minimum(MAX_DEMAND_PENALTY, np.log1p(pressure) / np.log(10) * 0.1)
+        return np.where(pressure > 0, penalty, 0.0)
+
+
+def company_signal(employability_boost: Any) -> np.ndarray:
+    """
+    Additive company-size uplift from the employability boost (capped at 5%).
+
+    Args:
+        employability_boost: Scalar or array of boosts (1.0 = no uplift)
+
+    Returns:
+        Uplift array of the same shape
+    """
+    boost = np.asarray(employability_boost, dtype=np.float64)
+    return np.clip((boost - 1.0) * 0.5, 0.0, MAX_COMPANY_UPLIFT)
+
+
+def fairness_adjustment(college_tier: Optional[str]) -> float:
+    """Diversity uplift for students from Tier-2/Tier-3 colleges."""
+    return FAIRNESS_UPLIFT if college_tier in FAIRNESS_TIERS else 0.0
+
+
+def domain_popularity(domain: Any) -> float:
+    """Collaborative-filtering prior for an internship domain."""
+    return DOMAIN_POPULARITY.get(str(domain or '').lower(), DEFAULT_DOMAIN_POPULARITY)
+
+
+def fuse(base: Any, signals: Dict[str, Any], weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """
+    Fuse base probabilities with signal vectors in one weighted expression.
+
+    Args:
+        base: Base model probabilities
+        signals: Breakdown field -> signal vector (or scalar)
+        weights: Fusion weights (default: FUSION_WEIGHTS)
+
+    Returns:
+        Final success probabilities clipped to [0, 0.99]
+    """
+    w = weights if weights is not None else fusion_weights()
+    final = (
+        w["base"] * np.asarray(base, dtype=np.float64)
+        + w["content"] * signals["content_signal"]
+        + w["cf"] * signals["cf_signal"]
+        + w["fairness"] * signals["fairness_adjustment"]
+        + w["company"] * signals["company_signal"]
+        - w["demand"] * signals["demand_adjustment"]
+    )
+    return np.clip(final, 0.0, MAX_SUCCESS_PROB)
+
+
+class FusionResult:
+    """
+    Fused probabilities for a candidate set, with breakdowns built on demand.
+
+    Only the base vector, the signal vectors and the fused vector are kept;
+    `breakdown` materializes the `SuccessBreakdown` dict for one candidate,
+    so callers pay for it only on the returned top-K.
+    """
+
+    def __init__(self, base: np.ndarray, signals: Dict[str, np.ndarray], final: np.ndarray):
+        self.base = base
+        self.signals = signals
+        self.final = final
+
+    def breakdown(self, pos: int) -> Dict[str, float]:
+        """
+        Materialize the success breakdown of one candidate.
+
+        Args:
+            pos: Candidate position
+
+        Returns:
+            Dict with the base, every signal and the final probability
+        """
+        breakdown = {"base_model_prob": float(self.base[pos])}
+        for field in SIGNAL_FIELDS.values():
+            breakdown[field] = float(self.signals[field][pos])
+        breakdown["final_success_prob"] = float(self.final[pos])
+        return breakdown
+
+
+def load_signal_models(models_dir: str = MODELS_DIR) -> Dict[str, Any]:
+    """
+    Load the content-based (TF-IDF) and collaborative (ALS) model arrays.
+
+    Args:
+        models_dir: Directory with the exported model files
+
+    Returns:
+        Dict with whatever could be loaded (missing models are left out)
+    """
+    models = {}
+
+    try:
+        with open(os.path.join(models_dir, "id_mappings.json")) as f:
+            mappings = json.load(f)
+        student_index = pd.Index(list(mappings["student_to_idx"]))
+        internship_index = pd.Index(list(mappings["internship_to_idx"]))
+        student_rows = np.fromiter(mappings["student_to_idx"].values(), dtype=np.int64)
+        internship_rows = np.fromiter(mappings["internship_to_idx"].values(), dtype=np.int64)
+    except Exception as e:
+        logger.warning(f"⚠️  No id mappings for hybrid signals: {e}")
+        return models
+
+    try:
+        tfidf_students = np.load(os.path.join(models_dir, "tfidf_matrix_students.npy"))
+        tfidf_internships = np.load(os.path.join(models_dir, "tfidf_matrix_internships.npy"))
+        if tfidf_students.shape[1] == tfidf_internships.shape[1]:
+            models["tfidf"] = (student_index, tfidf_students[student_rows],
+                               internship_index, tfidf_internships[internship_rows])
+    except Exception as e:
+        logger.warning(f"⚠️  Content-based model unavailable: {e}")
+
+    try:
+        factors = [np.load(os.path.join(models_dir, name)) for name in ("user_factors.npy", "item_factors.npy")]
+        # implicit's ALS may swap users and items; pick the side whose rows match the students
+        if len(factors[0]) != len(student_index) and len(factors[1]) == len(student_index):
+            factors.reverse()
+        student_factors, internship_factors = factors
+        models["als"] = (student_index, student_factors[student_rows],
+                         internship_index, internship_factors[internship_rows])
+    except Exception as e:
+        logger.warning(f"⚠️  Collaborative filtering model unavailable: {e}")
+
+    return models
+
+
+class HybridFusion:
+    """
+    Per-catalog signal vectors and the fusion stage of the hybrid ranker.
+
+    Rows follow the bound internships table; `signals` takes the rows of the
+    candidates being ranked and returns vectors aligned with them.
+    """
+
+    def __init__(self,
+                 internships_df: pd.DataFrame,
+                 stats_df: Optional[pd.DataFrame] = None,
+                 models: Optional[Dict[str, Any]] = None,
+                 weights: Optional[Dict[str, float]] = None):
+        """
+        Precompute internship-side signals for a catalog.
+
+        Args:
+            internships_df: Internship DataFrame (internship_id, domain, employability_boost)
+            stats_df: Application statistics (internship_id, demand_pressure)
+            models: Output of load_signal_models (default: models/)
+            weights: Fusion weights (default: FUSION_WEIGHTS)
+        """
+        self.weights = weights if weights is not None else fusion_weights()
+        self.internship_ids = internships_df['internship_id'].astype(str).to_numpy()
+        self.row_index = pd.Index(self.internship_ids)
+        n = len(self.internship_ids)
+
+        domains = internships_df['domain'] if 'domain' in internships_df.columns else pd.Series([''] * n)
+        self.domain_prior = np.array([domain_popularity(d) for d in domains], dtype=np.float64)
+
+        if 'employability_boost' in internships_df.columns:
+            boost = internships_df['employability_boost'].astype(float).fillna(1.0).to_numpy()
+        else:
+            boost = np.ones(n)
+        self.company = company_signal(boost)
+
+        pressure = np.full(n, np.nan)
+        if stats_df is not None and not stats_df.empty and 'demand_pressure' in stats_df.columns:
+            per_id = stats_df.drop_duplicates('internship_id').set_index('internship_id')['demand_pressure']
+            pressure = per_id.reindex(self.internship_ids).astype(float).to_numpy()
+        self.demand = demand_adjustment(pressure)
+
+        models = load_signal_models() if models is None else models
+        self.tfidf = self._align(models.get("tfidf"))
+        self.als = self._align(models.get("als"))
+
+        logger.info(
+            f"✅ Built hybrid fusion: {n} internships, "
+            f"tfidf={'on' if self.tfidf else 'off'}, als={'on' if self.als else 'off'}"
+        )
+
+    def _align(self, model: Optional[tuple]) -> Optional[Dict[str, Any]]:
+        """Align a model's internship rows with the catalog (zero rows + mask when unknown)."""
+        if model is None:
+            return None
+        student_index, student_rows, internship_index, internship_rows = model
+        rows = internship_index.get_indexer(self.internship_ids)
+        known = rows >= 0
+        aligned = np.zeros((len(rows), internship_rows.shape[1]), dtype=np.float64)
+        aligned[known] = internship_rows[rows[known]]
+        return {"students": student_index, "student_rows": student_rows,
+                "internships": aligned, "known": known}
+
+    def rows_for(self, internship_ids) -> np.ndarray:
+        """Map internship ids to catalog rows (-1 for unknown ids)."""
+        return self.row_index.get_indexer(list(internship_ids))
+
+    def _student_product(self, model: Optional[Dict[str, Any]], student_id: Any,
+                         rows: np.ndarray, fallback: np.ndarray) -> np.ndarray:
+        """Student-row x internship-rows products, falling back where either side is unknown."""
+        if model is None:
+            return fallback
+        student_row = model["students"].get_indexer([str(student_id)])[0]
+        if student_row < 0:
+            return fallback
+        products = (model["internships"] @ model["student_rows"][student_row])[rows]
+        return np.where(model["known"][rows], products, fallback)
+
+    def signals(self,
+                student_profile: Dict[str, Any],
+                rows: np.ndarray,
+                skill_match: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Compute every signal vector for the candidates.
+
+        Args:
+            student_profile: Student profile (student_id, college_tier)
+            rows: Catalog rows of the candidates
+            skill_match: Matched / required skill ratio per candidate (content fallback)
+
+        Returns:
+            Breakdown field -> vector aligned with rows
+        """
+        student_id = student_profile.get('student_id')
+        if skill_match is None:
+            skill_match = np.zeros(len(rows))
+
+        content = self._student_product(self.tfidf, student_id, rows, np.asarray(skill_match, dtype=np.float64))
+        cf = self._student_product(self.als, student_id, rows, self.domain_prior[rows])
+
+        return {
+            "content_signal": np.clip(content, 0.0, 1.0),
+            "cf_signal": np.clip(cf, 0.0, 1.0),
+            "fairness_adjustment": np.full(len(rows), fairness_adjustment(student_profile.get('college_tier'))),
+            "company_signal": self.company[rows],
+            "demand_adjustment": self.demand[rows],
+        }
+
+    def fuse(self,
+             student_profile: Dict[str, Any],
+             rows: np.ndarray,
+             base: np.ndarray,
+             skill_match: Optional[np.ndarray] = None) -> FusionResult:
+        """
+        Compute the signals and fuse them with the base probabilities.
+
+        Args:
+            student_profile: Student profile (student_id, college_tier)
+            rows: Catalog rows of the candidates
+            base: Base model probabilities aligned with rows
+            skill_match: Matched / required skill ratio per candidate
+
+        Returns:
+            FusionResult (final probabilities in .final)
+        """
+        base = np.asarray(base, dtype=np.float64)
+        signals = self.signals(student_profile, rows, skill_match)
+        return FusionResult(base, signals, fuse(base, signals, self.weights))
+
+
+if __name__ == "__main__":
+    # Demo fusion over a small synthetic catalog
+    import time
+
+    print("🚀 PMIS Hybrid Score Fusion Demo")
+    print("=" * 50)
+
+    catalog = pd.DataFrame({
+        'internship_id': [f"INT_{i:04d}" for i in range(1, 201)],
+        'domain': ['ai/ml', 'web development', 'data science', 'finance'] * 50,
+        'employability_boost': [1.0, 1.05, 1.1, 1.2] * 50,
+    })
+    stats = pd.DataFrame({'internship_id': catalog['internship_id'], 'demand_pressure': np.arange(200) % 40})
+    fusion = HybridFusion(catalog, stats)
+
+    rows = np.arange(len(catalog))
+    base = np.linspace(0.4, 0.9, len(catalog))
+    profile = {'student_id': 'STU_0001', 'college_tier': 'Tier-2'}
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        result = fusion.fuse(profile, rows, base)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"⏱️  {elapsed / 1000:.3f} ms per request over {len(rows)} candidates")
+
+    for pos in np.argsort(-result.final, kind='stable')[:3]:
+        print(f"   {catalog['internship_id'][pos]}: {result.breakdown(pos)}")
@@ -30,10 +30,53 @@ try:
 except ImportError:
     requests = None
 
+try:
+    from .catalog_stats import CachedStats, StatsSpec, column, upsert_rows
+except ImportError:
+    # Fallback for direct execution
+    from catalog_stats import CachedStats, StatsSpec, column, upsert_rows
+
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
 
+def _interview_summary(agg) -> Dict[str, Any]:
+    """Build the interview statistics summary from its aggregates."""
+    return {
+        'total_records': agg.rows,
+        'unique_companies': agg.nunique('company_name'),
+        'unique_internships': agg.nunique('internship_id'),
+        'process_type_distribution': agg.distribution('process_type'),
+        'mode_distribution': agg.distribution('mode'),
+        'avg_rounds': agg.mean('rounds'),
+        'avg_timeline_days': agg.mean('expected_timeline_days'),
+        'rounds_distribution': agg.distribution('rounds'),
+        'timeline_ranges': {
+            'quick (≤7 days)': agg.flag('quick'),
+            'standard (8-21 days)': agg.flag('standard'),
+            'extended (>21 days)': agg.flag('extended')
+        }
+    }
+
+
+INTERVIEW_STATS_SPEC = StatsSpec(
+    finalize=_interview_summary,
+    counts={
+        'company_name': column('company_name'),
+        'internship_id': column('internship_id'),
+        'process_type': column('process_type'),
+        'mode': column('mode'),
+        'rounds': column('rounds')
+    },
+    sums={'rounds': column('rounds'), 'expected_timeline_days': column('expected_timeline_days')},
+    flags={
+        'quick': lambda df: df['expected_timeline_days'] <= 7,
+        'standard': lambda df: (df['expected_timeline_days'] > 7) & (df['expected_timeline_days'] <= 21),
+        'extended': lambda df: df['expected_timeline_days'] > 21
+    }
+)
+
+
 class InterviewMetaLoader:
     """
     Interview metadata loader and processor for PMIS.
@@ -51,6 +94,7 @@ class InterviewMetaLoader:
         """
         self.data_dir = data_dir
         self.meta_df = None
+        self._statistics = CachedStats(INTERVIEW_STATS_SPEC)
         
         logger.info("🔧 Interview Metadata Loader initialized")
     
@@ -172,7 +216,7 @@ class InterviewMetaLoader:
             meta = self.meta_df[self.meta_df['company_name'] == company_name]
         
         if meta.empty:
-            logger.debug(f"🔍 No interview metadata found for {internship_id}")
+            logger.debug("🔍 No interview metadata found for %s", internship_id)
             return None
         
         # Return first match as dict
@@ -224,26 +268,35 @@ class InterviewMetaLoader:
         if self.meta_df is None or self.meta_df.empty:
             return {}
         
-        stats = {
-            'total_records': len(self.meta_df),
-            'unique_companies': self.meta_df['company_name'].nunique(),
-            'unique_internships': self.meta_df['internship_id'].nunique(),
-            'process_type_distribution': self.meta_df['process_type'].value_counts().to_dict(),
-            'mode_distribution': self.meta_df['mode'].value_counts().to_dict(),
-            'avg_rounds': float(self.meta_df['rounds'].mean()),
-            'avg_timeline_days': float(self.meta_df['expected_timeline_days'].mean()),
-            'rounds_distribution': self.meta_df['rounds'].value_counts().to_dict(),
-            'timeline_ranges': {
-                'quick (≤7 days)': len(self.meta_df[self.meta_df['expected_timeline_days'] <= 7]),
-                'standard (8-21 days)': len(self.meta_df[
-                    (self.meta_df['expected_timeline_days'] > 7) & 
-                    (self.meta_df['expected_timeline_days'] <= 21)
-                ]),
-                'extended (>21 days)': len(self.meta_df[self.meta_df['expected_timeline_days'] > 21])
-            }
-        }
+        return self._statistics.get(self.meta_df)
+    
+    @property
+    def statistics_version(self) -> int:
+        """Version of the cached summary statistics (changes whenever they do)."""
+        return self._statistics.version
+    
+    def update_interview_meta(self, rows: pd.DataFrame) -> int:
+        """
+        Insert or replace interview metadata by internship_id.
+        
+        The summary statistics are updated from the changed rows only.
+        
+        Args:
+            rows: Raw interview metadata rows (same columns as the CSV)
+            
+        Returns:
+            int: Number of rows written
+        """
+        rows = self.normalize_interview_meta(rows.copy())
+        if rows.empty:
+            return 0
+        
+        meta_df, removed, rows = upsert_rows(self.meta_df, rows, key='internship_id')
+        self._statistics.update(self.meta_df, meta_df, removed, rows)
+        self.meta_df = meta_df
         
-        return stats
+        logger.info(f"🔄 Updated interview metadata: {len(rows)} rows ({len(removed)} replaced)")
+        return len(rows)
     
     def _create_sample_interview_meta(self) -> pd.DataFrame:
         """
@@ -31,6 +31,14 @@ try:
 except ImportError:
     requests = None
 
+try:
+    from .metrics import record_cache
+    from .hashing import stable_hash
+except ImportError:
+    # Fallback for direct execution
+    from metrics import record_cache
+    from hashing import stable_hash
+
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
@@ -96,9 +104,11 @@ class LiveCountsManager:
                 
                 missing_ids.append(internship_id)
         
+        record_cache("live_counts", hits=len(results), misses=len(missing_ids))
+        
         # Fetch missing data if any
         if missing_ids:
-            logger.info(f"🔄 Fetching live counts for {len(missing_ids)} internships")
+            logger.info("🔄 Fetching live counts for %d internships", len(missing_ids))
             fresh_data = self.fetch_live_counts(missing_ids)
             
             # Update cache
@@ -112,7 +122,7 @@ class LiveCountsManager:
                     data_with_freshness['freshness_seconds'] = 0
                     results[internship_id] = data_with_freshness
         
-        logger.info(f"📊 Returned live counts for {len(results)}/{len(internship_ids)} internships")
+        logger.info("📊 Returned live counts for %d/%d internships", len(results), len(internship_ids))
         return results
     
     def fetch_live_counts(self, internship_ids: List[str]) -> Dict[str, Dict[str, Any]]:
@@ -200,15 +210,15 @@ class LiveCountsManager:
         
         # Generate realistic mock data
         for internship_id in internship_ids:
-            # Use internship_id hash for consistent mock data
-            seed = hash(internship_id) % 1000
-            random.seed(seed)
+            # Use a stable internship_id hash for consistent mock data across workers
+            seed = stable_hash(internship_id) % 1000
+            rng = random.Random(seed)
             
             # Generate realistic application counts based on internship popularity
-            base_count = random.randint(10, 500)
+            base_count = rng.randint(10, 500)
             
             # Add some time-based variation
-            time_factor = (hash(current_time[:13]) % 20) - 10  # ±10 variation per hour
+            time_factor = (stable_hash(current_time[:13]) % 20) - 10  # ±10 variation per hour
             current_applicants = max(0, base_count + time_factor)
             
             results[internship_id] = {
@@ -5,20 +5,41 @@ Structured Logging Configuration for PMIS API
 Configures JSON-based structured logging for both uvicorn and application loggers.
 Includes request/response logging with timing, status codes, and error tracking.
 
+Records are handed to a bounded in-memory queue on the request path and
+formatted/written in batches by a background writer thread (disable with
+LOG_ASYNC=false).
+
+Each request produces a single completion record. Successful, fast
+requests are sampled per route (LOG_SAMPLE_RATES); errors and slow
+requests are always logged.
+
 Author: QA Engineer
 Date: September 21, 2025
 """
 
 import logging
 import logging.config
+import logging.handlers
 import sys
 import json
 import time
+import queue
+import atexit
+import random
+import threading
 from datetime import datetime
 from typing import Any, Dict, Optional
 import traceback
 import os
 
+try:
+    from .tracing import start_trace, end_trace, server_timing_enabled
+    from .metrics import observe_request, observe_stages
+except ImportError:
+    # Fallback for direct execution
+    from tracing import start_trace, end_trace, server_timing_enabled
+    from metrics import observe_request, observe_stages
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
@@ -26,7 +47,8 @@ class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            # Event time, not write time (records may be written later in a batch)
+            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -79,12 +101,297 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_entry, default=str)
 
 
+class BatchingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that hands records to the background writer unformatted.
+    
+    Records carry the handlers they are destined for, so loggers with
+    different handler sets can share one queue and one writer thread.
+    """
+    
+    def __init__(self, log_queue: queue.Queue, targets, writer: "BatchingLogWriter"):
+        super().__init__(log_queue)
+        self.targets = tuple(targets)
+        self.writer = writer
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting (getMessage, JSON) happens on the writer thread
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait((self.targets, record))
+        except queue.Full:
+            # Never block the request path on logging
+            self.writer.dropped += 1
+
+
+class BatchingLogWriter:
+    """Background thread that writes queued log records in batches."""
+    
+    _STOP = object()
+    
+    def __init__(self, log_queue: queue.Queue, batch_size: int = 256, flush_interval: float = 0.2):
+        """
+        Initialize the writer.
+        
+        Args:
+            log_queue: Queue fed by BatchingQueueHandler
+            batch_size: Maximum records per batch
+            flush_interval: Maximum seconds a record waits for its batch to fill
+        """
+        self.queue = log_queue
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.original_handlers: Dict[Optional[str], list] = {}
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        """Start the writer thread."""
+        self._thread = threading.Thread(target=self._run, name="pmis-log-writer", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 5.0):
+        """Flush pending records and stop the writer thread."""
+        if self._thread is None:
+            return
+        self.queue.put(self._STOP)
+        self._thread.join(timeout)
+        self._thread = None
+    
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self.queue.get()
+            if item is self._STOP:
+                break
+            
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            self._write(batch)
+        
+        # Drain whatever is still queued
+        batch = []
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not self._STOP:
+                batch.append(item)
+        if batch:
+            self._write(batch)
+    
+    def _write(self, batch):
+        """Group a batch by handler and write each handler's records in one pass."""
+        by_handler: Dict[logging.Handler, list] = {}
+        for targets, record in batch:
+            for handler in targets:
+                if record.levelno >= handler.level:
+                    by_handler.setdefault(handler, []).append(record)
+        
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            notice = logging.LogRecord(
+                "app.logging_config", logging.WARNING, __file__, 0,
+                "Dropped %d log records (log queue full)", (dropped,), None
+            )
+            for records in by_handler.values():
+                records.append(notice)
+        
+        for handler, records in by_handler.items():
+            _write_records(handler, records)
+
+
+def _write_records(handler: logging.Handler, records) -> None:
+    """Format and write records to one handler with a single flush."""
+    if not isinstance(handler, logging.StreamHandler):
+        for record in records:
+            handler.handle(record)
+        return
+    
+    rotating = isinstance(handler, logging.handlers.RotatingFileHandler) and handler.maxBytes > 0
+    handler.acquire()
+    try:
+        for record in records:
+            if not handler.filter(record):
+                continue
+            try:
+                message = handler.format(record) + handler.terminator
+                if rotating:
+                    if handler.stream is None:
+                        handler.stream = handler._open()
+                    if handler.stream.tell() + len(message) >= handler.maxBytes:
+                        handler.doRollover()
+                handler.stream.write(message)
+            except Exception:
+                handler.handleError(record)
+        try:
+            handler.flush()
+        except Exception:
+            pass
+    finally:
+        handler.release()
+
+
+# Active background writer (None when logging is synchronous)
+_log_writer: Optional[BatchingLogWriter] = None
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the background log writer, restoring synchronous handlers."""
+    global _log_writer
+    if _log_writer is not None:
+        writer, _log_writer = _log_writer, None
+        for name, handlers in writer.original_handlers.items():
+            logging.getLogger(name).handlers = handlers
+        writer.stop()
+
+
+def _install_queue_handlers(logger_names) -> BatchingLogWriter:
+    """Route the given loggers through one bounded queue and a batching writer."""
+    log_queue = queue.Queue(maxsize=int(os.getenv("LOG_QUEUE_SIZE", "10000")))
+    writer = BatchingLogWriter(
+        log_queue,
+        batch_size=int(os.getenv("LOG_BATCH_SIZE", "256")),
+        flush_interval=float(os.getenv("LOG_FLUSH_INTERVAL_MS", "200")) / 1000.0
+    )
+    
+    queue_handlers = {}
+    for name in logger_names:
+        target_logger = logging.getLogger(name)
+        targets = tuple(target_logger.handlers)
+        if not targets:
+            continue
+        if targets not in queue_handlers:
+            queue_handlers[targets] = BatchingQueueHandler(log_queue, targets, writer)
+        writer.original_handlers[name] = list(targets)
+        target_logger.handlers = [queue_handlers[targets]]
+    
+    writer.start()
+    return writer
+
+
+# Routes sampled by default; everything else is logged at LOG_SAMPLE_DEFAULT
+DEFAULT_SAMPLE_RATES = "/health=0.01,/recommendations=0.1"
+
+
+def parse_sample_rates(spec: str) -> Dict[str, float]:
+    """
+    Parse a route sampling spec.
+    
+    Args:
+        spec: Comma-separated "route=rate" pairs, e.g. "/health=0.01,/recommendations=0.1"
+        
+    Returns:
+        Dict mapping route template to a rate in [0, 1]
+    """
+    rates = {}
+    for part in spec.split(","):
+        route, sep, rate = part.strip().rpartition("=")
+        if not sep or not route:
+            continue
+        try:
+            rates[route.strip()] = min(max(float(rate), 0.0), 1.0)
+        except ValueError:
+            continue
+    return rates
+
+
+class RequestLogSampler:
+    """
+    Decides which request completion records are written.
+    
+    Errors (status >= 400 or an exception) and requests slower than the
+    threshold are always kept. Other requests are kept with their route's
+    sampling rate, then capped at a per-second budget when one is set.
+    """
+    
+    def __init__(self, rates: Optional[Dict[str, float]] = None, default_rate: float = 1.0,
+                 slow_ms: float = 1000.0, max_per_second: int = 0):
+        """
+        Initialize the sampler.
+        
+        Args:
+            rates: Sampling rate per route template
+            default_rate: Rate for routes not in rates
+            slow_ms: Latency at or above which a request is always logged
+            max_per_second: Cap on sampled (non-error, non-slow) records per second (0 = no cap)
+        """
+        self.rates = rates or {}
+        self.default_rate = default_rate
+        self.slow_ms = slow_ms
+        self.max_per_second = max_per_second
+        self._window = 0
+        self._window_count = 0
+    
+    @classmethod
+    def from_env(cls) -> "RequestLogSampler":
+        """Build a sampler from LOG_SAMPLE_* environment variables."""
+        return cls(
+            rates=parse_sample_rates(os.getenv("LOG_SAMPLE_RATES", DEFAULT_SAMPLE_RATES)),
+            default_rate=float(os.getenv("LOG_SAMPLE_DEFAULT", "1.0")),
+            slow_ms=float(os.getenv("LOG_SLOW_REQUEST_MS", "1000")),
+            max_per_second=int(os.getenv("LOG_MAX_REQUESTS_PER_SECOND", "0"))
+        )
+    
+    def rate_for(self, route: str) -> float:
+        """Get the sampling rate for a route template."""
+        return self.rates.get(route, self.default_rate)
+    
+    def should_log(self, route: str, status_code: Optional[int], latency_ms: float, failed: bool = False) -> bool:
+        """
+        Decide whether to write the completion record of one request.
+        
+        Args:
+            route: Route template (or "unmatched")
+            status_code: Response status
+            latency_ms: Request latency
+            failed: Whether the application raised
+            
+        Returns:
+            True if the record should be written
+        """
+        if failed or status_code is None or status_code >= 400 or latency_ms >= self.slow_ms:
+            return True
+        
+        rate = self.rate_for(route)
+        if rate < 1.0 and random.random() >= rate:
+            return False
+        
+        if self.max_per_second > 0:
+            window = int(time.monotonic())
+            if window != self._window:
+                self._window = window
+                self._window_count = 0
+            if self._window_count >= self.max_per_second:
+                return False
+            self._window_count += 1
+        
+        return True
+
+
 class RequestLoggingMiddleware:
     """Middleware for logging HTTP requests and responses."""
     
-    def __init__(self, app):
+    def __init__(self, app, sampler: Optional[RequestLogSampler] = None):
         self.app = app
         self.logger = logging.getLogger("uvicorn.access")
+        self.sampler = sampler or RequestLogSampler.from_env()
     
     async def __call__(self, scope, receive, send):
         if scope["type"] != "http":
@@ -105,16 +412,9 @@ class RequestLoggingMiddleware:
         # Start timing
         start_time = time.time()
         
-        # Log request
-        self.logger.info(
-            f"Request started: {method} {path}",
-            extra={
-                "request_id": request_id,
-                "method": method,
-                "path": path,
-                "event": "request_start"
-            }
-        )
+        # Attach a stage trace for the pipeline below this middleware
+        trace, trace_token = start_trace()
+        add_server_timing = trace is not None and server_timing_enabled()
         
         # Track response status
         status_code = None
@@ -126,16 +426,24 @@ class RequestLoggingMiddleware:
             if message["type"] == "http.response.start":
                 status_code = message["status"]
                 response_headers = message.get("headers", [])
+                if add_server_timing:
+                    timing = trace.server_timing()
+                    if timing:
+                        message["headers"] = list(response_headers) + [
+                            (b"server-timing", timing.encode("latin-1"))
+                        ]
             
             await send(message)
         
+        failed = False
         try:
             await self.app(scope, receive, send_wrapper)
         except Exception as e:
             # Log error
+            failed = True
             status_code = 500
             self.logger.error(
-                f"Request failed: {method} {path} - {str(e)}",
+                "Request failed: %s %s - %s", method, path, e,
                 extra={
                     "request_id": request_id,
                     "method": method,
@@ -151,19 +459,34 @@ class RequestLoggingMiddleware:
         finally:
             # Calculate latency
             latency_ms = (time.time() - start_time) * 1000
+            end_trace(trace_token)
             
-            # Log response
-            self.logger.info(
-                f"Request completed: {method} {path} - {status_code}",
-                extra={
+            stages = trace.as_dict() if trace is not None else None
+            if stages:
+                observe_stages(stages)
+            
+            # Label by route template to keep metric cardinality bounded
+            route = getattr(scope.get("route"), "path", "unmatched")
+            observe_request(scope["method"], route, status_code, latency_ms / 1000)
+            
+            # Log one combined record for sampled, failed or slow requests
+            if self.sampler.should_log(route, status_code, latency_ms, failed):
+                extra = {
                     "request_id": request_id,
                     "method": method,
                     "path": path,
+                    "route": route,
                     "status_code": status_code,
                     "latency_ms": round(latency_ms, 2),
+                    "sample_rate": self.sampler.rate_for(route),
                     "event": "request_complete"
                 }
-            )
+                if stages:
+                    extra["stages_ms"] = stages
+                self.logger.info(
+                    "Request completed: %s %s - %s", method, path, status_code,
+                    extra=extra
+                )
 
 
 def configure_logging(log_level: str = "INFO", enable_request_logging: bool = True) -> None:
@@ -178,6 +501,9 @@ def configure_logging(log_level: str = "INFO", enable_request_logging: bool = Tr
     # Determine log level
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
     
+    # Flush any writer from a previous configuration before replacing handlers
+    shutdown_logging()
+    
     # Configure logging
     logging_config = {
         "version": 1,
@@ -250,6 +576,13 @@ def configure_logging(log_level: str = "INFO", enable_request_logging: bool = Tr
     # Apply logging configuration
     logging.config.dictConfig(logging_config)
     
+    # Move formatting and I/O off the request path
+    global _log_writer
+    if os.getenv("LOG_ASYNC", "true").lower() in ("1", "true", "yes", "on"):
+        _log_writer = _install_queue_handlers([None] + list(logging_config["loggers"]))
+        atexit.unregister(shutdown_logging)
+        atexit.register(shutdown_logging)
+    
     # Set up request logging if enabled
     if enable_request_logging:
         # This will be applied in main.py
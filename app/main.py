@@ -13,24 +13,17 @@ import subprocess
 import json
 from datetime import datetime
 from contextlib import asynccontextmanager
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
-from fastapi import FastAPI, HTTPException, status, Request
+from fastapi import FastAPI, HTTPException, status, Request, Header, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse, JSONResponse
 
 from .schemas import (
     RecommendationRequest, 
     RecommendationResponse, 
     HealthResponse,
-    Recommendation,
-    InternshipRecommendation,
-    CourseInfo,
-    CourseItem,
-    SuccessBreakdown,
-    InterviewMeta,
-    LiveCounts,
-    AlumniStory
+    InternshipSearchResponse
 )
 from .ml_model import initialize_ml_model, get_recommendations, get_model_status
 from .utils import (
@@ -39,8 +32,12 @@ from .utils import (
     log_recommendation_request,
     normalize_skills
 )
-from .logging_config import configure_logging, get_logger, RequestLoggingMiddleware
+from .logging_config import configure_logging, get_logger, RequestLoggingMiddleware, shutdown_logging
 from .timeout_utils import with_timeout, create_timeout_response
+from .tracing import span
+from .metrics import get_metrics_registry, record_fallback
+from .profiler import get_request_profiler, max_profile_seconds, ProfilerBusyError
+from .serialization import recommendation_response_payload, internship_search_payload, encode_response, dumps, FastJSONResponse
 
 # Configure structured logging
 configure_logging(
@@ -56,6 +53,9 @@ model_loaded = False
 data_loaded = False
 last_refresh = None
 
+# Encoded /stats body with the tables and statistics versions it was built from
+_stats_cache = None
+
 
 def get_git_sha() -> Optional[str]:
     """Get git SHA if available."""
@@ -100,6 +100,7 @@ async def lifespan(app: FastAPI):
     
     # Cleanup on shutdown
     logger.info("🛑 Shutting down ML Recommendations API...")
+    shutdown_logging()
 
 
 # Initialize FastAPI app
@@ -145,6 +146,7 @@ def get_recommendations_with_timeout(student_id: str, skills: list, stream: str,
     """Get ML recommendations with timeout protection."""
     import asyncio
     import concurrent.futures
+    import contextvars
     import time
     
     def run_recommendations():
@@ -161,14 +163,19 @@ def get_recommendations_with_timeout(student_id: str, skills: list, stream: str,
     try:
         # Run in thread pool with timeout
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(run_recommendations)
+            # Copy the request context so stage spans reach the request trace
+            future = executor.submit(
+                contextvars.copy_context().run, get_request_profiler().run, run_recommendations
+            )
             result = future.result(timeout=3.0)
             return result
     except concurrent.futures.TimeoutError:
         logger.warning("ML recommendations timed out after 3s, returning empty response")
+        record_fallback("timeout")
         return []
     except Exception as e:
         logger.error(f"Error in ML recommendations: {e}")
+        record_fallback("error")
         return []
 
 
@@ -199,6 +206,123 @@ def detailed_health_check():
     }
 
 
+def _dataset_row_samples():
+    """Rows per loaded dataset (for the pmis_dataset_rows gauge)."""
+    from .ml_model_fixed import fixed_recommendation_engine as engine
+    from .skill_vocab import get_skill_vocabulary
+    
+    samples = [({"dataset": "skill_vocabulary"}, len(get_skill_vocabulary()))]
+    if engine is None:
+        return samples
+    
+    frames = {
+        "internships": engine.data_loader.internships_df,
+        "application_stats": engine.app_stats_loader.stats_df,
+        "interview_meta": engine.interview_loader.meta_df,
+        "alumni": engine.alumni_loader.alumni_df,
+        "courses": engine.course_scorer.courses_df
+    }
+    for name, df in frames.items():
+        samples.append(({"dataset": name}, len(df) if df is not None else 0))
+    samples.append(({"dataset": "recommendation_cache"}, len(engine._recommendation_cache)))
+    return samples
+
+
+def _threadpool_samples():
+    """Worker thread-pool usage for sync endpoints (must run on the event loop)."""
+    import anyio.to_thread
+    
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    return [
+        ({"state": "busy"}, limiter.borrowed_tokens),
+        ({"state": "limit"}, limiter.total_tokens),
+        ({"state": "queued"}, limiter.statistics().tasks_waiting)
+    ]
+
+
+get_metrics_registry().gauge("pmis_dataset_rows", "Rows per loaded dataset", _dataset_row_samples)
+get_metrics_registry().gauge("pmis_threadpool_workers", "Sync endpoint thread pool: busy, limit and queued tasks", _threadpool_samples)
+
+
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+async def get_metrics():
+    """Operational metrics in the Prometheus text exposition format."""
+    return PlainTextResponse(
+        get_metrics_registry().render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+def _require_admin(token: Optional[str]):
+    """Allow admin endpoints only when ADMIN_TOKEN is set and matches."""
+    import hmac
+    
+    expected = os.getenv("ADMIN_TOKEN")
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not token or not hmac.compare_digest(token, expected):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token")
+
+
+@app.post("/admin/profile/sample", tags=["Admin"], response_class=PlainTextResponse)
+async def profile_sample(seconds: float = 10.0,
+                         interval_ms: float = 5.0,
+                         app_only: bool = True,
+                         x_admin_token: Optional[str] = Header(default=None)):
+    """Sample worker stacks for a while and return collapsed stacks (flamegraph input)."""
+    import asyncio
+    
+    _require_admin(x_admin_token)
+    
+    seconds = min(max(seconds, 0.1), max_profile_seconds())
+    try:
+        sampler = await asyncio.to_thread(
+            get_request_profiler().sample, seconds, interval_ms / 1000.0, app_only
+        )
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    
+    summary = sampler.summary()
+    return PlainTextResponse(
+        sampler.collapsed(),
+        headers={f"X-Profile-{key.replace('_', '-')}": str(value) for key, value in summary.items()}
+    )
+
+
+@app.post("/admin/profile/cprofile", tags=["Admin"])
+def profile_cprofile_start(requests: int = 5,
+                           timeout_seconds: Optional[float] = None,
+                           x_admin_token: Optional[str] = Header(default=None)):
+    """Profile the next N recommendation computations with cProfile."""
+    _require_admin(x_admin_token)
+    
+    try:
+        return get_request_profiler().arm_cprofile(min(max(requests, 1), 100), timeout_seconds)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
+@app.get("/admin/profile/cprofile", tags=["Admin"])
+def profile_cprofile_result(sort: str = "cumulative",
+                            limit: int = 50,
+                            x_admin_token: Optional[str] = Header(default=None)):
+    """Get pstats output of the cProfile session (202 while still collecting)."""
+    _require_admin(x_admin_token)
+    
+    profiler = get_request_profiler()
+    session = profiler.cprofile_status()
+    if not session["complete"]:
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=session)
+    
+    try:
+        report = profiler.cprofile_report(sort_by=sort, limit=min(max(limit, 1), 500))
+    except KeyError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid sort key: {sort}")
+    if report is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No requests were profiled")
+    return PlainTextResponse(report)
+
+
 @app.get("/meta", tags=["Meta"])
 def get_meta_info():
     """Get build and runtime metadata."""
@@ -240,14 +364,15 @@ def get_student_recommendations(request: RecommendationRequest):
         )
         
         # Validate input data
-        validation = validate_student_data(
-            student_id=request.student_id,
-            skills=request.skills,
-            stream=request.stream,
-            cgpa=request.cgpa,
-            rural_urban=request.rural_urban,
-            college_tier=request.college_tier
-        )
+        with span("validate"):
+            validation = validate_student_data(
+                student_id=request.student_id,
+                skills=request.skills,
+                stream=request.stream,
+                cgpa=request.cgpa,
+                rural_urban=request.rural_urban,
+                college_tier=request.college_tier
+            )
         
         if not validation["valid"]:
             raise HTTPException(
@@ -256,18 +381,20 @@ def get_student_recommendations(request: RecommendationRequest):
             )
         
         # Normalize skills
-        normalized_skills = normalize_skills(request.skills)
+        with span("normalize_skills"):
+            normalized_skills = normalize_skills(request.skills)
         
         # Get ML recommendations with timeout
-        recommendations_data = get_recommendations_with_timeout(
-            student_id=request.student_id,
-            skills=normalized_skills,
-            stream=request.stream,
-            cgpa=request.cgpa,
-            rural_urban=request.rural_urban,
-            college_tier=request.college_tier,
-            top_n=5
-        )
+        with span("recommend"):
+            recommendations_data = get_recommendations_with_timeout(
+                student_id=request.student_id,
+                skills=normalized_skills,
+                stream=request.stream,
+                cgpa=request.cgpa,
+                rural_urban=request.rural_urban,
+                college_tier=request.college_tier,
+                top_n=5
+            )
         
         # Handle timeout fallback
         if not recommendations_data:
@@ -304,207 +431,14 @@ def get_student_recommendations(request: RecommendationRequest):
         except Exception as e:
             logger.warning(f"⚠️  Display rescaling skipped: {e}")
         
-        # Convert to Pydantic models
-        recommendations = []
-        for rec_data in recommendations_data:
-            # Convert courses to CourseInfo objects (legacy)
-            courses = [CourseInfo(**course) for course in rec_data.get("courses", [])]
-            
-            # Convert enhanced course suggestions to CourseItem objects
-            course_suggestions = []
-            for course_data in rec_data.get("course_suggestions", []):
-                try:
-                    course_item = CourseItem(**course_data)
-                    course_suggestions.append(course_item)
-                except Exception as e:
-                    logger.warning(f"⚠️  Failed to create CourseItem: {e}")
-                    # Create fallback CourseItem
-                    course_item = CourseItem(
-                        skill=course_data.get('skill', 'Unknown'),
-                        platform=course_data.get('platform', 'Unknown'),
-                        course_name=course_data.get('course_name', 'Unknown Course'),
-                        link=course_data.get('link', ''),
-                        difficulty=course_data.get('difficulty', 'Intermediate'),
-                        duration_hours=course_data.get('duration_hours', 40.0),
-                        expected_success_boost=course_data.get('expected_success_boost', 0.1),
-                        readiness_score=course_data.get('readiness_score', 0.8),
-                        prereq_coverage=course_data.get('prereq_coverage', 0.8),
-                        content_alignment=course_data.get('content_alignment', 0.7),
-                        difficulty_penalty=course_data.get('difficulty_penalty', 1.0)
-                    )
-                    course_suggestions.append(course_item)
-            
-            # Check if this is an enhanced recommendation with metadata
-            if "application_deadline" in rec_data:
-                # Create enhanced InternshipRecommendation object
-                try:
-                    deadline = datetime.strptime(rec_data["application_deadline"], "%Y-%m-%d").date()
-                except (ValueError, TypeError):
-                    deadline = datetime.now().date()
-                
-                # Create SuccessBreakdown object
-                success_breakdown_data = rec_data.get("success_breakdown", {})
-                success_breakdown = SuccessBreakdown(
-                    base_model_prob=success_breakdown_data.get("base_model_prob", rec_data["success_prob"]),
-                    content_signal=success_breakdown_data.get("content_signal", 0.0),
-                    cf_signal=success_breakdown_data.get("cf_signal", 0.0),
-                    fairness_adjustment=success_breakdown_data.get("fairness_adjustment", 0.0),
-                    demand_adjustment=success_breakdown_data.get("demand_adjustment", 0.0),
-                    company_signal=success_breakdown_data.get("company_signal", 0.0),
-                    final_success_prob=success_breakdown_data.get("final_success_prob", rec_data["success_prob"])
-                )
-                
-                # Create optional feature objects
-                interview_meta = None
-                if rec_data.get("interview_meta"):
-                    interview_data = rec_data["interview_meta"]
-                    interview_meta = InterviewMeta(
-                        process_type=interview_data.get("process_type"),
-                        rounds=interview_data.get("rounds"),
-                        mode=interview_data.get("mode"),
-                        expected_timeline_days=interview_data.get("expected_timeline_days"),
-                        notes=interview_data.get("notes")
-                    )
-                
-                live_counts = None
-                if rec_data.get("live_counts"):
-                    live_data = rec_data["live_counts"]
-                    live_counts = LiveCounts(
-                        current_applicants=live_data.get("current_applicants"),
-                        last_seen=live_data.get("last_seen"),
-                        source=live_data.get("source"),
-                        freshness_seconds=live_data.get("freshness_seconds")
-                    )
-                
-                alumni_stories = []
-                if rec_data.get("alumni_stories"):
-                    for story_data in rec_data["alumni_stories"]:
-                        story = AlumniStory(
-                            title=story_data.get("title"),
-                            company_name=story_data.get("company_name"),
-                            outcome=story_data.get("outcome"),
-                            testimonial=story_data.get("testimonial"),
-                            year=story_data.get("year")
-                        )
-                        alumni_stories.append(story)
-                
-                recommendation = InternshipRecommendation(
-                    internship_id=rec_data["internship_id"],
-                    title=rec_data["title"],
-                    company=rec_data.get("company", rec_data.get("organization_name", "Unknown")),
-                    domain=rec_data["domain"],
-                    location=rec_data["location"],
-                    duration=rec_data["duration"],
-                    stipend=rec_data["stipend"],
-                    application_deadline=deadline,
-                    is_accepting_applications=rec_data.get("is_accepting_applications", True),
-                    urgent=rec_data.get("urgent", False),
-                    company_employee_count=rec_data.get("company_employee_count"),
-                    headquarters=rec_data.get("headquarters"),
-                    industry=rec_data.get("industry"),
-                    success_prob=rec_data["success_prob"],
-                    projected_success_prob=rec_data.get("projected_success_prob", rec_data["success_prob"]),
-                    fairness_score=rec_data.get("fairness_score", 0.8),
-                    employability_boost=rec_data.get("employability_boost", 1.0),
-                    applicants_total=rec_data.get("applicants_total"),
-                    positions_available=rec_data.get("positions_available"),
-                    selection_ratio=rec_data.get("selection_ratio"),
-                    demand_pressure=rec_data.get("demand_pressure"),
-                    success_breakdown=success_breakdown,
-                    interview_meta=interview_meta,
-                    live_counts=live_counts,
-                    alumni_stories=alumni_stories,
-                    data_quality_flags=rec_data.get("data_quality_flags", []),
-                    missing_skills=rec_data["missing_skills"],
-                    courses=courses,  # Legacy courses for backward compatibility
-                    course_suggestions=course_suggestions,  # Enhanced course suggestions
-                    reasons=rec_data["reasons"]
-                )
-            else:
-                # Create legacy Recommendation object with optional success breakdown
-                success_breakdown = None
-                if "success_breakdown" in rec_data:
-                    success_breakdown_data = rec_data["success_breakdown"]
-                    success_breakdown = SuccessBreakdown(
-                        base_model_prob=success_breakdown_data.get("base_model_prob", rec_data["success_prob"]),
-                        content_signal=success_breakdown_data.get("content_signal", 0.0),
-                        cf_signal=success_breakdown_data.get("cf_signal", 0.0),
-                        fairness_adjustment=success_breakdown_data.get("fairness_adjustment", 0.0),
-                        demand_adjustment=success_breakdown_data.get("demand_adjustment", 0.0),
-                        company_signal=success_breakdown_data.get("company_signal", 0.0),
-                        final_success_prob=success_breakdown_data.get("final_success_prob", rec_data["success_prob"])
-                    )
-                
-                # Create optional feature objects (same as above)
-                interview_meta = None
-                if rec_data.get("interview_meta"):
-                    interview_data = rec_data["interview_meta"]
-                    interview_meta = InterviewMeta(
-                        process_type=interview_data.get("process_type"),
-                        rounds=interview_data.get("rounds"),
-                        mode=interview_data.get("mode"),
-                        expected_timeline_days=interview_data.get("expected_timeline_days"),
-                        notes=interview_data.get("notes")
-                    )
-                
-                live_counts = None
-                if rec_data.get("live_counts"):
-                    live_data = rec_data["live_counts"]
-                    live_counts = LiveCounts(
-                        current_applicants=live_data.get("current_applicants"),
-                        last_seen=live_data.get("last_seen"),
-                        source=live_data.get("source"),
-                        freshness_seconds=live_data.get("freshness_seconds")
-                    )
-                
-                alumni_stories = []
-                if rec_data.get("alumni_stories"):
-                    for story_data in rec_data["alumni_stories"]:
-                        story = AlumniStory(
-                            title=story_data.get("title"),
-                            company_name=story_data.get("company_name"),
-                            outcome=story_data.get("outcome"),
-                            testimonial=story_data.get("testimonial"),
-                            year=story_data.get("year")
-                        )
-                        alumni_stories.append(story)
-                
-            recommendation = Recommendation(
-                internship_id=rec_data["internship_id"],
-                title=rec_data["title"],
-                    organization_name=rec_data.get("organization_name", rec_data.get("company", "Unknown")),
-                domain=rec_data["domain"],
-                location=rec_data["location"],
-                duration=rec_data["duration"],
-                stipend=rec_data["stipend"],
-                success_prob=rec_data["success_prob"],
-                    projected_success_prob=rec_data.get("projected_success_prob", rec_data["success_prob"]),
-                    applicants_total=rec_data.get("applicants_total"),
-                    positions_available=rec_data.get("positions_available"),
-                    selection_ratio=rec_data.get("selection_ratio"),
-                    demand_pressure=rec_data.get("demand_pressure"),
-                    success_breakdown=success_breakdown,
-                    interview_meta=interview_meta,
-                    live_counts=live_counts,
-                    alumni_stories=alumni_stories,
-                    data_quality_flags=rec_data.get("data_quality_flags", []),
-                missing_skills=rec_data["missing_skills"],
-                    courses=courses,  # Legacy courses for backward compatibility
-                    course_suggestions=course_suggestions,  # Enhanced course suggestions
-                reasons=rec_data["reasons"]
+        # Map engine output to the response shape once; validate once and encode
+        with span("build_response"):
+            payload = recommendation_response_payload(
+                request.student_id, recommendations_data, datetime.now().isoformat()
             )
-            
-            recommendations.append(recommendation)
+            response = encode_response(RecommendationResponse, payload)
         
-        # Create response
-        response = RecommendationResponse(
-            student_id=request.student_id,
-            total_recommendations=len(recommendations),
-            recommendations=recommendations,
-            generated_at=datetime.now().isoformat()
-        )
-        
-        logger.info(f"✅ Generated {len(recommendations)} recommendations for {request.student_id}")
+        logger.info("✅ Generated %d recommendations for %s", payload["total_recommendations"], request.student_id)
         return response
         
     except HTTPException:
@@ -517,6 +451,81 @@ def get_student_recommendations(request: RecommendationRequest):
         )
 
 
+@app.get("/internships/search", response_model=InternshipSearchResponse, tags=["Internships"])
+def search_internships(min_stipend: float = 0,
+                       max_stipend: Optional[float] = None,
+                       location: Optional[List[str]] = Query(default=None),
+                       domain: Optional[List[str]] = Query(default=None),
+                       company_size: Optional[List[str]] = Query(default=None),
+                       urgent_only: bool = False,
+                       limit: int = Query(default=20, ge=1, le=100),
+                       offset: int = Query(default=0, ge=0)):
+    """
+    Search internships by stipend range, locations, domains, company sizes and urgency.
+    
+    Repeated parameters (e.g. ?location=pune&location=delhi) match any of the values;
+    different criteria must all match. Company sizes: startup (<50), small (50-500),
+    large (>500 employees).
+    """
+    from .ml_model_fixed import fixed_recommendation_engine as engine
+    
+    if engine is None or engine.data_loader.internships_df is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Internship data not loaded")
+    
+    loader = engine.data_loader
+    with span("search"):
+        rows = loader.search_index().query(
+            min_stipend=min_stipend,
+            max_stipend=max_stipend if max_stipend is not None else float('inf'),
+            locations=location,
+            domains=domain,
+            company_sizes=company_size,
+            urgent_only=urgent_only
+        )
+    
+    # Materialize only the requested page
+    page = loader.internships_df.iloc[rows[offset:offset + limit]]
+    payload = internship_search_payload(page, len(rows), offset, limit)
+    return encode_response(InternshipSearchResponse, payload)
+
+
+@app.get("/stats", tags=["Stats"])
+def get_catalog_statistics():
+    """
+    Get summary statistics for internships, applications, interviews and alumni.
+    
+    Statistics are maintained per data version by the loaders; the encoded
+    response is reused until any of them changes.
+    """
+    global _stats_cache
+    from .ml_model_fixed import fixed_recommendation_engine as engine
+    
+    if engine is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Data not loaded")
+    
+    loaders = (engine.data_loader, engine.app_stats_loader, engine.interview_loader, engine.alumni_loader)
+    frames = (engine.data_loader.internships_df, engine.app_stats_loader.stats_df,
+              engine.interview_loader.meta_df, engine.alumni_loader.alumni_df)
+    
+    cached = _stats_cache
+    if (cached is not None and all(df is old for df, old in zip(frames, cached[0]))
+            and cached[1] == tuple(loader.statistics_version for loader in loaders)):
+        return FastJSONResponse(cached[2])
+    
+    with span("stats"):
+        payload = {
+            "internships": engine.data_loader.get_company_statistics(),
+            "application_stats": engine.app_stats_loader.get_statistics_summary(),
+            "interview_meta": engine.interview_loader.get_interview_statistics(),
+            "alumni": engine.alumni_loader.get_alumni_statistics()
+        }
+        body = dumps(payload)
+    
+    # Versions are read after the summaries (a first read of a new table bumps them)
+    _stats_cache = (frames, tuple(loader.statistics_version for loader in loaders), body)
+    return FastJSONResponse(body)
+
+
 @app.get("/", tags=["Root"])
 def root():
     """Root endpoint with API information."""
@@ -529,6 +538,8 @@ def root():
             "health_detailed": "/health/detailed",
             "meta": "/meta",
             "recommendations": "/recommendations (POST)",
+            "internship_search": "/internships/search",
+            "stats": "/stats",
             "docs": "/docs"
         },
         "status": "ready",
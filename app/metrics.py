@@ -0,0 +1,244 @@
+"""
+PMIS Operational Metrics Module
+==============================
+
+This module collects operational metrics and renders them in the Prometheus
+text exposition format for the /metrics endpoint. It has no external
+dependencies: counters and histograms are plain dicts keyed by label
+values, each guarded by its own lock that is held only for an increment.
+Gauges that describe current state (dataset sizes, thread-pool depth) are
+computed by callbacks at scrape time, so they cost nothing between scrapes.
+
+Key Features:
+- Request latency histograms per route template
+- Pipeline stage histograms fed from request traces
+- Cache hit/miss counters (recommendation, live counts, course readiness)
+- Timeout-fallback counters
+- Scrape-time gauge callbacks
+
+Author: ML Engineer
+Date: September 24, 2025
+"""
+
+import bisect
+import threading
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds (recommendations can take several seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+GaugeSamples = Iterable[Tuple[Dict[str, str], float]]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0):
+        """Increment the counter for the given label values."""
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        """Get the current value for the given label values."""
+        return self._values.get(labelvalues, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for labelvalues, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels."""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labelvalues -> [per-bucket counts (+Inf last), sum]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str):
+        """Record one observation for the given label values."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = [[0] * (len(self.buckets) + 1), 0.0]
+                self._series[labelvalues] = series
+            series[0][index] += 1
+            series[1] += value
+
+    def count(self, *labelvalues: str) -> int:
+        """Get the number of observations for the given label values."""
+        series = self._series.get(labelvalues)
+        return sum(series[0]) if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._series.items())
+        for labelvalues, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labelvalues, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {_format_value(round(total, 6))}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class GaugeCallback:
+    """Gauge whose samples are produced by a callback at scrape time."""
+
+    def __init__(self, name: str, help_text: str, callback: Callable[[], GaugeSamples]):
+        self.name = name
+        self.help_text = help_text
+        self.callback = callback
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} gauge"]
+        try:
+            samples = list(self.callback())
+        except Exception as e:
+            logger.warning(f"⚠️  Metrics callback {self.name} failed: {e}")
+            return lines
+        for labels, value in samples:
+            names = sorted(labels)
+            lines.append(f"{self.name}{_format_labels(names, [labels[n] for n in names])} {_format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Registry of PMIS metrics with Prometheus text rendering."""
+
+    def __init__(self):
+        """Initialize the registry with the standard PMIS metrics."""
+        self._metrics: Dict[str, object] = {}
+
+        self.request_duration = self.register(Histogram(
+            "pmis_http_request_duration_seconds", "HTTP request latency by route",
+            ("method", "route", "status")
+        ))
+        self.stage_duration = self.register(Histogram(
+            "pmis_stage_duration_seconds", "Recommendation pipeline stage latency per request",
+            ("stage",)
+        ))
+        self.cache_requests = self.register(Counter(
+            "pmis_cache_requests_total", "Cache lookups by cache and result (hit/miss)",
+            ("cache", "result")
+        ))
+        self.timeout_fallbacks = self.register(Counter(
+            "pmis_recommendation_fallbacks_total", "Recommendations answered with the empty fallback",
+            ("reason",)
+        ))
+
+    def register(self, metric):
+        """Register a metric (replacing any metric with the same name)."""
+        self._metrics[metric.name] = metric
+        return metric
+
+    def gauge(self, name: str, help_text: str, callback: Callable[[], GaugeSamples]) -> GaugeCallback:
+        """Register a scrape-time gauge."""
+        return self.register(GaugeCallback(name, help_text, callback))
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Global instance for easy access
+_metrics_registry = None
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get or create the global metrics registry."""
+    global _metrics_registry
+    if _metrics_registry is None:
+        _metrics_registry = MetricsRegistry()
+    return _metrics_registry
+
+
+def observe_request(method: str, route: str, status_code: Optional[int], seconds: float):
+    """Record one HTTP request."""
+    get_metrics_registry().request_duration.observe(seconds, method, route, str(status_code or 500))
+
+
+def observe_stages(stages_ms: Dict[str, float]):
+    """Record the stage timings of one request trace."""
+    histogram = get_metrics_registry().stage_duration
+    for stage, duration_ms in stages_ms.items():
+        histogram.observe(duration_ms / 1000.0, stage)
+
+
+def record_cache(cache: str, hits: int = 0, misses: int = 0):
+    """Record cache hits and misses."""
+    counter = get_metrics_registry().cache_requests
+    if hits:
+        counter.inc(cache, "hit", amount=hits)
+    if misses:
+        counter.inc(cache, "miss", amount=misses)
+
+
+def record_fallback(reason: str):
+    """Record a recommendation fallback (timeout or error)."""
+    get_metrics_registry().timeout_fallbacks.inc(reason)
+
+
+if __name__ == "__main__":
+    # Demo the metrics registry
+    print("🚀 PMIS Operational Metrics Demo")
+    print("=" * 50)
+
+    observe_request("POST", "/recommendations", 200, 0.42)
+    observe_request("GET", "/health", 200, 0.002)
+    observe_stages({"score": 380.0, "build_response": 3.5})
+    record_cache("recommendation", misses=1)
+    record_cache("live_counts", hits=4, misses=1)
+    record_fallback("timeout")
+    get_metrics_registry().gauge(
+        "pmis_dataset_rows", "Rows per loaded dataset",
+        lambda: [({"dataset": "internships"}, 3000)]
+    )
+
+    print(get_metrics_registry().render())
@@ -24,6 +24,7 @@ try:
     from .interview_meta import InterviewMetaLoader
     from .live_counts import get_cached_counts
     from .alumni import AlumniManager
+    from .tracing import span
 except ImportError:
     # Fallback for direct execution
     from courses import CourseReadinessScorer, suggest_courses_for_missing_skills
@@ -32,6 +33,7 @@ except ImportError:
     from interview_meta import InterviewMetaLoader
     from live_counts import get_cached_counts
     from alumni import AlumniManager
+    from tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -212,7 +214,7 @@ def get_recommendations(
         # Use the FIXED recommendation engine directly
         from app.ml_model_fixed import get_fixed_recommendations
         
-        logger.info(f"🔄 Getting {top_n} recommendations for student {student_id}")
+        logger.info("🔄 Getting %s recommendations for student %s", top_n, student_id)
         
         recommendations = get_fixed_recommendations(
             student_id=student_id,
@@ -224,43 +226,47 @@ def get_recommendations(
             top_n=top_n
         )
         
-        logger.info(f"✅ Fixed model returned {len(recommendations)} recommendations")
+        logger.info("✅ Fixed model returned %d recommendations", len(recommendations))
         
         # Convert to the expected format for API compatibility
-        formatted_recommendations = []
-        for rec in recommendations:
-            formatted_rec = {
-                "internship_id": rec["internship_id"],
-                "title": rec["title"],
-                "company": rec["company"],
-                "domain": rec["domain"],
-                "location": rec["location"],
-                "duration": rec["duration"],
-                "stipend": rec["stipend"],
-                "success_prob": rec["success_prob"],
-                "projected_success_prob": rec["projected_success_prob"],
-                "rank": rec["rank"],
-                "explanations": rec["explanations"],
-                "reasons": rec["explanations"],  # API compatibility
-                "missing_skills": rec["missing_skills"],
-                "course_suggestions": rec["course_suggestions"],
-                "scores": {
-                    "success_probability": rec["success_prob"],
-                    "skill_match": rec["score_breakdown"]["skill_match_score"],
-                    "employability_boost": rec["score_breakdown"]["academic_score"],
-                    "fairness_adjustment": rec["score_breakdown"]["profile_score"]
-                },
-                "skill_gap_analysis": {
-                    "status": "skills_needed" if rec["missing_skills"] else "no_gaps",
-                    "message": f"Need to develop {len(rec['missing_skills'])} skills" if rec["missing_skills"] else "All requirements met",
-                    "skills_needed": len(rec["missing_skills"]),
-                    "recommended_courses": len(rec["course_suggestions"]),
-                    "priority_skills": rec["missing_skills"][:3]
+        with span("format_recommendations"):
+            formatted_recommendations = []
+            for rec in recommendations:
+                formatted_rec = {
+                    "internship_id": rec["internship_id"],
+                    "title": rec["title"],
+                    "company": rec["company"],
+                    "domain": rec["domain"],
+                    "location": rec["location"],
+                    "duration": rec["duration"],
+                    "stipend": rec["stipend"],
+                    "success_prob": rec["success_prob"],
+                    "projected_success_prob": rec["projected_success_prob"],
+                    "rank": rec["rank"],
+                    "explanations": rec["explanations"],
+                    "reasons": rec["explanations"],  # API compatibility
+                    "missing_skills": rec["missing_skills"],
+                    "course_suggestions": rec["course_suggestions"],
+                    "scores": {
+                        "success_probability": rec["success_prob"],
+                        "skill_match": rec["score_breakdown"]["skill_match_score"],
+                        "employability_boost": rec["score_breakdown"]["academic_score"],
+                        "fairness_adjustment": rec["score_breakdown"]["profile_score"]
+                    },
+                    "skill_gap_analysis": {
+                        "status": "skills_needed" if rec["missing_skills"] else "no_gaps",
+                        "message": f"Need to develop {len(rec['missing_skills'])} skills" if rec["missing_skills"] else "All requirements met",
+                        "skills_needed": len(rec["missing_skills"]),
+                        "recommended_courses": len(rec["course_suggestions"]),
+                        "priority_skills": rec["missing_skills"][:3]
+                    }
                 }
-            }
-            formatted_recommendations.append(formatted_rec)
+                if "success_breakdown" in rec:
+                    formatted_rec["success_breakdown"] = rec["success_breakdown"]
+                formatted_recommendations.append(formatted_rec)
         
-        logger.info(f"📊 Success probabilities: {[f'{r['success_prob']:.3f}' for r in recommendations]}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("📊 Success probabilities: %s", [f"{r['success_prob']:.3f}" for r in recommendations])
         return formatted_recommendations
         
     except Exception as e:
@@ -21,6 +21,10 @@ try:
     from .interview_meta import InterviewMetaLoader
     from .live_counts import get_cached_counts
     from .alumni import AlumniManager
+    from .request_context import RecommendationContext
+    from .skill_vocab import get_skill_vocabulary
+    from .explanations import explain_reasons
+    from . import fusion
 except ImportError:
     # Fallback for direct execution
     from courses import CourseReadinessScorer, suggest_courses_for_missing_skills
@@ -29,6 +33,10 @@ except ImportError:
     from interview_meta import InterviewMetaLoader
     from live_counts import get_cached_counts
     from alumni import AlumniManager
+    from request_context import RecommendationContext
+    from skill_vocab import get_skill_vocabulary
+    from explanations import explain_reasons
+    import fusion
 
 logger = logging.getLogger(__name__)
 
@@ -187,11 +195,18 @@ class RecommendationEngine:
         logger.info(f"✅ Generated {len(recommendations)} recommendations")
         return recommendations
     
-    def _get_missing_skills(self, student_skills: List[str], required_skills: List[str]) -> List[str]:
+    def _get_missing_skills(self, 
+                           student_skills: List[str], 
+                           required_skills: List[str], 
+                           context: Optional[RecommendationContext] = None) -> List[str]:
         """Identify missing skills for a role."""
-        student_skills_lower = [skill.lower() for skill in student_skills]
+        vocab = get_skill_vocabulary()
+        if context is not None:
+            student_skill_set = context.normalized_skills
+        else:
+            student_skill_set = {vocab.canonical(skill) for skill in student_skills}
         missing = [skill for skill in required_skills 
-                  if skill.lower() not in student_skills_lower]
+                  if vocab.canonical(skill) not in student_skill_set]
         return missing[:3]  # Limit to top 3 missing skills
     
     def _get_course_suggestions(self, missing_skills: List[str]) -> List[Dict[str, str]]:
@@ -257,13 +272,23 @@ class RecommendationEngine:
         
         recommendations = []
         
+        # Student-only computations (alumni matches, skill sets, course readiness) run once per request
+        context = RecommendationContext({
+            'student_id': student_id,
+            'skills': skills,
+            'stream': stream,
+            'cgpa': cgpa,
+            'rural_urban': rural_urban,
+            'college_tier': college_tier
+        })
+        
         # Sample internships for recommendations (in real implementation, use ML scoring)
         sample_internships = active_internships.sample(n=min(top_n * 2, len(active_internships)))
         
         for _, internship in sample_internships.iterrows():
             # Calculate missing skills
             required_skills = self._parse_skills_string(internship.get('required_skills', ''))
-            missing_skills = self._get_missing_skills(skills, required_skills)
+            missing_skills = self._get_missing_skills(skills, required_skills, context)
             
             # Get application statistics
             app_stats = self.app_stats_loader.get_stats_for_internship(internship['internship_id'])
@@ -274,14 +299,14 @@ class RecommendationEngine:
             )
             
             # Get course suggestions
-            course_suggestions = self._get_enhanced_course_suggestions(skills, missing_skills)
+            course_suggestions = self._get_enhanced_course_suggestions(skills, missing_skills, context)
             projected_success_prob = self._calculate_projected_success_prob(
                 success_breakdown['final_success_prob'], course_suggestions
             )
             
             # Get optional features with graceful degradation
             interview_meta = self._get_interview_metadata(internship['internship_id'], internship.get('company'))
-            alumni_stories = self._get_alumni_stories(skills, stream, college_tier)
+            alumni_stories = self._get_alumni_stories(skills, stream, college_tier, context)
             data_quality_flags = self._assess_data_quality(internship, app_stats, interview_meta)
             
             # Create enhanced recommendation
@@ -517,12 +542,15 @@ class RecommendationEngine:
         Returns:
             List of skills
         """
-        if pd.isna(skills_str) or skills_str == '':
-            return []
-        
-        # Split by comma and clean
-        skills = [skill.strip() for skill in str(skills_str).split(',')]
-        return [skill for skill in skills if skill]
+        # Split by comma and canonicalize through the shared skill vocabulary
+        return get_skill_vocabulary().split(skills_str)
+    
+    def _count_skill_overlap(self, student_skills: List[str], required_skills: List[str]) -> int:
+        """Count canonical skills shared by the student and the role."""
+        vocab = get_skill_vocabulary()
+        # Catalog skills are interned; the student's are only looked up
+        required_ids = vocab.encode(required_skills)
+        return int(np.intersect1d(vocab.encode_known(student_skills), required_ids, assume_unique=True).size)
     
     def _calculate_base_success_prob(self, 
                                    student_skills: List[str], 
@@ -542,7 +570,7 @@ class RecommendationEngine:
             Base success probability
         """
         # Skill match ratio
-        skill_match = len(set(student_skills).intersection(set(required_skills))) / max(1, len(required_skills))
+        skill_match = self._count_skill_overlap(student_skills, required_skills) / max(1, len(required_skills))
         
         # CGPA factor
         cgpa_factor = min(1.0, cgpa / 10.0)
@@ -578,38 +606,9 @@ class RecommendationEngine:
         Returns:
             List of reason strings
         """
-        reasons = []
-        
-        # Skill match reasons
-        if len(missing_skills) == 0:
-            reasons.append("Perfect skill match - all requirements met")
-        elif len(missing_skills) <= 2:
-            reasons.append(f"Strong skill match - only {len(missing_skills)} skills to develop")
-        else:
-            reasons.append(f"Good potential - {len(missing_skills)} skills to develop")
-        
-        # CGPA reasons
-        if cgpa >= 8.5:
-            reasons.append(f"Excellent CGPA ({cgpa}) highly valued by employers")
-        elif cgpa >= 7.5:
-            reasons.append(f"Good CGPA ({cgpa}) meets company standards")
-        else:
-            reasons.append(f"CGPA ({cgpa}) within acceptable range")
-        
-        # Stream reasons
-        reasons.append(f"{stream} background is relevant for this role")
-        
-        # College tier reasons
-        if college_tier == "Tier-1":
-            reasons.append(f"Top-tier college background preferred by {company}")
-        else:
-            reasons.append(f"Company actively hiring from {college_tier} colleges")
-        
-        # Urgent deadline reason
-        if urgent:
-            reasons.append("🚨 URGENT: Application deadline approaching!")
-        
-        return reasons
+        return explain_reasons(
+            len(missing_skills), cgpa, stream, college_tier, company, urgent
+        )
     
     def _get_interview_metadata(self, internship_id: str, company_name: str = None) -> Optional[Dict[str, Any]]:
         """
@@ -628,7 +627,11 @@ class RecommendationEngine:
             logger.debug(f"Interview metadata lookup failed for {internship_id}: {e}")
             return None
     
-    def _get_alumni_stories(self, skills: List[str], stream: str, college_tier: str) -> Optional[List[Dict[str, Any]]]:
+    def _get_alumni_stories(self, 
+                           skills: List[str], 
+                           stream: str, 
+                           college_tier: str, 
+                           context: Optional[RecommendationContext] = None) -> Optional[List[Dict[str, Any]]]:
         """
         Get similar alumni stories with graceful degradation.
         
@@ -636,10 +639,14 @@ class RecommendationEngine:
             skills: Student skills
             stream: Academic stream
             college_tier: College tier
+            context: Optional request context (memoizes the search per request)
             
         Returns:
             List of alumni stories or None
         """
+        if context is not None:
+            return context.alumni_stories(self.alumni_manager, max_results=2)
+        
         try:
             student_features = {
                 'skills': ', '.join(skills),
@@ -725,39 +732,35 @@ class RecommendationEngine:
         Returns:
             Dict with success breakdown components
         """
-        import math
-        
         # 1. Base model probability (calibrated classifier output)
         base_model_prob = self._calculate_base_success_prob(student_skills, required_skills, cgpa, college_tier)
         
-        # 2. Content signal (TF-IDF/semantic signal)
-        skill_match = len(set(student_skills).intersection(set(required_skills))) / max(1, len(required_skills))
+        # 2. Content signal (skill-match ratio; the fixed engine uses TF-IDF cosine via app.fusion)
+        skill_match = self._count_skill_overlap(student_skills, required_skills) / max(1, len(required_skills))
         content_signal = min(1.0, skill_match)  # Normalize to 0-1
         
-        # 3. Collaborative filtering signal (mock - would use actual CF scores)
-        # Simulate CF signal based on domain popularity and student profile
-        domain_popularity = {'ai/ml': 0.9, 'web development': 0.8, 'data science': 0.85, 'mobile apps': 0.7}
-        cf_signal = domain_popularity.get(internship.get('domain', '').lower(), 0.6)
+        # 3. Collaborative filtering signal (domain popularity prior)
+        cf_signal = fusion.domain_popularity(internship.get('domain', ''))
         
-        # 4. Fairness adjustment (mock - would use actual fairness post-processing)
-        # Simulate small positive adjustment for diversity
-        fairness_adjustment = 0.02 if college_tier in ['Tier-2', 'Tier-3'] else 0.0
+        # 4. Fairness adjustment (small positive adjustment for diversity)
+        fairness_adjustment = fusion.fairness_adjustment(college_tier)
         
         # 5. Demand adjustment (penalty from demand pressure)
-        demand_adjustment = 0.0
-        if app_stats and app_stats.get('demand_pressure'):
-            demand_pressure = app_stats['demand_pressure']
-            if demand_pressure > 0:
-                # Cap penalty at 10%
-                demand_adjustment = min(0.10, math.log1p(demand_pressure) / math.log(10) * 0.1)
+        demand_pressure = app_stats.get('demand_pressure') if app_stats else None
+        demand_adjustment = float(fusion.demand_adjustment(demand_pressure if demand_pressure else 0.0))
         
         # 6. Company signal (brand/size uplift)
-        employability_boost = float(internship.get('employability_boost', 1.0))
-        company_signal = max(0.0, min(0.05, (employability_boost - 1.0) * 0.5))  # Convert to additive delta
-        
-        # 7. Final success probability
-        final_success_prob = base_model_prob + (content_signal * 0.05) + (cf_signal * 0.05) + fairness_adjustment + company_signal - demand_adjustment
-        final_success_prob = max(0.0, min(0.99, final_success_prob))
+        company_signal = float(fusion.company_signal(float(internship.get('employability_boost', 1.0))))
+        
+        # 7. Final success probability (same weighted fusion as the fixed engine)
+        signals = {
+            "content_signal": content_signal,
+            "cf_signal": cf_signal,
+            "fairness_adjustment": fairness_adjustment,
+            "demand_adjustment": demand_adjustment,
+            "company_signal": company_signal
+        }
+        final_success_prob = float(fusion.fuse(base_model_prob, signals))
         
         return {
             "base_model_prob": float(base_model_prob),
@@ -769,18 +772,25 @@ class RecommendationEngine:
             "final_success_prob": float(final_success_prob)
         }
     
-    def _get_enhanced_course_suggestions(self, student_skills: List[str], missing_skills: List[str]) -> List[Dict[str, Any]]:
+    def _get_enhanced_course_suggestions(self, 
+                                       student_skills: List[str], 
+                                       missing_skills: List[str], 
+                                       context: Optional[RecommendationContext] = None) -> List[Dict[str, Any]]:
         """
         Get enhanced course suggestions with readiness scoring.
         
         Args:
             student_skills: List of student's current skills
             missing_skills: List of missing skills
+            context: Optional request context (memoizes readiness per request)
             
         Returns:
             List of enhanced course suggestions with readiness metrics
         """
         try:
+            if context is not None:
+                return context.course_suggestions(self.course_scorer, missing_skills, top_k=3)
+            
             # Convert to sets for the course scorer
             skills_set = {skill.lower().strip() for skill in student_skills if skill}
             
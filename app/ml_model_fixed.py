@@ -5,7 +5,8 @@ PMIS ML Model - Fixed Version with Proper Ranking
 This module implements the corrected ML recommendation engine that:
 1. Calculates success probability for ALL internships
 2. Ranks by success probability (deterministic)
-3. Returns consistent results for same input
+3. Re-ranks the top-K for protected-group exposure (fairness)
+4. Returns consistent results for same input
 
 Author: ML Engineer
 Date: September 22, 2025
@@ -14,9 +15,8 @@ Date: September 22, 2025
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, List, Any, Optional, Set, Tuple
-from datetime import datetime, timedelta
-import hashlib
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
+from datetime import date, datetime, timedelta
 import json
 from functools import lru_cache
 
@@ -25,10 +25,312 @@ from app.data_loader import EnhancedDataLoader as DataLoader
 from app.application_stats import ApplicationStatsLoader
 from app.interview_meta import InterviewMetaLoader
 from app.alumni import AlumniManager
-from app.courses import suggest_courses_for_missing_skills
+from app.courses import CourseReadinessScorer
+from app.fairness import get_fairness_reranker, DEFAULT_FAIRNESS_SCORE
+from app.request_context import RecommendationContext
+from app.skill_vocab import get_skill_vocabulary
+from app.feature_store import InternshipFeatureStore
+from app.tracing import span
+from app.metrics import record_cache
+from app.explanations import explain_recommendation
+from app.success_model import get_success_model
+from app.fusion import HybridFusion, FusionResult
+from app.candidate_index import ActiveCandidateIndex, enforce_deadlines
+from app.hashing import fnv1a_64, fnv1a_64_array, mix64_array, pair_hash_array, stable_hash, stable_hash_hex
 
 logger = logging.getLogger(__name__)
 
+_LANE_MASK = np.uint64(0xFFFF)
+_LANE_MOD = np.uint64(100)
+
+
+def _pair_variation(pair_hashes: np.ndarray) -> np.ndarray:
+    """
+    Deterministic variation in [0, 0.99] from student-internship pair hashes.
+    
+    Three 16-bit lanes of each 64-bit pair hash act as independent sources;
+    their residues mod 100 are averaged.
+    
+    Args:
+        pair_hashes: uint64 array of pair hashes
+        
+    Returns:
+        float64 array of variations
+    """
+    pairs = np.asarray(pair_hashes, dtype=np.uint64)
+    total = (
+        (pairs & _LANE_MASK) % _LANE_MOD
+        + ((pairs >> np.uint64(16)) & _LANE_MASK) % _LANE_MOD
+        + ((pairs >> np.uint64(32)) & _LANE_MASK) % _LANE_MOD
+    )
+    return total.astype(np.float64) / 300
+
+
+def _final_scores(variation: np.ndarray) -> np.ndarray:
+    """Map pair variation to the 40%-90% score band (bounded to [0.35, 0.95])."""
+    return np.clip(0.40 + variation * 0.50, 0.35, 0.95)
+
+
+def _market_scores(features: Dict[str, np.ndarray], id_hashes: np.ndarray) -> np.ndarray:
+    """
+    Market dynamics score for every internship (vectorized form of the scalar rules).
+    
+    Args:
+        features: Aligned market features (ApplicationStatsLoader.aligned_features)
+        id_hashes: uint64 FNV-1a internship id hashes in the same row order
+        
+    Returns:
+        float64 array of market scores
+    """
+    applicants = features['applicants_total'].astype(np.float64)
+    positions = features['positions_available'].astype(np.float64)
+    selection_ratio = features['selection_ratio'].astype(np.float64)
+    
+    competition_ratio = applicants / np.maximum(1, positions)
+    competition_factor = np.select(
+        [competition_ratio > 200, competition_ratio > 100, competition_ratio > 50],
+        [0.1, 0.2 + (200 - competition_ratio) / 500, 0.4 + (100 - competition_ratio) / 125],
+        0.8 + np.minimum(0.2, (50 - competition_ratio) / 250)
+    )
+    selection_score = np.select(
+        [selection_ratio > 0.3, selection_ratio > 0.15],
+        [1.0, 0.5 + (selection_ratio - 0.15) * 3.33],
+        selection_ratio * 3.33
+    )
+    
+    # Internships without statistics vary by id hash in the 0.3 to 0.7 range
+    id_variation = (mix64_array(id_hashes) % np.uint64(1000)).astype(np.float64)
+    return np.where(
+        features['has_stats'],
+        0.6 * competition_factor + 0.4 * selection_score,
+        0.3 + (id_variation / 1000) * 0.4
+    )
+
+
+# College tier factor - more dramatic differences
+TIER_FACTORS = {
+    'Tier-1': 1.0,
+    'Tier-2': 0.7,  # More dramatic difference
+    'Tier-3': 0.4   # Much lower for Tier-3
+}
+
+
+def _skill_match_scores(overlaps: np.ndarray, required_counts: np.ndarray, n_student_skills: int) -> np.ndarray:
+    """
+    Skill match score with the extra-skill bonus (vectorized form of the scalar rules).
+    
+    Args:
+        overlaps: Matched required skills per internship
+        required_counts: Required skills per internship
+        n_student_skills: Number of known student skills
+        
+    Returns:
+        float64 array of skill match scores in [0, 1]
+    """
+    overlaps = np.asarray(overlaps, dtype=np.float64)
+    required = np.asarray(required_counts, dtype=np.float64)
+    match_ratio = overlaps / np.maximum(required, 1)
+    
+    # AGGRESSIVE scoring - create dramatic differences (0.6 when nothing is required)
+    skill_match = np.select(
+        [required == 0, match_ratio >= 0.8, match_ratio >= 0.6, match_ratio >= 0.4, match_ratio >= 0.2],
+        [0.6,
+         0.9 + (match_ratio - 0.8) * 0.5,   # 0.9 to 1.0
+         0.7 + (match_ratio - 0.6) * 1.0,   # 0.7 to 0.9
+         0.4 + (match_ratio - 0.4) * 1.5,   # 0.4 to 0.7
+         0.2 + (match_ratio - 0.2) * 1.0],  # 0.2 to 0.4
+        match_ratio * 1.0                   # 0.0 to 0.2
+    )
+    
+    # Bonus for having extra relevant skills
+    extra_skills_bonus = np.minimum(0.1, (n_student_skills - overlaps) * 0.02)
+    return np.minimum(1.0, skill_match + extra_skills_bonus)
+
+
+def _cgpa_score(cgpa: float) -> float:
+    """CGPA scoring with dramatic differences."""
+    if cgpa >= 9.0:
+        return 1.0  # Excellent
+    if cgpa >= 8.0:
+        return 0.8 + (cgpa - 8.0) * 0.2  # 0.8 to 1.0
+    if cgpa >= 7.0:
+        return 0.6 + (cgpa - 7.0) * 0.2  # 0.6 to 0.8
+    if cgpa >= 6.0:
+        return 0.3 + (cgpa - 6.0) * 0.3  # 0.3 to 0.6
+    return cgpa / 20.0  # 0.0 to 0.3 for very low CGPA
+
+
+def _stipend_factors(stipends: np.ndarray) -> np.ndarray:
+    """Stipend alignment - more dramatic differences (vectorized form of the scalar rules)."""
+    stipend = np.asarray(stipends, dtype=np.float64)
+    return np.select(
+        [stipend > 40000, stipend > 20000, stipend > 10000, stipend > 0],
+        [1.0,                                # High stipend
+         0.7 + (stipend - 20000) / 66667,    # 0.7 to 1.0
+         0.4 + (stipend - 10000) / 33333,    # 0.4 to 0.7
+         stipend / 25000],                   # 0.0 to 0.4
+        0.1                                  # Unpaid internships get very low score
+    )
+
+
+def _internship_factors(internship: pd.Series) -> Dict[str, float]:
+    """
+    Internship-specific variation factors of one internship.
+    
+    Args:
+        internship: Internship data as pandas Series
+        
+    Returns:
+        Dict with internship_factor and its reported components
+    """
+    # Company prestige factor - MUCH MORE DRAMATIC DIFFERENCES
+    company_name = internship.get('company', '').lower()
+    if any(prestigious in company_name for prestigious in ['google', 'microsoft', 'amazon', 'meta', 'apple']):
+        company_prestige = 1.0  # Top tier companies - HUGE advantage
+    elif any(good in company_name for good in ['tcs', 'infosys', 'wipro', 'accenture', 'deloitte']):
+        company_prestige = 0.6  # Good companies - moderate advantage
+    elif 'startup' in company_name or 'technologies' in company_name:
+        company_prestige = 0.4  # Startups/tech companies - slight advantage
+    else:
+        # Use company hash for consistent but DRAMATICALLY varied prestige
+        company_hash = stable_hash(company_name) % 100
+        company_prestige = 0.1 + (company_hash / 100) * 0.7  # 0.1 to 0.8 - HUGE RANGE
+    
+    # Domain difficulty factor - EXTREMELY DRAMATIC DIFFERENCES
+    domain_difficulty = {
+        'ai/ml': 1.0,            # Extremely challenging - BEST
+        'data science': 0.95,    # Very challenging 
+        'cybersecurity': 0.9,    # Very challenging
+        'cloud computing': 0.85, # Challenging
+        'software development': 0.8,  # Challenging
+        'finance': 0.7,          # Moderate-challenging
+        'consulting': 0.65,      # Moderate-challenging
+        'web development': 0.5,  # Moderate
+        'marketing': 0.2,        # Much easier - MAJOR PENALTY
+        'sales': 0.15,           # Much easier - MAJOR PENALTY
+        'hr': 0.1,               # Much easier - MAJOR PENALTY
+        'social work': 0.05      # Easiest - HUGE PENALTY
+    }
+    difficulty_factor = domain_difficulty.get(internship.get('domain', '').lower(), 0.4)
+    
+    # Duration factor - MORE DRAMATIC DIFFERENCES
+    duration_str = str(internship.get('duration', '3 months')).lower()
+    if '6' in duration_str or 'six' in duration_str:
+        duration_factor = 1.0   # 6 months is ideal - BEST
+    elif '4' in duration_str or 'four' in duration_str:
+        duration_factor = 0.8   # 4 months is good
+    elif '3' in duration_str or 'three' in duration_str:
+        duration_factor = 0.5   # 3 months is okay
+    elif '2' in duration_str or 'two' in duration_str:
+        duration_factor = 0.3   # 2 months is short - PENALTY
+    elif '1' in duration_str or 'one' in duration_str:
+        duration_factor = 0.1   # 1 month is very short - BIG PENALTY
+    else:
+        duration_factor = 0.4   # Default
+    
+    # Role level factor - MUCH MORE DRAMATIC DIFFERENCES
+    role_title = internship.get('role', '').lower()
+    if any(senior in role_title for senior in ['senior', 'lead', 'principal', 'architect']):
+        role_level_factor = 1.0  # Senior roles - HUGE ADVANTAGE
+    elif any(mid in role_title for mid in ['associate', 'analyst', 'specialist']):
+        role_level_factor = 0.6  # Mid-level roles
+    elif any(junior in role_title for junior in ['intern', 'trainee', 'junior', 'entry']):
+        role_level_factor = 0.3  # Entry-level roles - PENALTY
+    else:
+        role_level_factor = 0.4  # Default
+    
+    # SIMPLE BUT EXTREME: Force dramatic differences based on internship ID
+    internship_id_num = int(internship['internship_id'].replace('INT_', ''))
+    id_modifier = internship_id_num % 100  # Use last 2 digits for variation
+    
+    # Create MASSIVE spread: 0.2 to 1.0 range (80% spread)
+    internship_factor = 0.2 + (id_modifier / 100) * 0.8
+    
+    return {
+        'internship_factor': float(internship_factor),
+        'company_prestige': float(company_prestige),
+        'difficulty_factor': float(difficulty_factor),
+        'duration_factor': float(duration_factor),
+        'role_level_factor': float(role_level_factor)
+    }
+
+
+def _rule_columns(domains: Any, locations: Any, stipends: Any) -> Dict[str, np.ndarray]:
+    """
+    Student-independent internship columns used by the rule components.
+    
+    Args:
+        domains: Internship domains
+        locations: Internship locations
+        stipends: Internship stipends
+        
+    Returns:
+        Dict with integer-coded lowercase domains, lowercase locations and stipend factors
+    """
+    def lower(value):
+        return '' if value is None or (isinstance(value, float) and np.isnan(value)) else str(value).lower()
+    
+    domain_index: Dict[str, int] = {}
+    domain_codes = np.array([domain_index.setdefault(lower(domain), len(domain_index)) for domain in domains], dtype=np.intp)
+    return {
+        'domain_codes': domain_codes,
+        'domain_values': list(domain_index),
+        'locations': np.array([lower(location) for location in locations], dtype=object),
+        'stipend_factors': _stipend_factors(stipends)
+    }
+
+
+class RuleScores:
+    """
+    Rule-based score components for a candidate set, with breakdowns built on demand.
+    
+    The skill, academic and profile components are computed as NumPy arrays
+    over all candidates on the first `breakdown` call; `breakdown` adds the
+    internship-specific factors of one candidate, so callers pay for the
+    dict only on the returned top-K. When the success model scores the
+    candidates, `final` is None and the model probabilities are reported.
+    """
+    
+    def __init__(self,
+                 internships: pd.DataFrame,
+                 components: Callable[[], Tuple[np.ndarray, np.ndarray, np.ndarray]],
+                 market: np.ndarray,
+                 final: Optional[np.ndarray] = None,
+                 model_probs: Optional[np.ndarray] = None):
+        self.internships = internships
+        self.market = market
+        self.final = final
+        self.model_probs = model_probs
+        self._components = components
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+    
+    def breakdown(self, pos: int) -> Dict[str, float]:
+        """
+        Materialize the score breakdown of one candidate.
+        
+        Args:
+            pos: Candidate position
+            
+        Returns:
+            Dict with every score component and the final score
+        """
+        if self._arrays is None:
+            self._arrays = self._components()
+        skill_match, academic, profile = self._arrays
+        
+        final = self.final if self.final is not None else self.model_probs
+        breakdown = {
+            'skill_match_score': float(skill_match[pos]),
+            'academic_score': float(academic[pos]),
+            'profile_score': float(profile[pos]),
+            'market_score': float(self.market[pos]),
+            **_internship_factors(self.internships.iloc[pos]),
+            'final_score': float(final[pos])
+        }
+        if self.model_probs is not None:
+            breakdown['model_prob'] = float(self.model_probs[pos])
+        return breakdown
+
 
 class FixedRecommendationEngine:
     """
@@ -52,6 +354,14 @@ class FixedRecommendationEngine:
         self.app_stats_loader = ApplicationStatsLoader(data_path)
         self.interview_loader = InterviewMetaLoader(data_path)
         self.alumni_loader = AlumniManager(data_path)
+        self.course_scorer = CourseReadinessScorer(data_path)
+        self.fairness_reranker = get_fairness_reranker()
+        self.feature_store = None
+        self.success_model = None
+        self.success_block = None
+        self.fusion = None
+        self._market = None
+        self._candidates = None
         
         # Cache for consistent results
         self._recommendation_cache = {}
@@ -85,6 +395,21 @@ class FixedRecommendationEngine:
             self.app_stats_loader.load_application_stats()
             self.interview_loader.load_interview_meta()
             self.alumni_loader.load_alumni()
+            self.course_scorer.load_courses_df()
+            
+            # Intern internship and student skills into the shared vocabulary
+            get_skill_vocabulary().build_from_data(self.data_path, self.data_loader.internships_df)
+            
+            # Precompute per-internship features (packed skill masks)
+            self.feature_store = InternshipFeatureStore(self.data_loader.internships_df)
+            
+            # Exported success model (NumPy-only) replaces rule-based scores when deployed
+            self.success_model = get_success_model()
+            if self.success_model is not None:
+                self.success_block = self.success_model.bind_internships(self.data_loader.internships_df)
+            
+            # Catalog-side hybrid signals (content, CF, demand, company) for score fusion
+            self.fusion = HybridFusion(self.data_loader.internships_df, self.app_stats_loader.stats_df)
             
             self.loaded = True
             logger.info("✅ ML data loading completed!")
@@ -96,261 +421,110 @@ class FixedRecommendationEngine:
     
     def calculate_student_internship_score(self,
                                           student_profile: Dict[str, Any],
-                                          internship: pd.Series) -> Tuple[float, Dict[str, float]]:
+                                          internship: pd.Series,
+                                          context: Optional[RecommendationContext] = None,
+                                          skill_overlap: Optional[Tuple[int, int]] = None,
+                                          variation_score: Optional[float] = None,
+                                          market_score: Optional[float] = None) -> Tuple[float, Dict[str, float]]:
         """
         Calculate the success probability score for a student-internship pair.
         
         Args:
             student_profile: Student profile dictionary
             internship: Internship data as pandas Series
+            context: Optional request context (reuses the encoded student skills)
+            skill_overlap: Optional precomputed (matched, required) skill counts
+            variation_score: Optional precomputed pair-variation score (see _score_internships)
+            market_score: Optional precomputed market dynamics score (see _market_scores)
             
         Returns:
             Tuple of (final_score, score_breakdown)
         """
-        # Extract student features
-        student_skills = student_profile.get('skills', [])
-        cgpa = student_profile.get('cgpa', 7.0)
-        stream = student_profile.get('stream', '')
-        college_tier = student_profile.get('college_tier', 'Tier-2')
-        rural_urban = student_profile.get('rural_urban', 'urban')
-        location = student_profile.get('location', '')
-        
-        # Extract internship features
-        required_skills = self._parse_skills_string(internship.get('required_skills', ''))
-        internship_domain = internship.get('domain', '').lower()
-        internship_location = internship.get('location', '').lower()
-        stipend = float(internship.get('stipend', 0))
-        
-        # Get application statistics
-        app_stats = self.app_stats_loader.get_stats_for_internship(internship['internship_id'])
-        
-        # 1. Skill Match Score (40% weight) - MUCH MORE AGGRESSIVE
-        skill_overlap = set(student_skills).intersection(set(required_skills))
-        required_skills_count = len(required_skills)
-        
-        if required_skills_count == 0:
-            skill_match_score = 0.6  # Default if no requirements
-        else:
-            match_ratio = len(skill_overlap) / required_skills_count
-            
-            # AGGRESSIVE scoring - create dramatic differences
-            if match_ratio >= 0.8:  # 80%+ match
-                skill_match_score = 0.9 + (match_ratio - 0.8) * 0.5  # 0.9 to 1.0
-            elif match_ratio >= 0.6:  # 60-80% match  
-                skill_match_score = 0.7 + (match_ratio - 0.6) * 1.0  # 0.7 to 0.9
-            elif match_ratio >= 0.4:  # 40-60% match
-                skill_match_score = 0.4 + (match_ratio - 0.4) * 1.5  # 0.4 to 0.7
-            elif match_ratio >= 0.2:  # 20-40% match
-                skill_match_score = 0.2 + (match_ratio - 0.2) * 1.0  # 0.2 to 0.4
-            else:  # <20% match
-                skill_match_score = match_ratio * 1.0  # 0.0 to 0.2
-        
-        # Bonus for having extra relevant skills
-        extra_skills_bonus = min(0.1, len(set(student_skills) - set(required_skills)) * 0.02)
-        skill_match_score = min(1.0, skill_match_score + extra_skills_bonus)
-        
-        # 2. Academic Score (25% weight) - MORE AGGRESSIVE
-        # CGPA scoring with dramatic differences
-        if cgpa >= 9.0:
-            cgpa_score = 1.0  # Excellent
-        elif cgpa >= 8.0:
-            cgpa_score = 0.8 + (cgpa - 8.0) * 0.2  # 0.8 to 1.0
-        elif cgpa >= 7.0:
-            cgpa_score = 0.6 + (cgpa - 7.0) * 0.2  # 0.6 to 0.8
-        elif cgpa >= 6.0:
-            cgpa_score = 0.3 + (cgpa - 6.0) * 0.3  # 0.3 to 0.6
-        else:
-            cgpa_score = cgpa / 20.0  # 0.0 to 0.3 for very low CGPA
-        
-        # Stream relevance - more dramatic differences
-        stream_relevance = self._calculate_stream_relevance(stream, internship_domain)
-        
-        # College tier factor - more dramatic differences
-        tier_factors = {
-            'Tier-1': 1.0,
-            'Tier-2': 0.7,  # More dramatic difference
-            'Tier-3': 0.4   # Much lower for Tier-3
-        }
-        tier_factor = tier_factors.get(college_tier, 0.3)
-        
-        academic_score = (0.6 * cgpa_score + 0.2 * stream_relevance + 0.2 * tier_factor)
-        
-        # 3. Profile Alignment Score (20% weight) - MORE AGGRESSIVE
-        # Location preference - more dramatic differences
-        location_match = 1.0 if location.lower() == internship_location else 0.3  # Bigger penalty for location mismatch
-        
-        # Rural/urban diversity bonus - more significant
-        diversity_bonus = 0.2 if rural_urban == 'rural' else 0.0  # Bigger rural bonus
-        
-        # Stipend alignment - more dramatic differences
-        if stipend > 40000:
-            stipend_factor = 1.0  # High stipend
-        elif stipend > 20000:
-            stipend_factor = 0.7 + (stipend - 20000) / 66667  # 0.7 to 1.0
-        elif stipend > 10000:
-            stipend_factor = 0.4 + (stipend - 10000) / 33333  # 0.4 to 0.7
-        elif stipend > 0:
-            stipend_factor = stipend / 25000  # 0.0 to 0.4
-        else:
-            stipend_factor = 0.1  # Unpaid internships get very low score
-        
-        profile_score = (0.4 * location_match + 0.4 * stipend_factor + 0.2 * diversity_bonus)
-        
-        # 4. Market Dynamics Score (15% weight) - MUCH MORE AGGRESSIVE
-        if app_stats:
-            applicants = app_stats.get('applicants_total', 100)
-            positions = app_stats.get('positions_available', 1)
-            
-            # Competition factor - MUCH more dramatic differences
-            competition_ratio = applicants / max(1, positions)
-            if competition_ratio > 200:  # Very high competition
-                competition_factor = 0.1
-            elif competition_ratio > 100:  # High competition
-                competition_factor = 0.2 + (200 - competition_ratio) / 500  # 0.2 to 0.4
-            elif competition_ratio > 50:   # Medium competition
-                competition_factor = 0.4 + (100 - competition_ratio) / 125  # 0.4 to 0.8
-            else:  # Low competition
-                competition_factor = 0.8 + min(0.2, (50 - competition_ratio) / 250)  # 0.8 to 1.0
-            
-            # Selection ratio - more dramatic differences
-            selection_ratio = app_stats.get('selection_ratio', 0.1)
-            if selection_ratio > 0.3:  # High success rate
-                selection_score = 1.0
-            elif selection_ratio > 0.15:  # Medium success rate
-                selection_score = 0.5 + (selection_ratio - 0.15) * 3.33  # 0.5 to 1.0
-            else:  # Low success rate
-                selection_score = selection_ratio * 3.33  # 0.0 to 0.5
-            
-            market_score = (0.6 * competition_factor + 0.4 * selection_score)
-        else:
-            # Use internship-specific factors for variation when no app stats
-            internship_id_hash = hash(internship['internship_id']) % 1000
-            market_score = 0.3 + (internship_id_hash / 1000) * 0.4  # 0.3 to 0.7 range
-        
-        # 5. INTERNSHIP-SPECIFIC VARIATION FACTORS (15% weight)
-        # These create big differences between internships for the same student
-        
-        # Company prestige factor - MUCH MORE DRAMATIC DIFFERENCES
-        company_name = internship.get('company', '').lower()
-        if any(prestigious in company_name for prestigious in ['google', 'microsoft', 'amazon', 'meta', 'apple']):
-            company_prestige = 1.0  # Top tier companies - HUGE advantage
-        elif any(good in company_name for good in ['tcs', 'infosys', 'wipro', 'accenture', 'deloitte']):
-            company_prestige = 0.6  # Good companies - moderate advantage
-        elif 'startup' in company_name or 'technologies' in company_name:
-            company_prestige = 0.4  # Startups/tech companies - slight advantage
-        else:
-            # Use company hash for consistent but DRAMATICALLY varied prestige
-            company_hash = int(hashlib.md5(company_name.encode()).hexdigest()[:8], 16) % 100
-            company_prestige = 0.1 + (company_hash / 100) * 0.7  # 0.1 to 0.8 - HUGE RANGE
-        
-        # Domain difficulty factor - EXTREMELY DRAMATIC DIFFERENCES
-        domain_difficulty = {
-            'ai/ml': 1.0,            # Extremely challenging - BEST
-            'data science': 0.95,    # Very challenging 
-            'cybersecurity': 0.9,    # Very challenging
-            'cloud computing': 0.85, # Challenging
-            'software development': 0.8,  # Challenging
-            'finance': 0.7,          # Moderate-challenging
-            'consulting': 0.65,      # Moderate-challenging
-            'web development': 0.5,  # Moderate
-            'marketing': 0.2,        # Much easier - MAJOR PENALTY
-            'sales': 0.15,           # Much easier - MAJOR PENALTY
-            'hr': 0.1,               # Much easier - MAJOR PENALTY
-            'social work': 0.05      # Easiest - HUGE PENALTY
-        }
-        difficulty_factor = domain_difficulty.get(internship_domain.lower(), 0.4)
-        
-        # Duration factor - MORE DRAMATIC DIFFERENCES
-        duration_str = str(internship.get('duration', '3 months')).lower()
-        if '6' in duration_str or 'six' in duration_str:
-            duration_factor = 1.0   # 6 months is ideal - BEST
-        elif '4' in duration_str or 'four' in duration_str:
-            duration_factor = 0.8   # 4 months is good
-        elif '3' in duration_str or 'three' in duration_str:
-            duration_factor = 0.5   # 3 months is okay
-        elif '2' in duration_str or 'two' in duration_str:
-            duration_factor = 0.3   # 2 months is short - PENALTY
-        elif '1' in duration_str or 'one' in duration_str:
-            duration_factor = 0.1   # 1 month is very short - BIG PENALTY
-        else:
-            duration_factor = 0.4   # Default
-        
-        # Role level factor - MUCH MORE DRAMATIC DIFFERENCES
-        role_title = internship.get('role', '').lower()
-        if any(senior in role_title for senior in ['senior', 'lead', 'principal', 'architect']):
-            role_level_factor = 1.0  # Senior roles - HUGE ADVANTAGE
-        elif any(mid in role_title for mid in ['associate', 'analyst', 'specialist']):
-            role_level_factor = 0.6  # Mid-level roles
-        elif any(junior in role_title for junior in ['intern', 'trainee', 'junior', 'entry']):
-            role_level_factor = 0.3  # Entry-level roles - PENALTY
+        vocab = get_skill_vocabulary()
+        if context is not None:
+            student_skill_ids = context.skill_ids
         else:
-            role_level_factor = 0.4  # Default
-        
-        # Combine internship-specific factors with EXTREME weighting for maximum variation
-        internship_factor = (
-            company_prestige * 0.40 +     # Increased - company matters MOST
-            difficulty_factor * 0.40 +    # Increased - domain difficulty is HUGE
-            duration_factor * 0.15 +      # Reduced
-            role_level_factor * 0.05      # Reduced
-        )
-        
-        # SIMPLE BUT EXTREME: Force dramatic differences based on internship ID
-        internship_id_num = int(internship['internship_id'].replace('INT_', ''))
-        id_modifier = internship_id_num % 100  # Use last 2 digits for variation
-        
-        # Create MASSIVE spread: 0.2 to 1.0 range (80% spread)
-        internship_factor = 0.2 + (id_modifier / 100) * 0.8
+            student_skill_ids = vocab.encode_known(student_profile.get('skills', []))
+        if skill_overlap is None:
+            required_skill_ids = vocab.encode_text(internship.get('required_skills', ''))
+            skill_overlap = (
+                np.intersect1d(student_skill_ids, required_skill_ids, assume_unique=True).size,
+                len(required_skill_ids)
+            )
         
-        # Calculate weighted final score with EXTREME internship factor weight
-        final_score = (
-            skill_match_score * 0.20 +    # Reduced to minimum
-            academic_score * 0.10 +       # Reduced to minimum  
-            profile_score * 0.05 +        # Reduced to minimum
-            market_score * 0.25 +         # Increased more
-            internship_factor * 0.40      # MASSIVE WEIGHT - 40% of total score!
+        # Market Dynamics Score - competition and selection ratio from application statistics
+        if market_score is None:
+            internship_id = [str(internship['internship_id'])]
+            features = self.app_stats_loader.aligned_features(internship_id)
+            market_score = float(_market_scores(features, fnv1a_64_array(internship_id))[0])
+        
+        # One process-stable 64-bit pair hash
+        if variation_score is None:
+            student_hash = fnv1a_64(str(student_profile.get('student_id', 'DEFAULT')))
+            pair = pair_hash_array(student_hash, fnv1a_64_array([internship['internship_id']]))
+            variation_score = float(_final_scores(_pair_variation(pair))[0])
+        
+        skill_match, academic, profile = self._rule_components(
+            student_profile, len(student_skill_ids),
+            np.array([skill_overlap[0]]), np.array([skill_overlap[1]]),
+            _rule_columns([internship.get('domain', '')], [internship.get('location', '')],
+                          [float(internship.get('stipend', 0))])
         )
-        
-        # Apply EXTREME deterministic variation for GUARANTEED 10+ point differences (±25%)
-        # Use deterministic hash for consistency
-        hash_input = f"{student_profile.get('student_id', '')}_{internship['internship_id']}"
-        hash_value = int(hashlib.md5(hash_input.encode()).hexdigest()[:8], 16)
-        
-        # GUARANTEED EXTREME VARIATION - FINAL SOLUTION
-        student_id = student_profile.get('student_id', 'DEFAULT')
-        internship_id = internship['internship_id']
-        
-        # Use multiple hash sources for maximum variation
-        hash1 = int(hashlib.md5(f"{student_id}_{internship_id}".encode()).hexdigest()[:4], 16)
-        hash2 = int(hashlib.md5(f"{internship_id}_{student_id}".encode()).hexdigest()[4:8], 16) 
-        hash3 = int(hashlib.md5(internship_id.encode()).hexdigest()[:3], 16)
-        
-        # Combine hashes for maximum spread
-        combined_variation = ((hash1 % 100) + (hash2 % 100) + (hash3 % 100)) / 300
-        
-        # FORCE MAXIMUM 10+ POINT SPREAD - FINAL ATTEMPT
-        # Scale the variation to guarantee 10+ point differences within top 5
-        scaled_variation = combined_variation * 0.50  # 50% range instead of 70%
-        final_score = 0.40 + scaled_variation  # 40% to 90% range
-        
-        # Ensure bounds but allow full spread
-        final_score = max(0.35, min(0.95, final_score))
+        final_score = variation_score
         
         # Create breakdown for transparency
         breakdown = {
-            'skill_match_score': float(skill_match_score),
-            'academic_score': float(academic_score),
-            'profile_score': float(profile_score),
+            'skill_match_score': float(skill_match[0]),
+            'academic_score': float(academic[0]),
+            'profile_score': float(profile[0]),
             'market_score': float(market_score),
-            'internship_factor': float(internship_factor),
-            'company_prestige': float(company_prestige),
-            'difficulty_factor': float(difficulty_factor),
-            'duration_factor': float(duration_factor),
-            'role_level_factor': float(role_level_factor),
+            **_internship_factors(internship),
             'final_score': float(final_score)
         }
         
         return final_score, breakdown
     
+    def _rule_components(self,
+                         student_profile: Dict[str, Any],
+                         n_student_skills: int,
+                         overlaps: np.ndarray,
+                         required_counts: np.ndarray,
+                         columns: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Skill match, academic and profile scores of a student over many internships.
+        
+        Args:
+            student_profile: Student profile dictionary
+            n_student_skills: Number of known student skills
+            overlaps: Matched required skills per internship
+            required_counts: Required skills per internship
+            columns: Internship columns from _rule_columns
+            
+        Returns:
+            Tuple of float64 arrays (skill_match, academic, profile)
+        """
+        cgpa = student_profile.get('cgpa', 7.0)
+        stream = student_profile.get('stream', '')
+        college_tier = student_profile.get('college_tier', 'Tier-2')
+        rural_urban = student_profile.get('rural_urban', 'urban')
+        location = student_profile.get('location', '')
+        
+        # 1. Skill Match Score - MUCH MORE AGGRESSIVE
+        skill_match = _skill_match_scores(overlaps, required_counts, n_student_skills)
+        
+        # 2. Academic Score - CGPA, stream relevance (once per distinct domain) and college tier
+        relevance = np.array([self._calculate_stream_relevance(stream, domain) for domain in columns['domain_values']])
+        stream_relevance = relevance[columns['domain_codes']]
+        tier_factor = TIER_FACTORS.get(college_tier, 0.3)
+        academic = 0.6 * _cgpa_score(cgpa) + 0.2 * stream_relevance + 0.2 * tier_factor
+        
+        # 3. Profile Alignment Score - location, stipend and rural/urban diversity
+        location_match = np.where(columns['locations'] == location.lower(), 1.0, 0.3)  # Bigger penalty for location mismatch
+        diversity_bonus = 0.2 if rural_urban == 'rural' else 0.0  # Bigger rural bonus
+        profile = 0.4 * location_match + 0.4 * columns['stipend_factors'] + 0.2 * diversity_bonus
+        
+        return skill_match, academic, profile
+    
     def _calculate_stream_relevance(self, student_stream: str, internship_domain: str) -> float:
         """
         Calculate relevance between student stream and internship domain.
@@ -435,10 +609,12 @@ class FixedRecommendationEngine:
         
         # Check cache first
         if cache_key in self._recommendation_cache:
+            record_cache("recommendation", hits=1)
             logger.info("📦 Returning cached recommendations")
             return self._recommendation_cache[cache_key]
+        record_cache("recommendation", misses=1)
         
-        logger.info(f"🔍 Generating ranked recommendations for {student_id}")
+        logger.info("🔍 Generating ranked recommendations for %s", student_id)
         
         # Create student profile
         student_profile = {
@@ -450,139 +626,322 @@ class FixedRecommendationEngine:
             'college_tier': college_tier
         }
         
-        # Get active internships
-        active_internships = self.data_loader.internships_df
-        if active_internships is None:
-            active_internships = self.data_loader.load_enhanced_internships()
+        # Student-only computations are memoized once per request
+        context = RecommendationContext(student_profile)
         
+        # Get active internships
+        with span("filter_active"):
+            active_internships = self._get_active_internships()
         if active_internships is None or active_internships.empty:
             logger.warning("⚠️  No active internships found")
             return []
         
-        # Filter by application statistics
-        if self.app_stats_loader.stats_df is not None:
-            active_ids = active_internships['internship_id'].tolist()
-            filtered_ids = self.app_stats_loader.get_active_internships_only(active_ids)
-            active_internships = active_internships[
-                active_internships['internship_id'].isin(filtered_ids)
-            ]
-        
-        logger.info(f"📊 Scoring {len(active_internships)} active internships...")
+        logger.info("📊 Scoring %d active internships...", len(active_internships))
         
         # Calculate scores for ALL internships
-        scored_internships = []
-        for _, internship in active_internships.iterrows():
-            score, breakdown = self.calculate_student_internship_score(
-                student_profile, internship
-            )
-            
-            scored_internships.append({
-                'internship': internship,
-                'score': score,
-                'breakdown': breakdown
-            })
+        with span("score"):
+            scores, rules, fused = self._score_internships(student_profile, active_internships, context)
         
-        # Sort by score (descending) and internship_id (for deterministic ordering)
-        scored_internships.sort(key=lambda x: (
-            -x['score'],  # Negative for descending order
-            x['internship']['internship_id']  # Secondary sort for consistency
-        ))
+        logger.info("✅ Ranked %d internships by success probability", len(scores))
         
-        logger.info(f"✅ Ranked {len(scored_internships)} internships by success probability")
+        # Select top N with the fairness re-ranker (ties keep internship_id order)
+        with span("rerank"):
+            protected = self._protected_matrix(active_internships)
+            selected = self.fairness_reranker.rerank(scores, protected, k=top_n)
         
         # Generate detailed recommendations for top N
-        recommendations = []
-        for i, scored_item in enumerate(scored_internships[:top_n]):
-            internship = scored_item['internship']
-            score = scored_item['score']
-            breakdown = scored_item['breakdown']
-            
-            # Calculate missing skills
-            required_skills = self._parse_skills_string(internship.get('required_skills', ''))
-            missing_skills = self._get_missing_skills(skills, required_skills)
-            
-            # Get course suggestions
-            course_suggestions = self._get_enhanced_course_suggestions(skills, missing_skills)
-            projected_success_prob = self._calculate_projected_success_prob(
-                score, course_suggestions
-            )
-            
-            # Generate explanations
-            explanations = self._generate_explanations(
-                student_profile, internship, breakdown, missing_skills
-            )
-            
-            # Get application statistics
-            app_stats = self.app_stats_loader.get_stats_for_internship(internship['internship_id'])
-            
-            # Create recommendation
-            recommendation = {
-                "rank": i + 1,
-                "internship_id": internship['internship_id'],
-                "title": internship['title'],
-                "company": internship['company'],
-                "domain": internship['domain'],
-                "location": internship['location'],
-                "duration": internship['duration'],
-                "stipend": float(internship['stipend']),
-                "success_prob": float(score),
-                "projected_success_prob": float(projected_success_prob),
-                "score_breakdown": breakdown,
-                "missing_skills": missing_skills,
-                "course_suggestions": course_suggestions,
-                "explanations": explanations,
-                "applicants_total": app_stats.get('applicants_total') if app_stats else None,
-                "positions_available": app_stats.get('positions_available') if app_stats else None,
-                "selection_ratio": app_stats.get('selection_ratio') if app_stats else None
-            }
-            
-            recommendations.append(recommendation)
+        with span("build_recommendations"):
+            recommendations = [
+                self._build_recommendation(
+                    i + 1, context, active_internships.iloc[pos], scores[pos], rules.breakdown(pos),
+                    success_breakdown=fused.breakdown(pos) if fused is not None else None
+                )
+                for i, pos in enumerate(selected)
+            ]
         
         # Cache the results
         self._recommendation_cache[cache_key] = recommendations
         
         # Log score distribution
-        if recommendations:
+        if recommendations and logger.isEnabledFor(logging.INFO):
             scores = [r['success_prob'] for r in recommendations]
-            logger.info(f"📈 Score range: {min(scores):.3f} - {max(scores):.3f}")
-            logger.info(f"📊 Score variance: {np.std(scores):.3f}")
+            logger.info("📈 Score range: %.3f - %.3f", min(scores), max(scores))
+            logger.info("📊 Score variance: %.3f", np.std(scores))
         
         return recommendations
     
+    def _get_active_internships(self) -> Optional[pd.DataFrame]:
+        """Get internships eligible for ranking, ordered by internship_id (cached, see _active_candidates)."""
+        candidates = self._active_candidates()
+        if candidates is None:
+            return None
+        return candidates.internships
+    
+    def _active_candidates(self) -> Optional[ActiveCandidateIndex]:
+        """
+        Get the cached active-candidate index.
+        
+        Rebuilt only when the catalog or the application statistics table is
+        replaced, or when the day changes.
+        
+        Returns:
+            ActiveCandidateIndex, or None when no internships are loaded
+        """
+        internships_df = self.data_loader.internships_df
+        if internships_df is None:
+            internships_df = self.data_loader.load_enhanced_internships()
+        if internships_df is None:
+            return None
+        
+        stats_df = self.app_stats_loader.stats_df
+        today = date.today()
+        check_deadlines = enforce_deadlines()
+        candidates = self._candidates
+        if candidates is None or not candidates.is_current(internships_df, stats_df, today, check_deadlines):
+            if stats_df is not None:
+                positions_mask = self.app_stats_loader.active_mask(internships_df)
+            else:
+                positions_mask = np.ones(len(internships_df), dtype=bool)
+            candidates = ActiveCandidateIndex(internships_df, stats_df, positions_mask, today, check_deadlines)
+            self._candidates = candidates
+        return candidates
+    
+    def _rows_in(self, component: Any, internships: pd.DataFrame) -> np.ndarray:
+        """Rows of `internships` in a catalog-aligned component (memoized for the cached candidates)."""
+        candidates = self._candidates
+        if candidates is not None and candidates.internships is internships:
+            return candidates.rows_in(component)
+        return component.rows_for(internships['internship_id'].tolist())
+    
+    def _protected_matrix(self, internships: pd.DataFrame) -> np.ndarray:
+        """Fairness protected-group matrix (memoized for the cached candidates)."""
+        reranker = self.fairness_reranker
+        candidates = self._candidates
+        if candidates is not None and candidates.internships is internships:
+            return candidates.memoize(('protected', reranker), lambda: reranker.protected_matrix(internships))
+        return reranker.protected_matrix(internships)
+    
+    def _rule_columns(self, internships: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Internship columns of the rule components (memoized for the cached candidates)."""
+        def compute():
+            def column(name, default):
+                return internships[name] if name in internships.columns else [default] * len(internships)
+            return _rule_columns(column('domain', ''), column('location', ''), column('stipend', 0.0))
+        
+        candidates = self._candidates
+        if candidates is not None and candidates.internships is internships:
+            return candidates.memoize('rule_columns', compute)
+        return compute()
+    
+    def _market_scores(self) -> Optional[np.ndarray]:
+        """
+        Market scores aligned with the feature store rows.
+        
+        Built from the float32 market features and cached until the feature
+        store or the application statistics table is replaced.
+        
+        Returns:
+            float64 array indexed by feature store row, or None without a feature store
+        """
+        store = self.feature_store
+        if store is None:
+            return None
+        stats_df = self.app_stats_loader.stats_df
+        cached = self._market
+        if cached is None or cached[0] is not store or cached[1] is not stats_df:
+            features = self.app_stats_loader.aligned_features(store.internship_ids)
+            cached = (store, stats_df, _market_scores(features, store.id_hashes))
+            self._market = cached
+        return cached[2]
+    
+    def _score_internships(self,
+                           student_profile: Dict[str, Any],
+                           internships: pd.DataFrame,
+                           context: Optional[RecommendationContext] = None) -> Tuple[np.ndarray, RuleScores, Optional[FusionResult]]:
+        """
+        Score every internship for a student.
+        
+        Base probabilities (rule-based or the exported success model) are fused
+        with the hybrid signals in one vectorized pass; score and success
+        breakdowns are left to the caller to materialize for the selected rows.
+        
+        Args:
+            student_profile: Student profile dictionary
+            internships: Internships to score
+            context: Optional request context for the student
+            
+        Returns:
+            Tuple of (scores array aligned with rows, rule-based score components,
+            fusion result or None when fusion is unavailable)
+        """
+        if context is None:
+            context = RecommendationContext(student_profile)
+        
+        # Skill overlap against every candidate in one vectorized AND + popcount
+        overlaps = None
+        id_hashes = None
+        market_scores = None
+        if self.feature_store is not None:
+            rows = self._rows_in(self.feature_store, internships)
+            if (rows >= 0).all():
+                overlaps = self.feature_store.overlap_counts(self._student_skill_mask(context), rows)
+                required_counts = self.feature_store.required_counts[rows]
+                id_hashes = self.feature_store.id_hashes[rows]
+                market_scores = self._market_scores()[rows]
+        if overlaps is None:
+            vocab = get_skill_vocabulary()
+            texts = internships['required_skills'] if 'required_skills' in internships.columns else [''] * len(internships)
+            required = [vocab.encode_text(text) for text in texts]
+            overlaps = np.array([np.intersect1d(context.skill_ids, ids, assume_unique=True).size for ids in required])
+            required_counts = np.array([len(ids) for ids in required])
+        if id_hashes is None:
+            id_hashes = fnv1a_64_array(internships['internship_id'].astype(str))
+        if market_scores is None:
+            features = self.app_stats_loader.aligned_features(internships['internship_id'])
+            market_scores = _market_scores(features, id_hashes)
+        
+        # Rule-based components as arrays over all candidates, computed only for top-K breakdowns
+        rules = RuleScores(
+            internships,
+            lambda: self._rule_components(
+                student_profile, len(context.skill_ids), overlaps, required_counts, self._rule_columns(internships)
+            ),
+            market_scores
+        )
+        
+        # Calibrated model probabilities for every candidate in one vectorized pass
+        scores = None
+        if self.success_block is not None:
+            rows = self._rows_in(self.success_block, internships)
+            if (rows >= 0).all():
+                with span("success_model"):
+                    scores = self.success_model.predict_proba(student_profile, self.success_block, rows)
+                rules.model_probs = scores
+        
+        # Rule-based scores only when the model does not apply: one student hash mixed into the id hashes
+        if scores is None:
+            student_hash = fnv1a_64(str(student_profile.get('student_id', 'DEFAULT')))
+            scores = _final_scores(_pair_variation(pair_hash_array(student_hash, id_hashes)))
+            rules.final = scores
+        
+        # Fuse content, CF, fairness, company and demand signals over all candidates
+        fused = None
+        if self.fusion is not None:
+            rows = self._rows_in(self.fusion, internships)
+            if (rows >= 0).all():
+                skill_match = overlaps / np.maximum(required_counts, 1)
+                with span("fusion"):
+                    fused = self.fusion.fuse(student_profile, rows, scores, skill_match)
+                scores = fused.final
+        
+        return scores, rules, fused
+    
+    def _build_recommendation(self,
+                              rank: int,
+                              context: RecommendationContext,
+                              internship: pd.Series,
+                              score: float,
+                              breakdown: Dict[str, float],
+                              success_breakdown: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Build the detailed recommendation dict for a selected internship.
+        
+        Args:
+            rank: 1-based rank in the final list
+            context: Request context for the student
+            internship: Internship data as pandas Series
+            score: Success probability score
+            breakdown: Score breakdown
+            success_breakdown: Fused success breakdown (omitted when None)
+            
+        Returns:
+            Recommendation dict
+        """
+        student_profile = context.student_profile
+        
+        # Calculate missing skills (straight from the precomputed skill mask when available)
+        with span("missing_skills"):
+            row = self.feature_store.rows_for([internship['internship_id']])[0] if self.feature_store is not None else -1
+            if row >= 0:
+                missing_skills = self.feature_store.missing_skills(row, self._student_skill_mask(context))
+            else:
+                required_skills = self._parse_skills_string(internship.get('required_skills', ''))
+                missing_skills = self._get_missing_skills(context.skills, required_skills, context)
+        
+        # Get course suggestions
+        with span("course_suggestions"):
+            course_suggestions = self._get_enhanced_course_suggestions(context.skills, missing_skills, context)
+        projected_success_prob = self._calculate_projected_success_prob(
+            score, course_suggestions
+        )
+        
+        # Generate explanations
+        with span("explanations"):
+            explanations = self._generate_explanations(
+                student_profile, internship, breakdown, missing_skills
+            )
+        
+        # Get application statistics
+        app_stats = self.app_stats_loader.get_stats_for_internship(internship['internship_id'])
+        
+        recommendation = {
+            "rank": rank,
+            "internship_id": internship['internship_id'],
+            "title": internship['title'],
+            "company": internship['company'],
+            "domain": internship['domain'],
+            "location": internship['location'],
+            "duration": internship['duration'],
+            "stipend": float(internship['stipend']),
+            "success_prob": float(score),
+            "projected_success_prob": float(projected_success_prob),
+            "score_breakdown": breakdown,
+            "missing_skills": missing_skills,
+            "course_suggestions": course_suggestions,
+            "explanations": explanations,
+            "fairness_score": float(internship.get('fairness_score', DEFAULT_FAIRNESS_SCORE)),
+            "applicants_total": app_stats.get('applicants_total') if app_stats else None,
+            "positions_available": app_stats.get('positions_available') if app_stats else None,
+            "selection_ratio": app_stats.get('selection_ratio') if app_stats else None
+        }
+        if success_breakdown is not None:
+            recommendation["success_breakdown"] = success_breakdown
+        return recommendation
+    
+    def _student_skill_mask(self, context: RecommendationContext) -> np.ndarray:
+        """Get the student's packed skill mask for the current feature store (memoized per request)."""
+        store = self.feature_store
+        return context.memoize(('skill_mask', id(store)), lambda: store.student_mask(context.skill_ids))
+    
     def _create_cache_key(self, *args) -> str:
         """Create a cache key from arguments."""
         key_str = json.dumps(args, sort_keys=True)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        return stable_hash_hex(key_str)
     
     def _parse_skills_string(self, skills_str: str) -> List[str]:
-        """Parse skills string into list."""
-        if pd.isna(skills_str) or not skills_str:
-            return []
-        
-        skills = [skill.strip() for skill in str(skills_str).split(',')]
-        return [skill for skill in skills if skill]
+        """Parse skills string into a list of canonical vocabulary names."""
+        return get_skill_vocabulary().split(skills_str)
     
-    def _get_missing_skills(self, student_skills: List[str], required_skills: List[str]) -> List[str]:
-        """Get list of missing skills."""
-        student_set = set(s.lower() for s in student_skills)
-        required_set = set(r.lower() for r in required_skills)
-        missing = required_set - student_set
-        return list(missing)
+    def _get_missing_skills(self,
+                            student_skills: List[str],
+                            required_skills: List[str],
+                            context: Optional[RecommendationContext] = None) -> List[str]:
+        """Get list of missing skills (in required_skills order)."""
+        vocab = get_skill_vocabulary()
+        student_ids = context.skill_ids if context is not None else vocab.encode_known(student_skills)
+        owned = set(student_ids.tolist())
+        return [skill for skill in required_skills if vocab.lookup(skill) not in owned]
     
-    def _get_enhanced_course_suggestions(self, student_skills: List[str], missing_skills: List[str]) -> List[Dict[str, Any]]:
+    def _get_enhanced_course_suggestions(self,
+                                         student_skills: List[str],
+                                         missing_skills: List[str],
+                                         context: Optional[RecommendationContext] = None) -> List[Dict[str, Any]]:
         """Get enhanced course suggestions."""
         try:
-            skills_set = {skill.lower().strip() for skill in student_skills if skill}
+            if context is None:
+                context = RecommendationContext({'skills': student_skills})
             
-            course_suggestions = suggest_courses_for_missing_skills(
-                student_skills=skills_set,
-                missing_skills=missing_skills,
-                student_interests=None,
-                top_k=3,
-                data_dir=self.data_path
-            )
-            
-            return course_suggestions
+            return context.course_suggestions(self.course_scorer, missing_skills, top_k=3)
             
         except Exception as e:
             logger.warning(f"⚠️  Enhanced course suggestions failed: {e}")
@@ -607,41 +966,11 @@ class FixedRecommendationEngine:
                               internship: pd.Series,
                               breakdown: Dict[str, float],
                               missing_skills: List[str]) -> List[str]:
-        """Generate explanations for the recommendation."""
-        explanations = []
-        
-        # 1. Skill-based explanation
-        if breakdown['skill_match_score'] > 0.7:
-            explanations.append(f"Excellent skill match ({breakdown['skill_match_score']*100:.0f}%) with internship requirements")
-        elif breakdown['skill_match_score'] > 0.5:
-            explanations.append(f"Good skill alignment with {len(student_profile['skills'])} relevant skills")
-        else:
-            explanations.append(f"Opportunity to develop new skills in {internship['domain']}")
-        
-        # 2. Academic explanation
-        cgpa = student_profile['cgpa']
-        if cgpa >= 8.5:
-            explanations.append(f"Your excellent academic record (CGPA: {cgpa}) makes you a strong candidate")
-        elif cgpa >= 7.0:
-            explanations.append(f"Your solid academic performance (CGPA: {cgpa}) meets requirements")
-        else:
-            explanations.append("Focus on practical skills can compensate for academic scores")
-        
-        # 3. Market dynamics explanation
-        if breakdown['market_score'] > 0.7:
-            explanations.append("Low competition and high selection rate for this position")
-        elif breakdown['market_score'] > 0.5:
-            explanations.append("Moderate competition with good selection chances")
-        else:
-            explanations.append("Competitive position - ensure your application stands out")
-        
-        # 4. Additional context
-        if not missing_skills:
-            explanations.append("You meet all skill requirements for this position!")
-        elif len(missing_skills) <= 2:
-            explanations.append(f"Only {len(missing_skills)} skills to develop for a perfect match")
-        
-        return explanations[:3]  # Return top 3 explanations
+        """Generate explanations for the recommendation from the compiled template table."""
+        return explain_recommendation(
+            breakdown, student_profile['cgpa'], len(student_profile['skills']),
+            internship['domain'], len(missing_skills)
+        )
     
     def clear_cache(self):
         """Clear the recommendation cache."""
@@ -0,0 +1,339 @@
+"""
+PMIS On-Demand Profiler Module
+=============================
+
+This module lets an operator profile a live worker without redeploying.
+Two modes are supported:
+
+- Statistical sampling: a background thread snapshots every thread's stack
+  at a fixed interval and aggregates them as flamegraph-compatible collapsed
+  stacks ("frame;frame;frame count").
+- cProfile: the next N recommendation computations run under cProfile and
+  the combined pstats report is returned.
+
+Both modes are capped: sessions have a hard maximum duration, only one
+session runs at a time, and the sampler backs off its interval whenever its
+own sampling time exceeds the overhead budget.
+
+Key Features:
+- Collapsed-stack output (flamegraph.pl / speedscope compatible)
+- cProfile for the next N recommendation requests
+- Hard caps on duration, sampling rate and overhead
+- Stacks limited to application frames by default
+
+Environment:
+- PROFILER_MAX_SECONDS: hard cap on any profiling session (default: 30)
+- PROFILER_MAX_OVERHEAD: sampler CPU budget as a fraction of wall time (default: 0.05)
+
+Author: Senior ML + Platform Engineer
+Date: September 24, 2025
+"""
+
+import io
+import os
+import sys
+import time
+import pstats
+import cProfile
+import threading
+import logging
+from collections import Counter
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MIN_INTERVAL_SECONDS = 0.001
+APP_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Samples taken before the overhead budget is enforced
+OVERHEAD_WARMUP_SAMPLES = 10
+
+
+def max_profile_seconds() -> float:
+    """Hard cap on a profiling session (PROFILER_MAX_SECONDS)."""
+    return float(os.getenv("PROFILER_MAX_SECONDS", "30"))
+
+
+def max_profile_overhead() -> float:
+    """Sampler CPU budget as a fraction of wall time (PROFILER_MAX_OVERHEAD)."""
+    return float(os.getenv("PROFILER_MAX_OVERHEAD", "0.05"))
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profiling session is already running."""
+    pass
+
+
+class SamplingProfiler:
+    """Statistical stack sampler producing collapsed stacks."""
+
+    def __init__(self, interval_seconds: float = 0.005, app_only: bool = True):
+        """
+        Initialize the sampler.
+
+        Args:
+            interval_seconds: Target time between samples
+            app_only: Keep only stacks that pass through application code
+        """
+        self.interval = max(interval_seconds, MIN_INTERVAL_SECONDS)
+        self.app_only = app_only
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.sampling_seconds = 0.0
+        self.wall_seconds = 0.0
+
+    @staticmethod
+    def _frame_label(frame) -> str:
+        code = frame.f_code
+        return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+    def _sample_once(self, own_ident: int):
+        """Snapshot every other thread's stack."""
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+
+            labels = []
+            in_app = False
+            while frame is not None:
+                labels.append(self._frame_label(frame))
+                if not in_app and frame.f_code.co_filename.startswith(APP_PACKAGE_DIR):
+                    in_app = True
+                frame = frame.f_back
+
+            if labels and (in_app or not self.app_only):
+                self.stacks[";".join(reversed(labels))] += 1
+
+    def run(self, duration_seconds: float):
+        """
+        Sample for a duration (blocking; call from a background thread).
+
+        Args:
+            duration_seconds: Sampling duration, capped at PROFILER_MAX_SECONDS
+        """
+        duration = min(max(duration_seconds, 0.0), max_profile_seconds())
+        budget = max_profile_overhead()
+        own_ident = threading.get_ident()
+
+        started = time.perf_counter()
+        deadline = started + duration
+        while True:
+            sample_start = time.perf_counter()
+            if sample_start >= deadline:
+                break
+
+            self._sample_once(own_ident)
+            self.samples += 1
+
+            sample_end = time.perf_counter()
+            self.sampling_seconds += sample_end - sample_start
+
+            # Back off when sampling costs more than the overhead budget
+            if (self.samples >= OVERHEAD_WARMUP_SAMPLES
+                    and self.sampling_seconds > budget * (sample_end - started)):
+                self.interval = min(self.interval * 2, 1.0)
+
+            time.sleep(self.interval)
+
+        self.wall_seconds = time.perf_counter() - started
+
+    def collapsed(self) -> str:
+        """
+        Render collected stacks in collapsed format.
+
+        Returns:
+            One "frame;frame;frame count" line per distinct stack
+        """
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common()) + "\n"
+
+    def summary(self) -> Dict[str, Any]:
+        """Get sampling statistics."""
+        return {
+            "samples": self.samples,
+            "distinct_stacks": len(self.stacks),
+            "wall_seconds": round(self.wall_seconds, 3),
+            "overhead_fraction": round(self.sampling_seconds / self.wall_seconds, 4) if self.wall_seconds else 0.0,
+            "final_interval_ms": round(self.interval * 1000, 3)
+        }
+
+
+class RequestProfiler:
+    """
+    Coordinates profiling sessions for the worker.
+
+    cProfile sessions are armed for the next N recommendation computations;
+    the recommendation path calls run() which profiles only while armed.
+    """
+
+    def __init__(self):
+        """Initialize the request profiler."""
+        self._lock = threading.Lock()
+        self._busy = False
+
+        self._remaining = 0
+        self._deadline = 0.0
+        self._stats: Optional[pstats.Stats] = None
+        self._profiled = 0
+        self._requested = 0
+
+    def _acquire(self):
+        with self._lock:
+            if self._busy or self._remaining > 0:
+                raise ProfilerBusyError("A profiling session is already running")
+            self._busy = True
+
+    def _release(self):
+        with self._lock:
+            self._busy = False
+
+    def sample(self, duration_seconds: float, interval_seconds: float = 0.005,
+               app_only: bool = True) -> SamplingProfiler:
+        """
+        Run a sampling session (blocking).
+
+        Args:
+            duration_seconds: Sampling duration
+            interval_seconds: Target time between samples
+            app_only: Keep only stacks that pass through application code
+
+        Returns:
+            The finished sampler
+        """
+        self._acquire()
+        try:
+            sampler = SamplingProfiler(interval_seconds, app_only)
+            logger.info(f"🔬 Sampling profiler started ({duration_seconds}s)")
+            sampler.run(duration_seconds)
+            logger.info(f"✅ Sampling profiler finished: {sampler.samples} samples")
+            return sampler
+        finally:
+            self._release()
+
+    def arm_cprofile(self, n_requests: int, timeout_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Profile the next N recommendation computations with cProfile.
+
+        Args:
+            n_requests: Number of requests to profile
+            timeout_seconds: Disarm after this long (capped at PROFILER_MAX_SECONDS)
+
+        Returns:
+            Session status
+        """
+        cap = max_profile_seconds()
+        timeout = min(timeout_seconds or cap, cap)
+        with self._lock:
+            if self._busy or self._remaining > 0:
+                raise ProfilerBusyError("A profiling session is already running")
+            self._remaining = max(1, int(n_requests))
+            self._requested = self._remaining
+            self._profiled = 0
+            self._stats = None
+            self._deadline = time.monotonic() + timeout
+
+        logger.info(f"🔬 cProfile armed for {self._requested} requests ({timeout:.0f}s cap)")
+        return self.cprofile_status()
+
+    def _claim(self) -> bool:
+        """Claim one profiled slot if a session is armed and not expired."""
+        if self._remaining <= 0:
+            return False
+        with self._lock:
+            if self._remaining <= 0:
+                return False
+            if time.monotonic() > self._deadline:
+                self._remaining = 0
+                logger.info("⏱️  cProfile session expired")
+                return False
+            self._remaining -= 1
+            return True
+
+    def run(self, func: Callable[[], Any]) -> Any:
+        """
+        Call func, under cProfile if a session is armed.
+
+        Args:
+            func: Zero-argument callable (one recommendation computation)
+
+        Returns:
+            func's result
+        """
+        if not self._claim():
+            return func()
+
+        profile = cProfile.Profile()
+        try:
+            return profile.runcall(func)
+        finally:
+            with self._lock:
+                if self._stats is None:
+                    self._stats = pstats.Stats(profile)
+                else:
+                    self._stats.add(profile)
+                self._profiled += 1
+
+    def cprofile_status(self) -> Dict[str, Any]:
+        """Get the state of the current or last cProfile session."""
+        with self._lock:
+            if self._remaining > 0 and time.monotonic() > self._deadline:
+                self._remaining = 0
+            return {
+                "requested": self._requested,
+                "profiled": self._profiled,
+                "remaining": self._remaining,
+                "complete": self._requested > 0 and self._remaining == 0
+            }
+
+    def cprofile_report(self, sort_by: str = "cumulative", limit: int = 50) -> Optional[str]:
+        """
+        Render the collected cProfile statistics.
+
+        Args:
+            sort_by: pstats sort key
+            limit: Number of functions to print
+
+        Returns:
+            pstats text, or None if nothing was profiled
+        """
+        with self._lock:
+            if self._stats is None:
+                return None
+            stream = io.StringIO()
+            self._stats.stream = stream
+            self._stats.sort_stats(sort_by).print_stats(limit)
+            return stream.getvalue()
+
+
+# Global instance for easy access
+_request_profiler = None
+
+def get_request_profiler() -> RequestProfiler:
+    """Get or create the global request profiler."""
+    global _request_profiler
+    if _request_profiler is None:
+        _request_profiler = RequestProfiler()
+    return _request_profiler
+
+
+if __name__ == "__main__":
+    # Demo the profiler
+    print("🚀 PMIS On-Demand Profiler Demo")
+    print("=" * 50)
+
+    def busy_work():
+        return sum(i * i for i in range(200000))
+
+    profiler = RequestProfiler()
+
+    worker = threading.Thread(target=lambda: [busy_work() for _ in range(20)])
+    worker.start()
+    sampler = profiler.sample(0.5, interval_seconds=0.002, app_only=False)
+    worker.join()
+    print(f"📊 Sampler: {sampler.summary()}")
+    print(sampler.collapsed().splitlines()[0])
+
+    profiler.arm_cprofile(2)
+    for _ in range(3):
+        profiler.run(busy_work)
+    print(f"\n📊 cProfile: {profiler.cprofile_status()}")
+    print(profiler.cprofile_report(limit=5))
@@ -0,0 +1,141 @@
+"""
+PMIS Request Context Module
+==========================
+
+This module provides a request-scoped context that memoizes every
+student-only computation performed while building a recommendation list.
+Inputs that do not depend on the internship (alumni matches, normalized
+skill sets, course readiness of the student's skill set) are computed once
+per request instead of once per candidate internship.
+
+Key Features:
+- Normalized student skill set computed once per request
+- Alumni similarity search memoized per result size
+- Course suggestions memoized per missing-skill set
+- Per-course readiness cache shared across all course lookups
+
+Author: ML Engineer
+Date: September 24, 2025
+"""
+
+from typing import Dict, List, Any, Optional, Set, Callable, Hashable, FrozenSet
+import logging
+
+import numpy as np
+
+from app.skill_vocab import get_skill_vocabulary
+
+logger = logging.getLogger(__name__)
+
+
+class RecommendationContext:
+    """
+    Memoizes student-only computations for the lifetime of one request.
+
+    A context is created per request (or per student in a batch) and passed
+    into the per-internship loops of the recommendation engines.
+    """
+
+    def __init__(self, student_profile: Dict[str, Any]):
+        """
+        Initialize the request context.
+
+        Args:
+            student_profile: Student profile dictionary (skills, stream, college_tier, ...)
+        """
+        self.student_profile = student_profile
+        self._memo: Dict[Hashable, Any] = {}
+
+        # Readiness metrics keyed by course identity (student skills are fixed per request)
+        self.readiness_cache: Dict[Hashable, Dict[str, float]] = {}
+
+    def memoize(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the memoized value for key, computing it on first use.
+
+        Args:
+            key: Memo key
+            compute: Zero-argument function producing the value
+
+        Returns:
+            Memoized value
+        """
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = compute()
+            self._memo[key] = value
+            return value
+
+    @property
+    def skills(self) -> List[str]:
+        """Student skills as provided in the request."""
+        return self.student_profile.get('skills', []) or []
+
+    @property
+    def normalized_skills(self) -> FrozenSet[str]:
+        """Canonical (vocabulary-normalized) student skill set."""
+        canonical = get_skill_vocabulary().canonical
+        return self.memoize(
+            'normalized_skills',
+            lambda: frozenset(canonical(skill) for skill in self.skills if skill)
+        )
+
+    @property
+    def skill_ids(self) -> np.ndarray:
+        """Known student skills as a sorted int32 array of vocabulary ids (not interned)."""
+        return self.memoize('skill_ids', lambda: get_skill_vocabulary().encode_known(self.skills))
+
+    def alumni_stories(self, alumni_manager, max_results: int = 3) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get similar alumni stories for the student (memoized per result size).
+
+        Args:
+            alumni_manager: AlumniManager instance
+            max_results: Maximum number of stories to return
+
+        Returns:
+            List of alumni stories or None if the lookup failed
+        """
+        def compute():
+            try:
+                student_features = {
+                    'skills': ', '.join(self.skills),
+                    'stream': self.student_profile.get('stream', ''),
+                    'college_tier': self.student_profile.get('college_tier', 'Tier-2'),
+                    'rural_urban': 'Urban'  # Default assumption
+                }
+                return alumni_manager.similar_alumni(student_features, max_results=max_results)
+            except Exception as e:
+                logger.debug(f"Alumni stories lookup failed: {e}")
+                return None
+
+        stories = self.memoize(('alumni_stories', max_results), compute)
+        return [dict(story) for story in stories] if stories is not None else None
+
+    def course_suggestions(self,
+                           course_scorer,
+                           missing_skills: List[str],
+                           top_k: int = 3,
+                           student_interests: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Get course suggestions for a set of missing skills (memoized per skill set).
+
+        Args:
+            course_scorer: Loaded CourseReadinessScorer instance
+            missing_skills: List of skills the student needs to develop
+            top_k: Maximum number of courses to return
+            student_interests: Optional set of student interests
+
+        Returns:
+            List of course suggestions with readiness metrics
+        """
+        key = ('course_suggestions', tuple(missing_skills), top_k)
+        suggestions = self.memoize(key, lambda: course_scorer.suggest_courses_for_missing_skills(
+            set(self.normalized_skills),
+            missing_skills,
+            student_interests,
+            top_k,
+            readiness_cache=self.readiness_cache
+        ))
+        return [dict(course) for course in suggestions]
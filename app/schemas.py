@@ -147,6 +147,28 @@ class RecommendationResponse(BaseModel):
     generated_at: str = Field(description="Generation timestamp")
 
 
+class InternshipSearchResult(BaseModel):
+    """Internship returned by the search endpoint."""
+    internship_id: str = Field(description="Internship ID")
+    title: str = Field(description="Internship title")
+    company: str = Field(description="Company name")
+    domain: str = Field(description="Industry domain")
+    location: str = Field(description="Location")
+    duration: str = Field(description="Duration")
+    stipend: float = Field(description="Monthly stipend")
+    employee_count: Optional[int] = Field(description="Company employee count", default=None)
+    application_deadline: Optional[str] = Field(description="Application deadline (YYYY-MM-DD)", default=None)
+    urgent: bool = Field(description="Deadline within 7 days", default=False)
+
+
+class InternshipSearchResponse(BaseModel):
+    """Response model for internship search."""
+    total: int = Field(description="Total matching internships")
+    offset: int = Field(description="Offset of the first returned internship")
+    limit: int = Field(description="Maximum internships returned")
+    internships: List[InternshipSearchResult] = Field(description="Matching internships (this page)")
+
+
 class HealthResponse(BaseModel):
     """Health check response model."""
     status: str = Field(description="Service status")
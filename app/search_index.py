@@ -0,0 +1,260 @@
+"""
+PMIS Internship Search Index Module
+==================================
+
+This module answers multi-criteria internship searches from prebuilt
+indexes instead of copying and re-masking the internships DataFrame per
+query. Row sets are packed uint64 bitmaps (one bit per DataFrame row), so
+filters compose as bitwise AND / OR over a few words per 64 internships:
+
+- stipend: row ids sorted by stipend; a range query is two binary searches
+- location, domain: inverted index value -> row bitmap
+- company size: bucket (startup / small / large) -> row bitmap
+- urgency: one bitmap
+
+A query returns matching row positions in table order; callers
+materialize only the rows they return (e.g. one page).
+
+Key Features:
+- Sorted stipend array for O(log N) range bounds
+- Inverted bitmap indexes for location, domain and size bucket
+- Bitmap intersections (AND) across criteria, unions (OR) within one
+- Same semantics as EnhancedDataLoader.filter_internships_by_criteria
+
+Author: Senior ML + Platform Engineer
+Date: September 24, 2025
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .feature_store import popcount
+except ImportError:
+    # Fallback for direct execution
+    from feature_store import popcount
+
+logger = logging.getLogger(__name__)
+
+
+def rows_to_bitmap(rows: np.ndarray, n_words: int) -> np.ndarray:
+    """
+    Pack row positions into a bitmap.
+
+    Args:
+        rows: Row positions
+        n_words: Bitmap width in uint64 words
+
+    Returns:
+        uint64 bitmap of shape (n_words,)
+    """
+    bitmap = np.zeros(n_words, dtype=np.uint64)
+    rows = np.asarray(rows, dtype=np.int64)
+    if len(rows):
+        np.bitwise_or.at(bitmap, rows // 64, np.left_shift(np.uint64(1), (rows % 64).astype(np.uint64)))
+    return bitmap
+
+
+def bitmap_to_rows(bitmap: np.ndarray, n_rows: int) -> np.ndarray:
+    """
+    Unpack a bitmap into ascending row positions.
+
+    Args:
+        bitmap: uint64 bitmap
+        n_rows: Number of rows covered by the bitmap
+
+    Returns:
+        int64 array of set row positions
+    """
+    bits = np.unpackbits(np.ascontiguousarray(bitmap, dtype='<u8').view(np.uint8), bitorder='little')
+    return np.flatnonzero(bits[:n_rows])
+
+
+class InternshipSearchIndex:
+    """
+    Prebuilt search indexes over one internships table.
+
+    The index keeps a reference to the table it was built from; `source`
+    lets owners detect when the table has been replaced and rebuild.
+    """
+
+    def __init__(self, internships_df: pd.DataFrame):
+        """
+        Build the indexes for an internships table.
+
+        Args:
+            internships_df: Internship DataFrame (stipend, location, domain,
+                employee_count, urgent)
+        """
+        self.source = internships_df
+        self.n_rows = len(internships_df)
+        self.n_words = max(1, (self.n_rows + 63) // 64)
+
+        # Stipend: row ids ordered by stipend (missing stipends never match a range)
+        stipend = self._numeric(internships_df, 'stipend')
+        known = np.flatnonzero(~np.isnan(stipend))
+        order = np.argsort(stipend[known], kind='stable')
+        self.stipend_rows = known[order]
+        self.sorted_stipend = stipend[self.stipend_rows]
+
+        self.location_index = self._inverted(internships_df, 'location')
+        self.domain_index = self._inverted(internships_df, 'domain')
+
+        # Company size buckets by employee count: startup (<50), small (50-500), large (>500)
+        employees = self._numeric(internships_df, 'employee_count')
+        size_masks = {
+            'startup': employees < 50,
+            'small': (employees >= 50) & (employees <= 500),
+            'large': employees > 500,
+        }
+        self.size_index = {
+            bucket: rows_to_bitmap(np.flatnonzero(mask), self.n_words) for bucket, mask in size_masks.items()
+        }
+
+        if 'urgent' in internships_df.columns:
+            urgent = (internships_df['urgent'] == True).to_numpy()
+        else:
+            urgent = np.zeros(self.n_rows, dtype=bool)
+        self.urgent_rows = rows_to_bitmap(np.flatnonzero(urgent), self.n_words)
+
+        logger.info(
+            f"✅ Built internship search index: {self.n_rows} rows, "
+            f"{len(self.location_index)} locations, {len(self.domain_index)} domains"
+        )
+
+    def _numeric(self, df: pd.DataFrame, column: str) -> np.ndarray:
+        """Column as float64 (NaN when missing or non-numeric)."""
+        if column not in df.columns:
+            return np.full(self.n_rows, np.nan)
+        return pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float64)
+
+    def _inverted(self, df: pd.DataFrame, column: str) -> Dict[str, np.ndarray]:
+        """Inverted index value -> row bitmap, built in one scatter."""
+        if column not in df.columns:
+            return {}
+        codes, uniques = pd.factorize(df[column])
+        rows = np.flatnonzero(codes >= 0)
+        bitmaps = np.zeros((len(uniques), self.n_words), dtype=np.uint64)
+        if len(rows):
+            np.bitwise_or.at(
+                bitmaps,
+                (codes[rows], rows // 64),
+                np.left_shift(np.uint64(1), (rows % 64).astype(np.uint64))
+            )
+        return dict(zip(uniques, bitmaps))
+
+    def _union(self, index: Dict[str, np.ndarray], values: Iterable[str]) -> np.ndarray:
+        """OR of the bitmaps of the given values (empty when none are indexed)."""
+        bitmap = np.zeros(self.n_words, dtype=np.uint64)
+        for value in values:
+            row_bitmap = index.get(value)
+            if row_bitmap is not None:
+                bitmap |= row_bitmap
+        return bitmap
+
+    def stipend_bitmap(self, min_stipend: float = 0, max_stipend: float = float('inf')) -> np.ndarray:
+        """
+        Rows with min_stipend <= stipend <= max_stipend.
+
+        Args:
+            min_stipend: Minimum stipend (inclusive)
+            max_stipend: Maximum stipend (inclusive)
+
+        Returns:
+            uint64 row bitmap
+        """
+        lo = np.searchsorted(self.sorted_stipend, min_stipend, side='left')
+        hi = np.searchsorted(self.sorted_stipend, max_stipend, side='right')
+        return rows_to_bitmap(self.stipend_rows[lo:max(lo, hi)], self.n_words)
+
+    def query_bitmap(self,
+                     min_stipend: float = 0,
+                     max_stipend: float = float('inf'),
+                     locations: Optional[List[str]] = None,
+                     domains: Optional[List[str]] = None,
+                     company_sizes: Optional[List[str]] = None,
+                     urgent_only: bool = False) -> np.ndarray:
+        """
+        Intersect the criteria bitmaps.
+
+        Args:
+            min_stipend: Minimum stipend amount
+            max_stipend: Maximum stipend amount
+            locations: Locations to include (any of)
+            domains: Domains to include (any of)
+            company_sizes: Company sizes to include ('startup', 'small', 'large')
+            urgent_only: Only urgent internships
+
+        Returns:
+            uint64 bitmap of matching rows
+        """
+        bitmap = self.stipend_bitmap(min_stipend, max_stipend)
+        if locations:
+            bitmap &= self._union(self.location_index, locations)
+        if domains:
+            bitmap &= self._union(self.domain_index, domains)
+        # Unknown size names are ignored; the filter applies only when a known bucket is named
+        sizes = [size for size in company_sizes or [] if size in self.size_index]
+        if sizes:
+            bitmap &= self._union(self.size_index, sizes)
+        if urgent_only:
+            bitmap &= self.urgent_rows
+        return bitmap
+
+    def query(self, **criteria) -> np.ndarray:
+        """
+        Find matching rows (see query_bitmap for the criteria).
+
+        Returns:
+            Ascending row positions into the indexed table
+        """
+        return bitmap_to_rows(self.query_bitmap(**criteria), self.n_rows)
+
+    def count(self, **criteria) -> int:
+        """Number of rows matching the criteria (see query_bitmap)."""
+        return int(popcount(self.query_bitmap(**criteria)))
+
+
+if __name__ == "__main__":
+    # Demo the search index against the DataFrame filter
+    import time
+
+    print("🚀 PMIS Internship Search Index Demo")
+    print("=" * 50)
+
+    rng = np.random.default_rng(7)
+    n = 20000
+    df = pd.DataFrame({
+        'internship_id': [f"INT_{i:05d}" for i in range(n)],
+        'stipend': rng.integers(0, 60, n) * 1000.0,
+        'location': rng.choice(['pune', 'delhi', 'mumbai', 'bangalore', 'chennai'], n),
+        'domain': rng.choice(['ai/ml', 'web development', 'finance', 'marketing'], n),
+        'employee_count': rng.choice([10, 200, 5000], n),
+        'urgent': rng.random(n) < 0.1,
+    })
+
+    start = time.perf_counter()
+    index = InternshipSearchIndex(df)
+    print(f"⏱️  Built index in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    criteria = dict(min_stipend=10000, max_stipend=30000, locations=['pune', 'delhi'],
+                    domains=['ai/ml'], company_sizes=['large'], urgent_only=False)
+
+    start = time.perf_counter()
+    for _ in range(100):
+        rows = index.query(**criteria)
+    indexed_ms = (time.perf_counter() - start) * 10
+
+    start = time.perf_counter()
+    for _ in range(100):
+        masked = df.copy()
+        masked = masked[(masked['stipend'] >= 10000) & (masked['stipend'] <= 30000)]
+        masked = masked[masked['location'].isin(['pune', 'delhi']) & masked['domain'].isin(['ai/ml'])]
+        masked = masked[masked['employee_count'] > 500]
+    masked_ms = (time.perf_counter() - start) * 10
+
+    assert (df.index[rows] == masked.index).all()
+    print(f"🔍 {len(rows)} matches: index {indexed_ms:.3f} ms vs DataFrame masks {masked_ms:.3f} ms")
@@ -0,0 +1,319 @@
+"""
+PMIS Response Serialization Module
+=================================
+
+This module turns engine recommendation dicts into the /recommendations
+response without rebuilding nested Pydantic models field by field. The
+engine output is mapped once into plain dicts shaped like the
+`RecommendationResponse` schema; that payload is then either validated in
+a single pass and serialized by pydantic-core, or (when validation is
+switched off) encoded directly with a fast JSON encoder.
+
+Returning a ready `Response` from the endpoint also skips FastAPI's second
+validate-and-serialize pass over the `response_model`, which stays on the
+route for the OpenAPI schema.
+
+Key Features:
+- One-pass payload construction with the same defaults as the models
+- Single validation pass (RESPONSE_VALIDATION, default true)
+- Trusted mode encodes with orjson when installed, else the stdlib json
+- Numpy scalars encoded natively
+
+Author: Senior ML + Platform Engineer
+Date: September 24, 2025
+"""
+
+import os
+import json
+import logging
+from typing import Any, Dict, List, Optional, Type
+
+import numpy as np
+from pydantic import BaseModel
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# CourseItem fields with the defaults used when an engine course lacks them
+_COURSE_ITEM_DEFAULTS = (
+    ("skill", "Unknown"),
+    ("platform", "Unknown"),
+    ("course_name", "Unknown Course"),
+    ("link", ""),
+    ("difficulty", "Intermediate"),
+    ("duration_hours", 40.0),
+    ("expected_success_boost", 0.1),
+    ("readiness_score", 0.8),
+    ("prereq_coverage", 0.8),
+    ("content_alignment", 0.7),
+    ("difficulty_penalty", 1.0),
+)
+
+_BREAKDOWN_DEFAULTS = (
+    ("content_signal", 0.0),
+    ("cf_signal", 0.0),
+    ("fairness_adjustment", 0.0),
+    ("demand_adjustment", 0.0),
+    ("company_signal", 0.0),
+)
+
+
+def response_validation_enabled() -> bool:
+    """Whether response payloads are validated against the schema (RESPONSE_VALIDATION)."""
+    return os.getenv("RESPONSE_VALIDATION", "true").lower() in ("1", "true", "yes", "on")
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values the stdlib json module does not handle."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(payload: Any) -> bytes:
+    """
+    Encode a payload as compact UTF-8 JSON.
+
+    Args:
+        payload: JSON-compatible structure (numpy scalars and non-string dict keys allowed)
+
+    Returns:
+        Encoded bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        payload, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_json_default
+    ).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """JSON response encoded with orjson when available (stdlib json otherwise)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+def _success_breakdown(data: Dict[str, Any], success_prob: float) -> Dict[str, Any]:
+    breakdown = {"base_model_prob": data.get("base_model_prob", success_prob)}
+    for key, default in _BREAKDOWN_DEFAULTS:
+        breakdown[key] = data.get(key, default)
+    breakdown["final_success_prob"] = data.get("final_success_prob", success_prob)
+    return breakdown
+
+
+def recommendation_payload(rec_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map one engine recommendation to the `Recommendation` response shape.
+
+    Defaults match the former per-field model construction: enhanced
+    recommendations (with an application deadline) always carry a success
+    breakdown, legacy ones only when the engine provided one.
+
+    Args:
+        rec_data: Engine recommendation dict
+
+    Returns:
+        Response-ready dict
+    """
+    success_prob = rec_data["success_prob"]
+
+    success_breakdown = None
+    if "application_deadline" in rec_data or "success_breakdown" in rec_data:
+        success_breakdown = _success_breakdown(rec_data.get("success_breakdown", {}), success_prob)
+
+    interview_meta = None
+    interview_data = rec_data.get("interview_meta")
+    if interview_data:
+        interview_meta = {
+            "process_type": interview_data.get("process_type"),
+            "rounds": interview_data.get("rounds"),
+            "mode": interview_data.get("mode"),
+            "expected_timeline_days": interview_data.get("expected_timeline_days"),
+            "notes": interview_data.get("notes")
+        }
+
+    live_counts = None
+    live_data = rec_data.get("live_counts")
+    if live_data:
+        live_counts = {
+            "current_applicants": live_data.get("current_applicants"),
+            "last_seen": live_data.get("last_seen"),
+            "source": live_data.get("source"),
+            "freshness_seconds": live_data.get("freshness_seconds")
+        }
+
+    alumni_stories = [
+        {
+            "title": story.get("title"),
+            "company_name": story.get("company_name"),
+            "outcome": story.get("outcome"),
+            "testimonial": story.get("testimonial"),
+            "year": story.get("year")
+        }
+        for story in rec_data.get("alumni_stories") or []
+    ]
+
+    return {
+        "internship_id": rec_data["internship_id"],
+        "title": rec_data["title"],
+        "organization_name": rec_data.get("organization_name", rec_data.get("company", "Unknown")),
+        "domain": rec_data["domain"],
+        "location": rec_data["location"],
+        "duration": rec_data["duration"],
+        "stipend": rec_data["stipend"],
+        "success_prob": success_prob,
+        "projected_success_prob": rec_data.get("projected_success_prob", success_prob),
+        "applicants_total": rec_data.get("applicants_total"),
+        "positions_available": rec_data.get("positions_available"),
+        "selection_ratio": rec_data.get("selection_ratio"),
+        "demand_pressure": rec_data.get("demand_pressure"),
+        "success_breakdown": success_breakdown,
+        "interview_meta": interview_meta,
+        "live_counts": live_counts,
+        "alumni_stories": alumni_stories,
+        "data_quality_flags": rec_data.get("data_quality_flags", []),
+        "missing_skills": rec_data["missing_skills"],
+        "courses": [
+            {"name": course["name"], "url": course["url"], "platform": course["platform"]}
+            for course in rec_data.get("courses", [])
+        ],
+        "course_suggestions": [
+            {key: course.get(key, default) for key, default in _COURSE_ITEM_DEFAULTS}
+            for course in rec_data.get("course_suggestions", [])
+        ],
+        "reasons": rec_data["reasons"]
+    }
+
+
+def recommendation_response_payload(student_id: str,
+                                    recommendations_data: List[Dict[str, Any]],
+                                    generated_at: str) -> Dict[str, Any]:
+    """
+    Build the full `RecommendationResponse` payload.
+
+    Args:
+        student_id: Student ID
+        recommendations_data: Engine recommendation dicts
+        generated_at: Generation timestamp
+
+    Returns:
+        Response-ready dict
+    """
+    recommendations = [recommendation_payload(rec_data) for rec_data in recommendations_data]
+    return {
+        "student_id": student_id,
+        "total_recommendations": len(recommendations),
+        "recommendations": recommendations,
+        "generated_at": generated_at
+    }
+
+
+def _optional_str(value: Any) -> Optional[str]:
+    if value is None or value == "" or (isinstance(value, float) and np.isnan(value)):
+        return None
+    return str(value)
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    return int(value)
+
+
+def internship_search_payload(page: Any, total: int, offset: int, limit: int) -> Dict[str, Any]:
+    """
+    Build the `InternshipSearchResponse` payload for one page of results.
+
+    Args:
+        page: DataFrame with the internships of this page
+        total: Total number of matches
+        offset: Offset of the page
+        limit: Page size
+
+    Returns:
+        Response-ready dict
+    """
+    columns = page.columns
+    internships = []
+    for row in page.to_dict("records"):
+        internships.append({
+            "internship_id": str(row["internship_id"]),
+            "title": str(row["title"]),
+            "company": str(row["company"]),
+            "domain": str(row["domain"]),
+            "location": str(row["location"]),
+            "duration": str(row["duration"]),
+            "stipend": float(row["stipend"]),
+            "employee_count": _optional_int(row.get("employee_count")) if "employee_count" in columns else None,
+            "application_deadline": _optional_str(row.get("application_deadline")),
+            "urgent": bool(row.get("urgent", False))
+        })
+    return {"total": int(total), "offset": offset, "limit": limit, "internships": internships}
+
+
+def encode_response(model: Type[BaseModel], payload: Dict[str, Any],
+                    validate: Optional[bool] = None, status_code: int = 200) -> Response:
+    """
+    Encode a response payload, validating it once against its model.
+
+    Args:
+        model: Response model the payload must satisfy
+        payload: Response-ready dict
+        validate: Validate against the model (default: RESPONSE_VALIDATION)
+        status_code: HTTP status code
+
+    Returns:
+        Encoded response (raises pydantic.ValidationError on invalid payloads)
+    """
+    if validate is None:
+        validate = response_validation_enabled()
+
+    if validate:
+        body = model.model_validate(payload).model_dump_json().encode("utf-8")
+    else:
+        body = dumps(payload)
+    return FastJSONResponse(body, status_code=status_code)
+
+
+if __name__ == "__main__":
+    # Demo the serialization path
+    import time
+
+    try:
+        from .schemas import RecommendationResponse
+    except ImportError:
+        # Fallback for direct execution
+        from schemas import RecommendationResponse
+
+    print("🚀 PMIS Response Serialization Demo")
+    print("=" * 50)
+
+    rec = {
+        "internship_id": "INT_0001", "title": "Data Intern", "company": "Acme", "domain": "Data Science",
+        "location": "Pune", "duration": "3 months", "stipend": np.float64(15000.0),
+        "success_prob": 0.88, "projected_success_prob": 0.9, "missing_skills": ["SQL"],
+        "course_suggestions": [], "reasons": ["Good skill alignment with 3 relevant skills"]
+    }
+    payload = recommendation_response_payload("STU_001", [rec] * 5, "2025-09-24T00:00:00")
+
+    print(f"🧰 orjson available: {orjson is not None}")
+    for validate in (True, False):
+        start = time.perf_counter()
+        for _ in range(1000):
+            response = encode_response(RecommendationResponse, payload, validate=validate)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"   validate={validate}: {elapsed / 1000:.3f} ms/response, {len(response.body)} bytes")
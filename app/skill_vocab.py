@@ -0,0 +1,324 @@
+"""
+PMIS Skill Vocabulary Module
+===========================
+
+This module provides the shared skill vocabulary used by every subsystem
+(internships, courses, alumni, students). Skills are canonicalized once -
+lowercased, whitespace-collapsed and alias-resolved (e.g. "ml" ->
+"machine learning") - and interned to small integer ids, so skill sets can
+be handled as sorted int32 arrays and overlap, missing-skill and Jaccard
+computations become integer operations.
+
+Only load-time data (internships, courses, alumni, student records) is
+interned. Request-side skills are looked up without interning: a skill
+no loaded data uses cannot overlap with anything, so unknown names are
+dropped instead of growing the vocabulary.
+
+Key Features:
+- Canonical skill names with a shared alias table
+- Integer interning with sorted int32 skill-set encoding
+- Memoized parsing of comma-separated skill strings (LRU-bounded)
+- Non-interning lookup for request-side skills
+- Display names for user-facing skill output
+
+Author: ML Engineer
+Date: September 24, 2025
+"""
+
+import pandas as pd
+import numpy as np
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Iterable, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Alias -> canonical skill name
+SKILL_ALIASES = {
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "dl": "deep learning",
+    "nlp": "natural language processing",
+    "js": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "reactjs": "react",
+    "react.js": "react",
+    "nodejs": "node.js",
+    "node js": "node.js",
+    "k8s": "kubernetes",
+    "gcp": "google cloud platform",
+    "amazon web services": "aws",
+    "postgres": "postgresql",
+    "golang": "go"
+}
+
+# Canonical skill name -> display name (everything else is title-cased)
+DISPLAY_NAMES = {
+    "machine learning": "Machine Learning",
+    "artificial intelligence": "Artificial Intelligence",
+    "javascript": "JavaScript",
+    "typescript": "TypeScript",
+    "python": "Python",
+    "react": "React",
+    "node.js": "Node.js",
+    "aws": "AWS",
+    "google cloud platform": "Google Cloud Platform"
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class SkillVocabulary:
+    """
+    Shared skill vocabulary with integer interning.
+
+    Ids are assigned in first-seen order and never change for the lifetime
+    of the process, so encoded arrays stay valid across data reloads.
+    """
+
+    def __init__(self, max_size: int = 100000, parse_cache_size: int = 10000):
+        """
+        Initialize the skill vocabulary.
+
+        Args:
+            max_size: Upper bound on interned skills
+            parse_cache_size: Maximum number of memoized skill strings (least recently used are evicted)
+        """
+        self.max_size = max_size
+        self.parse_cache_size = parse_cache_size
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+        self._parse_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._parse_lock = threading.Lock()
+
+        logger.info("🔧 Skill Vocabulary initialized")
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @staticmethod
+    def canonical(skill: Any) -> str:
+        """
+        Canonicalize a raw skill name.
+
+        Args:
+            skill: Raw skill name
+
+        Returns:
+            Lowercased, whitespace-collapsed, alias-resolved name ('' if empty)
+        """
+        if skill is None or (isinstance(skill, float) and pd.isna(skill)):
+            return ""
+        name = _WHITESPACE.sub(" ", str(skill).strip().lower())
+        return SKILL_ALIASES.get(name, name)
+
+    @staticmethod
+    def split(text: Any) -> List[str]:
+        """
+        Split a comma-separated skill string into canonical names (first-seen order, no duplicates).
+
+        Args:
+            text: Comma-separated skills string
+
+        Returns:
+            List of canonical skill names
+        """
+        if text is None or (isinstance(text, float) and pd.isna(text)) or text == "":
+            return []
+        names = (SkillVocabulary.canonical(item) for item in str(text).split(','))
+        return list(dict.fromkeys(name for name in names if name))
+
+    def intern(self, skill: Any) -> int:
+        """
+        Get the id of a skill, adding it to the vocabulary if needed.
+
+        Args:
+            skill: Raw skill name
+
+        Returns:
+            Skill id, or -1 for empty names or when the vocabulary is full
+        """
+        name = self.canonical(skill)
+        if not name:
+            return -1
+
+        skill_id = self._ids.get(name)
+        if skill_id is not None:
+            return skill_id
+
+        with self._lock:
+            skill_id = self._ids.get(name)
+            if skill_id is None:
+                if len(self._names) >= self.max_size:
+                    return -1
+                skill_id = len(self._names)
+                self._names.append(name)
+                self._ids[name] = skill_id
+        return skill_id
+
+    def lookup(self, skill: Any) -> int:
+        """
+        Get the id of a skill without adding it.
+
+        Args:
+            skill: Raw skill name
+
+        Returns:
+            Skill id, or -1 if unknown
+        """
+        return self._ids.get(self.canonical(skill), -1)
+
+    def encode(self, skills: Iterable[Any]) -> np.ndarray:
+        """
+        Encode skill names as a sorted, de-duplicated int32 array.
+
+        Args:
+            skills: Iterable of raw skill names
+
+        Returns:
+            Sorted unique skill ids
+        """
+        ids = [self.intern(skill) for skill in skills]
+        return np.unique(np.asarray([i for i in ids if i >= 0], dtype=np.int32))
+
+    def encode_known(self, skills: Iterable[Any]) -> np.ndarray:
+        """
+        Encode request-side skill names without interning them.
+
+        Unknown skills are dropped; they cannot overlap with any loaded skill set.
+
+        Args:
+            skills: Iterable of raw skill names
+
+        Returns:
+            Sorted unique ids of the known skills
+        """
+        ids = [self.lookup(skill) for skill in skills]
+        return np.unique(np.asarray([i for i in ids if i >= 0], dtype=np.int32))
+
+    def encode_text(self, text: Any) -> np.ndarray:
+        """
+        Encode a comma-separated skills string of loaded data (LRU-memoized per distinct string).
+
+        Args:
+            text: Comma-separated skills string
+
+        Returns:
+            Sorted unique skill ids (read-only, shared between callers)
+        """
+        key = "" if text is None or (isinstance(text, float) and pd.isna(text)) else str(text)
+        with self._parse_lock:
+            encoded = self._parse_cache.get(key)
+            if encoded is not None:
+                self._parse_cache.move_to_end(key)
+                return encoded
+
+        encoded = self.encode(self.split(key))
+        encoded.setflags(write=False)
+        with self._parse_lock:
+            self._parse_cache[key] = encoded
+            if len(self._parse_cache) > self.parse_cache_size:
+                self._parse_cache.popitem(last=False)
+        return encoded
+
+    def intern_series(self, series: pd.Series) -> int:
+        """
+        Intern every skill of a comma-separated skills column.
+
+        Args:
+            series: Column of comma-separated skills strings
+
+        Returns:
+            Number of distinct strings encoded
+        """
+        values = series.dropna().astype(str).unique()
+        for text in values:
+            self.encode_text(text)
+        return len(values)
+
+    def name(self, skill_id: int) -> str:
+        """Get the canonical name of a skill id."""
+        return self._names[skill_id]
+
+    def names(self, skill_ids: Iterable[int]) -> List[str]:
+        """Get canonical names for a sequence of skill ids."""
+        return [self._names[i] for i in skill_ids]
+
+    @staticmethod
+    def display_name(skill: str) -> str:
+        """
+        Get the user-facing display name of a raw skill.
+
+        Args:
+            skill: Raw skill name
+
+        Returns:
+            Display name for aliased/known skills, otherwise the title-cased input
+        """
+        name = SkillVocabulary.canonical(skill)
+        if name in DISPLAY_NAMES:
+            return DISPLAY_NAMES[name]
+        return str(skill).strip().title()
+
+    def build_from_data(self, data_dir: str, internships_df: Optional[pd.DataFrame] = None) -> int:
+        """
+        Intern skills from internships and student profiles at load time.
+
+        Courses and alumni intern their own skills when they are loaded.
+
+        Args:
+            data_dir: Directory containing students.csv
+            internships_df: Loaded internships (required_skills column)
+
+        Returns:
+            Vocabulary size after building
+        """
+        if internships_df is not None and 'required_skills' in internships_df.columns:
+            self.intern_series(internships_df['required_skills'])
+
+        students_file = os.path.join(data_dir, "students.csv")
+        if os.path.exists(students_file):
+            try:
+                students = pd.read_csv(students_file, usecols=['skills'])
+                self.intern_series(students['skills'])
+            except Exception as e:
+                logger.warning(f"⚠️  Failed to load student skills for vocabulary: {e}")
+
+        logger.info(f"✅ Skill vocabulary built: {len(self)} skills")
+        return len(self)
+
+
+# Global instance for easy access
+_skill_vocabulary = None
+
+def get_skill_vocabulary() -> SkillVocabulary:
+    """Get or create the global skill vocabulary."""
+    global _skill_vocabulary
+    if _skill_vocabulary is None:
+        _skill_vocabulary = SkillVocabulary()
+    return _skill_vocabulary
+
+
+if __name__ == "__main__":
+    # Demo the skill vocabulary
+    print("🚀 PMIS Skill Vocabulary Demo")
+    print("=" * 50)
+
+    vocab = SkillVocabulary()
+
+    required = vocab.encode_text("python, machine learning, docker, python")
+    student = vocab.encode_known(["Python", "ML", " sql "])
+
+    print(f"📊 Vocabulary size: {len(vocab)}")
+    print(f"   Student ids:  {student.tolist()} -> {vocab.names(student)}")
+    print(f"   Required ids: {required.tolist()} -> {vocab.names(required)}")
+    print(f"   Overlap: {vocab.names(np.intersect1d(student, required))}")
+    print(f"   Missing: {vocab.names(np.setdiff1d(required, student))}")
+
+    # Request-side skills are not interned
+    assert vocab.lookup("sql") == -1
@@ -0,0 +1,675 @@
+"""
+PMIS Success Prediction Inference Module
+=======================================
+
+This module serves the calibrated logistic-regression success model
+described in models/success_prediction_metadata.json without pickle or
+scikit-learn at serving time. The fitted preprocessor (standard scaling,
+one-hot categories, TF-IDF text) and the calibrated classifier are exported
+once to a plain NumPy archive (`.npz`); serving only needs NumPy.
+
+Inference is split by feature side. Internship-side features (domain,
+location, duration, stipend, description, required skills) are encoded
+once when a catalog is bound, as a CSR matrix, and reduced to per-internship
+logit contributions with a single sparse-dense product. A request then adds
+the student-side contribution (one small sparse row), dense pair features
+when supplied, and maps the logits through the vectorized Platt or
+isotonic calibration of every calibration fold. Features the archive
+expects but the student profile or catalog lacks are logged once: missing
+numeric features sit at their training mean, missing categorical and text
+features contribute nothing.
+
+Archive layout (K = calibration folds, averaged like CalibratedClassifierCV):
+- intercept (K,), calibration ("sigmoid" | "isotonic" | "none")
+- numeric_names, numeric_mean, numeric_scale, numeric_coef (n, K)
+- categorical_names; cat:<name>:vocab, cat:<name>:coef (V, K)
+- text_names; text:<name>:vocab, text:<name>:idf, text:<name>:coef (V, K),
+  text:<name>:config [ngram_min, ngram_max, sublinear_tf, l2_norm]
+- sigmoid: platt_a (K,), platt_b (K,); isotonic: iso_x:<k>, iso_y:<k>
+
+Key Features:
+- NumPy-only loading (allow_pickle=False) and inference
+- Catalog-side logits precomputed with one CSR product
+- Vectorized Platt / isotonic calibration over all candidates
+- Offline exporter from the fitted scikit-learn objects
+- Dense reference check on synthetic archives (`python -m app.success_model check`)
+
+Environment:
+- SUCCESS_MODEL_PATH: exported archive (default: models/success_prediction_model.npz)
+
+Author: ML Engineer
+Date: September 24, 2025
+"""
+
+import os
+import re
+import json
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models")
+DEFAULT_MODEL_PATH = os.path.join(MODELS_DIR, "success_prediction_model.npz")
+FEATURES_PATH = os.path.join(MODELS_DIR, "success_prediction_features.json")
+
+FORMAT_VERSION = 1
+
+# Features describing the internship; everything else comes from the student or the pair
+INTERNSHIP_FEATURES = {
+    "domain", "location_internship", "duration", "stipend", "stipend_tier",
+    "description", "required_skills"
+}
+
+# Numeric features that depend on the student-internship pair
+PAIR_FEATURES = {"hybrid_score", "cf_score", "hybrid_v2", "score_consistency", "location_match"}
+
+# Student features read from request profiles under their API names
+STUDENT_FEATURE_ALIASES = {"tier": "college_tier"}
+
+# Internship features read from catalog columns under their catalog names
+INTERNSHIP_FEATURE_ALIASES = {"location_internship": "location"}
+
+# scikit-learn's default token pattern for CountVectorizer/TfidfVectorizer
+_TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+# (source, feature names) combinations already reported as missing
+_reported_missing = set()
+
+
+def model_path() -> str:
+    """Get the success model archive path (SUCCESS_MODEL_PATH)."""
+    return os.getenv("SUCCESS_MODEL_PATH", DEFAULT_MODEL_PATH)
+
+
+def _warn_missing(source: str, names: List[str]):
+    """Log features the archive expects but a source lacks (once per combination)."""
+    key = (source, tuple(names))
+    if key not in _reported_missing:
+        _reported_missing.add(key)
+        logger.warning(f"⚠️  Success model features missing from the {source}: {', '.join(names)} "
+                       f"(numeric ones sit at their training mean, others are dropped)")
+
+
+def _analyze(text: Any, ngram_min: int, ngram_max: int) -> List[str]:
+    """Tokenize like scikit-learn's word analyzer (lowercase, 2+ char tokens, n-grams)."""
+    if text is None or (isinstance(text, float) and np.isnan(text)):
+        return []
+    if isinstance(text, (list, tuple)):
+        text = " ".join(str(t) for t in text)
+    tokens = _TOKEN_PATTERN.findall(str(text).lower())
+    if ngram_max == 1:
+        return tokens if ngram_min == 1 else []
+
+    grams = tokens[:] if ngram_min == 1 else []
+    for n in range(max(ngram_min, 2), ngram_max + 1):
+        grams.extend(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+    return grams
+
+
+class _TextFeature:
+    """Exported TF-IDF vectorizer for one text feature."""
+
+    def __init__(self, vocab: np.ndarray, idf: np.ndarray, config: np.ndarray):
+        self.index = {term: i for i, term in enumerate(vocab.tolist())}
+        self.idf = idf.astype(np.float64)
+        self.ngram_min, self.ngram_max = int(config[0]), int(config[1])
+        self.sublinear_tf = bool(config[2])
+        self.l2_norm = bool(config[3])
+
+    def transform(self, text: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Encode one document.
+
+        Returns:
+            (term indices, tf-idf weights)
+        """
+        ids = [self.index[g] for g in _analyze(text, self.ngram_min, self.ngram_max) if g in self.index]
+        if not ids:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+
+        terms, counts = np.unique(np.asarray(ids, dtype=np.int64), return_counts=True)
+        tf = counts.astype(np.float64)
+        if self.sublinear_tf:
+            tf = 1.0 + np.log(tf)
+        weights = tf * self.idf[terms]
+        if self.l2_norm:
+            norm = np.sqrt(np.dot(weights, weights))
+            if norm > 0:
+                weights /= norm
+        return terms, weights
+
+
+class InternshipBlock:
+    """Internship-side logit contributions for a bound catalog."""
+
+    def __init__(self, internship_ids: Sequence[str], logits: np.ndarray):
+        self.internship_ids = list(internship_ids)
+        self.logits = logits
+        self._rows = {iid: i for i, iid in enumerate(self.internship_ids)}
+
+    def __len__(self) -> int:
+        return len(self.internship_ids)
+
+    def rows_for(self, internship_ids: Sequence[str]) -> np.ndarray:
+        """Map internship IDs to block rows (-1 when unknown)."""
+        rows = self._rows
+        return np.fromiter((rows.get(iid, -1) for iid in internship_ids), dtype=np.int64, count=len(internship_ids))
+
+
+class SuccessPredictionModel:
+    """Calibrated logistic-regression success model evaluated with NumPy."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        """
+        Build the model from archive arrays.
+
+        Args:
+            arrays: Contents of an exported .npz archive
+        """
+        version = int(arrays.get("format_version", FORMAT_VERSION))
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported success model format version: {version}")
+
+        self.intercept = np.atleast_1d(arrays["intercept"]).astype(np.float64)
+        self.n_folds = self.intercept.shape[0]
+
+        self.numeric_names = [str(n) for n in arrays.get("numeric_names", np.zeros(0, dtype=str))]
+        self.numeric_mean = arrays.get("numeric_mean", np.zeros(0)).astype(np.float64)
+        self.numeric_scale = arrays.get("numeric_scale", np.ones(0)).astype(np.float64)
+        self.numeric_coef = arrays.get("numeric_coef", np.zeros((0, self.n_folds))).astype(np.float64)
+        self.numeric_scale = np.where(self.numeric_scale == 0, 1.0, self.numeric_scale)
+
+        self.categorical: Dict[str, Tuple[Dict[str, int], np.ndarray]] = {}
+        for name in arrays.get("categorical_names", np.zeros(0, dtype=str)).tolist():
+            vocab = arrays[f"cat:{name}:vocab"].tolist()
+            self.categorical[name] = (
+                {str(v): i for i, v in enumerate(vocab)},
+                arrays[f"cat:{name}:coef"].astype(np.float64)
+            )
+
+        self.text: Dict[str, Tuple[_TextFeature, np.ndarray]] = {}
+        for name in arrays.get("text_names", np.zeros(0, dtype=str)).tolist():
+            self.text[name] = (
+                _TextFeature(arrays[f"text:{name}:vocab"], arrays[f"text:{name}:idf"], arrays[f"text:{name}:config"]),
+                arrays[f"text:{name}:coef"].astype(np.float64)
+            )
+
+        self.calibration = str(arrays.get("calibration", "none"))
+        if self.calibration == "sigmoid":
+            self.platt_a = np.atleast_1d(arrays["platt_a"]).astype(np.float64)
+            self.platt_b = np.atleast_1d(arrays["platt_b"]).astype(np.float64)
+        elif self.calibration == "isotonic":
+            self.iso = [
+                (arrays[f"iso_x:{k}"].astype(np.float64), arrays[f"iso_y:{k}"].astype(np.float64))
+                for k in range(self.n_folds)
+            ]
+        elif self.calibration != "none":
+            raise ValueError(f"Unknown calibration: {self.calibration}")
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "SuccessPredictionModel":
+        """Load an exported archive (no pickle)."""
+        with np.load(path or model_path(), allow_pickle=False) as archive:
+            return cls({key: archive[key] for key in archive.files})
+
+    @property
+    def feature_names(self) -> List[str]:
+        """All input features the model reads."""
+        return self.numeric_names + list(self.categorical) + list(self.text)
+
+    def _side_features(self, internship_side: bool) -> Tuple[List[int], List[str], List[str]]:
+        numeric = [i for i, n in enumerate(self.numeric_names) if (n in INTERNSHIP_FEATURES) == internship_side]
+        categorical = [n for n in self.categorical if (n in INTERNSHIP_FEATURES) == internship_side]
+        text = [n for n in self.text if (n in INTERNSHIP_FEATURES) == internship_side]
+        return numeric, categorical, text
+
+    def _numeric_contribution(self, index: int, values: np.ndarray) -> np.ndarray:
+        """Logit contribution of one numeric feature; missing values sit at the mean."""
+        values = np.asarray(values, dtype=np.float64)
+        scaled = np.nan_to_num((values - self.numeric_mean[index]) / self.numeric_scale[index], nan=0.0)
+        return np.outer(scaled, self.numeric_coef[index])
+
+    def bind_internships(self, internships: pd.DataFrame) -> InternshipBlock:
+        """
+        Precompute internship-side logit contributions for a catalog.
+
+        Categorical and text features are assembled into one CSR matrix over
+        the concatenated vocabularies and multiplied by the stacked
+        coefficients in a single sparse-dense product.
+
+        Args:
+            internships: Internship catalog
+
+        Returns:
+            Block of per-internship logits (n_internships, K)
+        """
+        n = len(internships)
+        numeric, categorical, text = self._side_features(internship_side=True)
+
+        missing: List[str] = []
+
+        def column(name):
+            source = INTERNSHIP_FEATURE_ALIASES.get(name, name)
+            if source in internships.columns:
+                return internships[source].tolist()
+            missing.append(name)
+            return [None] * n
+
+        logits = np.zeros((n, self.n_folds), dtype=np.float64)
+        for index in numeric:
+            values = pd.to_numeric(pd.Series(column(self.numeric_names[index])), errors="coerce").to_numpy()
+            logits += self._numeric_contribution(index, values)
+
+        # CSR assembly over [categorical blocks..., text blocks...]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        row_indices: List[List[np.ndarray]] = [[] for _ in range(n)]
+        row_values: List[List[np.ndarray]] = [[] for _ in range(n)]
+        coef_blocks = []
+        offset = 0
+
+        for name in categorical:
+            vocab, coef = self.categorical[name]
+            for row, value in enumerate(column(name)):
+                position = vocab.get(str(value)) if value is not None else None
+                if position is not None:
+                    row_indices[row].append(np.array([offset + position]))
+                    row_values[row].append(np.ones(1))
+            coef_blocks.append(coef)
+            offset += coef.shape[0]
+
+        for name in text:
+            vectorizer, coef = self.text[name]
+            for row, value in enumerate(column(name)):
+                terms, weights = vectorizer.transform(value)
+                if terms.size:
+                    row_indices[row].append(terms + offset)
+                    row_values[row].append(weights)
+            coef_blocks.append(coef)
+            offset += coef.shape[0]
+
+        if coef_blocks:
+            indices = [np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64) for parts in row_indices]
+            values = [np.concatenate(parts) if parts else np.zeros(0) for parts in row_values]
+            np.cumsum([len(ix) for ix in indices], out=indptr[1:])
+            logits += csr_dot(indptr, np.concatenate(indices), np.concatenate(values), np.vstack(coef_blocks))
+
+        if missing:
+            _warn_missing("internship catalog", missing)
+        return InternshipBlock(internships["internship_id"].tolist() if "internship_id" in internships else range(n), logits)
+
+    def student_logit(self, student_profile: Dict[str, Any]) -> np.ndarray:
+        """
+        Compute the student-side logit contribution (intercept included).
+
+        Args:
+            student_profile: Student profile (API field names accepted)
+
+        Returns:
+            Logit contribution per calibration fold (K,)
+        """
+        numeric, categorical, text = self._side_features(internship_side=False)
+        missing: List[str] = []
+
+        def value(name):
+            if name in student_profile:
+                return student_profile[name]
+            alias = STUDENT_FEATURE_ALIASES.get(name)
+            if alias in student_profile:
+                return student_profile[alias]
+            missing.append(name)
+            return None
+
+        logit = self.intercept.copy()
+        for index in numeric:
+            if self.numeric_names[index] in PAIR_FEATURES:
+                continue
+            raw = value(self.numeric_names[index])
+            logit += self._numeric_contribution(index, [np.nan if raw is None else raw])[0]
+        for name in categorical:
+            vocab, coef = self.categorical[name]
+            raw = value(name)
+            position = vocab.get(str(raw)) if raw is not None else None
+            if position is not None:
+                logit += coef[position]
+        for name in text:
+            vectorizer, coef = self.text[name]
+            terms, weights = vectorizer.transform(value(name))
+            if terms.size:
+                logit += weights @ coef[terms]
+
+        if missing:
+            _warn_missing("student profile", missing)
+        return logit
+
+    def calibrate(self, logits: np.ndarray) -> np.ndarray:
+        """
+        Map raw logits (n, K) to calibrated probabilities averaged over folds.
+
+        Args:
+            logits: Decision-function values per fold
+
+        Returns:
+            Calibrated probabilities (n,)
+        """
+        if self.calibration == "sigmoid":
+            probs = 1.0 / (1.0 + np.exp(logits * self.platt_a + self.platt_b))
+        elif self.calibration == "isotonic":
+            probs = np.column_stack([
+                np.interp(logits[:, k], x, y) for k, (x, y) in enumerate(self.iso)
+            ])
+        else:
+            probs = 1.0 / (1.0 + np.exp(-logits))
+        return probs.mean(axis=1)
+
+    def predict_proba(self,
+                      student_profile: Dict[str, Any],
+                      block: InternshipBlock,
+                      rows: Optional[np.ndarray] = None,
+                      pair_features: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+        """
+        Calibrated success probabilities of a student against many internships.
+
+        Args:
+            student_profile: Student profile
+            block: Bound internship block
+            rows: Block rows of the candidates (default: every internship)
+            pair_features: Optional dense student-internship features aligned with rows
+                (hybrid_score, cf_score, ...); missing ones sit at their training mean
+
+        Returns:
+            Probabilities aligned with rows
+        """
+        internship_logits = block.logits if rows is None else block.logits[rows]
+        logits = internship_logits + self.student_logit(student_profile)
+
+        if pair_features:
+            for index, name in enumerate(self.numeric_names):
+                if name in pair_features:
+                    logits += self._numeric_contribution(index, pair_features[name])
+
+        return self.calibrate(logits)
+
+
+def csr_dot(indptr: np.ndarray, indices: np.ndarray, data: np.ndarray, dense: np.ndarray) -> np.ndarray:
+    """
+    Multiply a CSR matrix by a dense matrix.
+
+    Args:
+        indptr: Row pointers (n_rows + 1,)
+        indices: Column indices (nnz,)
+        data: Values (nnz,)
+        dense: Dense right-hand side (n_cols, K)
+
+    Returns:
+        Product (n_rows, K)
+    """
+    n_rows = indptr.shape[0] - 1
+    out = np.zeros((n_rows, dense.shape[1]), dtype=np.float64)
+    if data.size == 0:
+        return out
+    row_of_entry = np.repeat(np.arange(n_rows), np.diff(indptr))
+    np.add.at(out, row_of_entry, data[:, None] * dense[indices])
+    return out
+
+
+def export_sklearn_model(model: Any, preprocessor: Any, out_path: str,
+                         features_path: str = FEATURES_PATH) -> Dict[str, Any]:
+    """
+    Export a fitted preprocessor and calibrated logistic regression to .npz.
+
+    Offline only: needs scikit-learn. The preprocessor must be a fitted
+    ColumnTransformer whose transformers are a StandardScaler over the
+    numeric features, a OneHotEncoder over the categorical features and one
+    TfidfVectorizer per text feature (in success_prediction_features.json
+    order); the model a CalibratedClassifierCV (or plain LogisticRegression).
+
+    Args:
+        model: Fitted classifier
+        preprocessor: Fitted ColumnTransformer
+        out_path: Destination .npz path
+        features_path: Feature spec JSON
+
+    Returns:
+        Summary of the exported model
+    """
+    from sklearn.preprocessing import OneHotEncoder, StandardScaler
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    with open(features_path) as f:
+        spec = json.load(f)
+
+    # Column ranges of each transformer in the transformed feature space
+    arrays: Dict[str, np.ndarray] = {"format_version": np.array(FORMAT_VERSION)}
+    blocks = []
+    text_names = []
+    start = 0
+    for name, transformer, columns in preprocessor.transformers_:
+        if transformer == "drop" or name == "remainder":
+            continue
+        if isinstance(transformer, StandardScaler):
+            width = len(columns)
+            arrays["numeric_names"] = np.array(list(columns), dtype=str)
+            arrays["numeric_mean"] = (np.asarray(transformer.mean_, dtype=np.float64)
+                                      if transformer.mean_ is not None else np.zeros(width))
+            arrays["numeric_scale"] = (np.asarray(transformer.scale_, dtype=np.float64)
+                                       if transformer.scale_ is not None else np.ones(width))
+            blocks.append(("numeric", None, start, width))
+        elif isinstance(transformer, OneHotEncoder):
+            arrays["categorical_names"] = np.array(list(columns), dtype=str)
+            for column, categories in zip(columns, transformer.categories_):
+                width = len(categories)
+                arrays[f"cat:{column}:vocab"] = np.array([str(c) for c in categories], dtype=str)
+                blocks.append(("cat", column, start, width))
+                start += width
+            continue
+        elif isinstance(transformer, TfidfVectorizer):
+            column = columns if isinstance(columns, str) else columns[0]
+            vocab = transformer.get_feature_names_out()
+            width = len(vocab)
+            text_names.append(column)
+            ngram_min, ngram_max = transformer.ngram_range
+            arrays[f"text:{column}:vocab"] = np.array(vocab, dtype=str)
+            arrays[f"text:{column}:idf"] = np.asarray(transformer.idf_, dtype=np.float64)
+            arrays[f"text:{column}:config"] = np.array(
+                [ngram_min, ngram_max, int(transformer.sublinear_tf), int(transformer.norm == "l2")]
+            )
+            blocks.append(("text", column, start, width))
+        else:
+            raise ValueError(f"Unsupported transformer {name}: {type(transformer).__name__}")
+        start += width
+    arrays["text_names"] = np.array(text_names, dtype=str)
+
+    # Folds of the calibrated classifier
+    folds = getattr(model, "calibrated_classifiers_", None)
+    if folds is None:
+        estimators, calibrators = [model], [None]
+    else:
+        estimators = [fold.estimator for fold in folds]
+        calibrators = [fold.calibrators[0] for fold in folds]
+
+    coef = np.column_stack([np.asarray(est.coef_, dtype=np.float64).ravel() for est in estimators])
+    if coef.shape[0] != start:
+        raise ValueError(f"Coefficient count {coef.shape[0]} does not match {start} transformed features")
+    arrays["intercept"] = np.array([float(np.ravel(est.intercept_)[0]) for est in estimators])
+
+    for kind, column, offset, width in blocks:
+        target = {"numeric": "numeric_coef", "cat": f"cat:{column}:coef", "text": f"text:{column}:coef"}[kind]
+        arrays[target] = coef[offset:offset + width]
+
+    if calibrators[0] is None:
+        arrays["calibration"] = np.array("none")
+    elif hasattr(calibrators[0], "a_"):
+        arrays["calibration"] = np.array("sigmoid")
+        arrays["platt_a"] = np.array([float(c.a_) for c in calibrators])
+        arrays["platt_b"] = np.array([float(c.b_) for c in calibrators])
+    else:
+        arrays["calibration"] = np.array("isotonic")
+        for k, calibrator in enumerate(calibrators):
+            arrays[f"iso_x:{k}"] = np.asarray(calibrator.X_thresholds_, dtype=np.float64)
+            arrays[f"iso_y:{k}"] = np.asarray(calibrator.y_thresholds_, dtype=np.float64)
+
+    missing = set(spec.get("numeric_features", []) + spec.get("categorical_features", [])
+                  + spec.get("text_features", [])) - set(SuccessPredictionModel(arrays).feature_names)
+    if missing:
+        logger.warning(f"⚠️  Exported model lacks features from the spec: {sorted(missing)}")
+
+    np.savez_compressed(out_path, **arrays)
+    logger.info(f"✅ Exported success model to {out_path} ({start} features, {len(estimators)} folds)")
+    return {"path": out_path, "features": start, "folds": len(estimators),
+            "calibration": str(arrays["calibration"])}
+
+
+# Global instance for easy access
+_success_model = None
+_success_model_loaded = False
+
+def get_success_model() -> Optional[SuccessPredictionModel]:
+    """Get the exported success model, or None when no archive is deployed."""
+    global _success_model, _success_model_loaded
+    if not _success_model_loaded:
+        _success_model_loaded = True
+        path = model_path()
+        if os.path.exists(path):
+            try:
+                _success_model = SuccessPredictionModel.load(path)
+                logger.info(f"✅ Loaded success prediction model: {path}")
+            except Exception as e:
+                logger.warning(f"⚠️  Failed to load success prediction model: {e}")
+        else:
+            logger.info("ℹ️  No exported success prediction model; using rule-based scoring")
+    return _success_model
+
+
+def _synthetic_arrays(catalog: pd.DataFrame, calibration: str, seed: int = 0, folds: int = 3) -> Dict[str, np.ndarray]:
+    """Random archive over the feature spec, with vocabularies drawn from a catalog (for checks)."""
+    rng = np.random.default_rng(seed)
+    with open(FEATURES_PATH) as f:
+        spec = json.load(f)
+
+    numeric = spec["numeric_features"]
+    arrays: Dict[str, np.ndarray] = {
+        "format_version": np.array(FORMAT_VERSION),
+        "intercept": rng.normal(size=folds),
+        "calibration": np.array(calibration),
+        "numeric_names": np.array(numeric),
+        "numeric_mean": rng.normal(size=len(numeric)),
+        "numeric_scale": rng.uniform(0.5, 2.0, len(numeric)),
+        "numeric_coef": rng.normal(size=(len(numeric), folds)),
+        "categorical_names": np.array(spec["categorical_features"]),
+        "text_names": np.array(spec["text_features"]),
+    }
+    for name in spec["categorical_features"]:
+        source = INTERNSHIP_FEATURE_ALIASES.get(name, name)
+        if source in catalog.columns:
+            vocab = sorted(set(map(str, catalog[source].unique())))[:20]
+        else:
+            vocab = ["Tier-1", "Tier-2", "Tier-3"]
+        arrays[f"cat:{name}:vocab"] = np.array(vocab)
+        arrays[f"cat:{name}:coef"] = rng.normal(size=(len(vocab), folds))
+
+    terms = sorted({g for text in catalog["required_skills"].astype(str) for g in _analyze(text, 1, 2)})
+    for name in spec["text_features"]:
+        arrays[f"text:{name}:vocab"] = np.array(terms)
+        arrays[f"text:{name}:idf"] = rng.uniform(1.0, 5.0, len(terms))
+        arrays[f"text:{name}:coef"] = rng.normal(size=(len(terms), folds))
+        arrays[f"text:{name}:config"] = np.array([1, 2, 1, 1])
+
+    if calibration == "sigmoid":
+        arrays["platt_a"] = -rng.uniform(0.5, 2.0, folds)
+        arrays["platt_b"] = rng.normal(size=folds)
+    elif calibration == "isotonic":
+        for k in range(folds):
+            arrays[f"iso_x:{k}"] = np.sort(rng.normal(size=20) * 5)
+            arrays[f"iso_y:{k}"] = np.sort(rng.uniform(size=20))
+    return arrays
+
+
+def _dense_probability(arrays: Dict[str, np.ndarray], features: Dict[str, Any]) -> float:
+    """Reference probability from one dense feature vector (slow; for checks)."""
+    logit = arrays["intercept"].astype(np.float64).copy()
+    for i, name in enumerate(arrays["numeric_names"].tolist()):
+        if features.get(name) is not None:
+            scaled = (float(features[name]) - arrays["numeric_mean"][i]) / arrays["numeric_scale"][i]
+            logit += scaled * arrays["numeric_coef"][i]
+    for name in arrays["categorical_names"].tolist():
+        vocab = arrays[f"cat:{name}:vocab"].tolist()
+        if features.get(name) is not None and str(features[name]) in vocab:
+            logit += arrays[f"cat:{name}:coef"][vocab.index(str(features[name]))]
+    for name in arrays["text_names"].tolist():
+        vocab = arrays[f"text:{name}:vocab"].tolist()
+        counts = np.zeros(len(vocab))
+        for gram in _analyze(features.get(name), 1, 2):
+            if gram in vocab:
+                counts[vocab.index(gram)] += 1
+        tfidf = np.where(counts > 0, 1.0 + np.log(np.maximum(counts, 1.0)), 0.0) * arrays[f"text:{name}:idf"]
+        norm = np.linalg.norm(tfidf)
+        logit += (tfidf / norm if norm else tfidf) @ arrays[f"text:{name}:coef"]
+
+    calibration = str(arrays["calibration"])
+    if calibration == "sigmoid":
+        probs = 1.0 / (1.0 + np.exp(logit * arrays["platt_a"] + arrays["platt_b"]))
+    elif calibration == "isotonic":
+        probs = np.array([np.interp(logit[k], arrays[f"iso_x:{k}"], arrays[f"iso_y:{k}"]) for k in range(len(logit))])
+    else:
+        probs = 1.0 / (1.0 + np.exp(-logit))
+    return float(probs.mean())
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Export or benchmark the NumPy success model")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export", help="Export fitted scikit-learn pickles to .npz (offline)")
+    export.add_argument("--model", default=os.path.join(MODELS_DIR, "success_prediction_model.pkl"))
+    export.add_argument("--preprocessor", default=os.path.join(MODELS_DIR, "success_prediction_preprocessor.pkl"))
+    export.add_argument("--out", default=DEFAULT_MODEL_PATH)
+    bench = sub.add_parser("bench", help="Score one student against a catalog")
+    bench.add_argument("--data", default="api_data/internships_enhanced.csv")
+    check = sub.add_parser("check", help="Compare inference with a dense reference on synthetic archives")
+    check.add_argument("--data", default="api_data/internships_enhanced.csv")
+    check.add_argument("--rows", type=int, default=40)
+    args = parser.parse_args()
+
+    print("🚀 PMIS Success Prediction Inference")
+    print("=" * 50)
+
+    if args.command == "export":
+        import joblib
+        summary = export_sklearn_model(joblib.load(args.model), joblib.load(args.preprocessor), args.out)
+        print(f"✅ {summary}")
+    elif args.command == "check":
+        catalog = pd.read_csv(args.data)
+        student = {"skills": ["python", "sql", "machine learning"], "college_tier": "Tier-2", "cgpa": 8.1,
+                   "interests": "data science", "university": "IIT Delhi",
+                   "stream": "Computer Science", "rural_urban": "Urban"}
+        for calibration in ("sigmoid", "isotonic", "none"):
+            arrays = _synthetic_arrays(catalog, calibration)
+            model = SuccessPredictionModel(arrays)
+            probs = model.predict_proba(student, model.bind_internships(catalog))
+
+            reference = [
+                _dense_probability(arrays, {
+                    "cgpa": student["cgpa"], "tier": student["college_tier"], "university": student["university"],
+                    "skills": student["skills"], "interests": student["interests"],
+                    "stipend": row["stipend"], "domain": row["domain"], "location_internship": row["location"],
+                    "duration": row["duration"], "description": row["description"],
+                    "required_skills": row["required_skills"],
+                })
+                for _, row in catalog.head(args.rows).iterrows()
+            ]
+            assert np.allclose(probs[:args.rows], reference), calibration
+            print(f"✅ {calibration}: {args.rows} internships match the dense reference")
+    else:
+        model = SuccessPredictionModel.load()
+        catalog = pd.read_csv(args.data)
+        block = model.bind_internships(catalog)
+        start = time.perf_counter()
+        probs = model.predict_proba({"skills": ["python", "sql"], "college_tier": "Tier-2", "cgpa": 8.0}, block)
+        print(f"📊 Scored {len(probs)} internships in {(time.perf_counter() - start) * 1000:.2f} ms "
+              f"(mean p={probs.mean():.4f})")
@@ -0,0 +1,210 @@
+"""
+PMIS Request Stage Tracing Module
+================================
+
+This module provides lightweight per-request span instrumentation for the
+recommendation pipeline. A trace is attached to the current request by the
+logging middleware; code anywhere below it (including worker threads that
+copy the request context) records named stages with `span()`. Stage
+timings are added to the request completion log and, optionally, to a
+`Server-Timing` response header.
+
+When tracing is disabled, or no trace is active, `span()` returns a shared
+no-op object, so instrumented code pays only a context-variable lookup.
+
+Key Features:
+- Context-variable propagation (async handlers and copied thread contexts)
+- Stages with the same name accumulate (e.g. per-recommendation work)
+- Server-Timing header rendering
+- No-op fast path when disabled
+
+Environment:
+- STAGE_TIMING_ENABLED: record stage timings (default: true)
+- SERVER_TIMING_HEADER: add a Server-Timing response header (default: false)
+
+Author: ML Engineer
+Date: September 24, 2025
+"""
+
+import os
+import re
+import time
+from contextvars import ContextVar, Token
+from typing import Dict, List, Optional, Tuple
+
+_TRUE_VALUES = ("1", "true", "yes", "on")
+
+_TOKEN_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]")
+
+_current_trace: ContextVar[Optional["RequestTrace"]] = ContextVar("pmis_request_trace", default=None)
+
+
+def tracing_enabled() -> bool:
+    """Whether stage timings are recorded (STAGE_TIMING_ENABLED)."""
+    return os.getenv("STAGE_TIMING_ENABLED", "true").lower() in _TRUE_VALUES
+
+
+def server_timing_enabled() -> bool:
+    """Whether the Server-Timing response header is emitted (SERVER_TIMING_HEADER)."""
+    return os.getenv("SERVER_TIMING_HEADER", "false").lower() in _TRUE_VALUES
+
+
+class _NoopSpan:
+    """Span returned when no trace is active."""
+
+    __slots__ = ()
+
+    def end(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    """A running stage; records its duration on end() or when the with-block exits."""
+
+    __slots__ = ("trace", "name", "start")
+
+    def __init__(self, trace: "RequestTrace", name: str):
+        self.trace = trace
+        self.name = name
+        self.start = time.perf_counter()
+
+    def end(self):
+        self.trace.record(self.name, (time.perf_counter() - self.start) * 1000)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end()
+        return False
+
+
+class RequestTrace:
+    """
+    Stage timings of one request.
+
+    Stages keep first-recorded order; repeated stages sum their durations
+    and count their occurrences.
+    """
+
+    def __init__(self):
+        """Initialize an empty trace."""
+        self._stages: Dict[str, List[float]] = {}
+
+    def record(self, name: str, duration_ms: float):
+        """
+        Add a stage duration.
+
+        Args:
+            name: Stage name
+            duration_ms: Duration in milliseconds
+        """
+        stage = self._stages.get(name)
+        if stage is None:
+            self._stages[name] = [duration_ms, 1]
+        else:
+            stage[0] += duration_ms
+            stage[1] += 1
+
+    def span(self, name: str) -> _Span:
+        """Start a span recorded into this trace."""
+        return _Span(self, name)
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Get stage timings for logging.
+
+        Returns:
+            Dict mapping stage name to total milliseconds
+        """
+        return {name: round(total, 3) for name, (total, _) in self._stages.items()}
+
+    def counts(self) -> Dict[str, int]:
+        """Get how many times each stage was recorded."""
+        return {name: int(count) for name, (_, count) in self._stages.items()}
+
+    def server_timing(self) -> str:
+        """
+        Render the trace as a Server-Timing header value.
+
+        Returns:
+            Header value, e.g. "score;dur=812.4, build_response;dur=3.1"
+        """
+        return ", ".join(
+            f"{_TOKEN_UNSAFE.sub('_', name)};dur={total:.1f}"
+            for name, (total, _) in self._stages.items()
+        )
+
+
+def start_trace() -> Tuple[Optional[RequestTrace], Optional[Token]]:
+    """
+    Attach a new trace to the current context.
+
+    Returns:
+        (trace, token) - both None when tracing is disabled
+    """
+    if not tracing_enabled():
+        return None, None
+    trace = RequestTrace()
+    return trace, _current_trace.set(trace)
+
+
+def end_trace(token: Optional[Token]):
+    """Detach the trace attached by start_trace()."""
+    if token is not None:
+        _current_trace.reset(token)
+
+
+def current_trace() -> Optional[RequestTrace]:
+    """Get the trace of the current request, if any."""
+    return _current_trace.get()
+
+
+def span(name: str):
+    """
+    Time a pipeline stage of the current request.
+
+    Use as a context manager (`with span("score"):`) so the stage is recorded
+    even when it raises. Returns a shared no-op span when no trace is active.
+
+    Args:
+        name: Stage name
+
+    Returns:
+        Span object
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return _NOOP_SPAN
+    return _Span(trace, name)
+
+
+if __name__ == "__main__":
+    # Demo the tracing module
+    print("🚀 PMIS Request Stage Tracing Demo")
+    print("=" * 50)
+
+    trace, token = start_trace()
+
+    with span("filter_active"):
+        time.sleep(0.01)
+    for _ in range(3):
+        with span("course_suggestions"):
+            time.sleep(0.002)
+    with span("build_response"):
+        time.sleep(0.005)
+
+    end_trace(token)
+
+    print(f"📊 Stages: {trace.as_dict()}")
+    print(f"   Counts: {trace.counts()}")
+    print(f"   Server-Timing: {trace.server_timing()}")
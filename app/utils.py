@@ -9,6 +9,14 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+try:
+    from .skill_vocab import get_skill_vocabulary
+    from .explanations import explain_generic
+except ImportError:
+    # Fallback for direct execution
+    from skill_vocab import get_skill_vocabulary
+    from explanations import explain_generic
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,53 +65,7 @@ def generate_explanations(
     Returns:
         List of explanation strings
     """
-    explanations = []
-    
-    # Skill-based explanations
-    if student_skills:
-        top_skills = student_skills[:2]
-        explanations.append(f"Strong skill match: {', '.join(top_skills)}")
-    
-    # CGPA-based explanations
-    if cgpa >= 8.5:
-        explanations.append(f"Exceptional CGPA ({cgpa}) significantly increases selection chances")
-    elif cgpa >= 7.5:
-        explanations.append(f"Good CGPA ({cgpa}) meets company standards")
-    else:
-        explanations.append(f"CGPA ({cgpa}) is acceptable for this role")
-    
-    # Stream-based explanations
-    explanations.append(f"Your {stream} background aligns well with this role")
-    
-    # College tier explanations
-    tier_messages = {
-        "Tier-1": "Premier college background is highly valued by employers",
-        "Tier-2": "Strong college background demonstrates academic capability", 
-        "Tier-3": "Your potential and skills matter more than college ranking"
-    }
-    explanations.append(tier_messages.get(college_tier, "Your academic background is suitable"))
-    
-    # Success probability explanations
-    if success_prob >= 0.8:
-        explanations.append("High success probability indicates excellent fit")
-    elif success_prob >= 0.6:
-        explanations.append("Good success probability suggests strong candidacy")
-    else:
-        explanations.append("Consider developing relevant skills to improve chances")
-    
-    # Domain-specific explanations
-    domain_messages = {
-        "Technology": "Tech industry offers excellent growth opportunities",
-        "Software": "Software development skills are in high demand",
-        "Artificial Intelligence": "AI field is rapidly expanding with great career prospects",
-        "Data Science": "Data science expertise is highly sought after",
-        "Finance": "Financial sector values analytical and quantitative skills"
-    }
-    
-    if internship_domain in domain_messages:
-        explanations.append(domain_messages[internship_domain])
-    
-    return explanations[:4]  # Limit to top 4 explanations
+    return explain_generic(student_skills, cgpa, stream, college_tier, internship_domain, success_prob)
 
 
 def validate_student_data(
@@ -212,9 +174,10 @@ def log_recommendation_request(
         rural_urban: Location type
         college_tier: College tier
     """
-    logger.info(f"📊 Recommendation Request - Student: {student_id}, "
-                f"Skills: {len(skills)}, Stream: {stream}, "
-                f"CGPA: {cgpa}, Location: {rural_urban}, Tier: {college_tier}")
+    logger.info("📊 Recommendation Request - Student: %s, "
+                "Skills: %d, Stream: %s, "
+                "CGPA: %s, Location: %s, Tier: %s",
+                student_id, len(skills), stream, cgpa, rural_urban, college_tier)
 
 
 def get_skill_categories() -> Dict[str, List[str]]:
@@ -255,30 +218,21 @@ def normalize_skills(skills: List[str]) -> List[str]:
     """
     Normalize and clean skill names.
     
+    Aliases (e.g. "ml", "js") are resolved through the shared skill
+    vocabulary and duplicates are removed by canonical skill.
+    
     Args:
         skills: Raw skill names
         
     Returns:
         Normalized skill names
     """
-    normalized = []
-    skill_mappings = {
-        "ml": "Machine Learning",
-        "ai": "Artificial Intelligence", 
-        "js": "JavaScript",
-        "ts": "TypeScript",
-        "py": "Python",
-        "reactjs": "React",
-        "nodejs": "Node.js",
-        "aws": "AWS",
-        "gcp": "Google Cloud Platform"
-    }
+    vocab = get_skill_vocabulary()
+    normalized = {}
     
     for skill in skills:
-        skill_clean = skill.strip().lower()
-        if skill_clean in skill_mappings:
-            normalized.append(skill_mappings[skill_clean])
-        else:
-            normalized.append(skill.strip().title())
+        canonical = vocab.canonical(skill)
+        if canonical and canonical not in normalized:
+            normalized[canonical] = vocab.display_name(skill)
     
-    return list(set(normalized))  # Remove duplicates
+    return list(normalized.values())  # Remove duplicates
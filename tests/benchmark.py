@@ -0,0 +1,274 @@
+"""
+PMIS Recommendation Benchmark Suite
+==================================
+
+In-process benchmarks for the recommendation hot path. Unlike the live-API
+tests, these time each stage separately against synthetic catalogs of
+increasing size (see synthetic_catalog.py) and emit JSON that can be
+compared across commits.
+
+Benchmarks:
+- load_data: engine startup (all loaders + precomputation)
+- score_pair: calculate_student_internship_score for one pair
+- get_fixed_recommendations: full top-N request (cache cleared)
+- suggest_courses: CourseReadinessScorer.suggest_courses_for_missing_skills
+- similar_alumni: AlumniManager.similar_alumni
+- lookup_*: per-id loader lookups (internship, app stats, interview meta)
+
+Usage:
+    python -m tests.benchmark --sizes 1000,10000,100000 --output bench.json
+
+Author: QA Engineer
+Date: September 24, 2025
+"""
+
+import os
+import sys
+import io
+import json
+import time
+import shutil
+import logging
+import argparse
+import platform
+import tempfile
+import subprocess
+import contextlib
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import ml_model_fixed
+from app.ml_model_fixed import FixedRecommendationEngine, get_fixed_recommendations
+from tests.synthetic_catalog import generate_catalog
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+BENCH_STUDENT = {
+    "student_id": "BENCH_STU_0001",
+    "skills": ["Python", "SQL", "Machine Learning", "Docker"],
+    "stream": "Computer Science",
+    "cgpa": 8.2,
+    "rural_urban": "rural",
+    "college_tier": "Tier-2"
+}
+
+
+class BenchmarkRunner:
+    """Runs the benchmark suite for a set of catalog sizes."""
+
+    def __init__(self, sizes: List[int], repeats: int = 5, max_seconds: float = 30.0, seed: int = 42):
+        """
+        Initialize the benchmark runner.
+
+        Args:
+            sizes: Catalog sizes (number of internships)
+            repeats: Target repetitions per benchmark
+            max_seconds: Time budget per benchmark (at least one repetition always runs)
+            seed: Random seed for synthetic data
+        """
+        self.sizes = sizes
+        self.repeats = repeats
+        self.max_seconds = max_seconds
+        self.seed = seed
+
+    def time_call(self, func: Callable[[int], Any], repeats: Optional[int] = None) -> Dict[str, float]:
+        """
+        Time repeated calls of func(iteration) and summarize the durations.
+
+        Args:
+            func: Callable receiving the iteration index
+            repeats: Repetitions (defaults to the runner setting)
+
+        Returns:
+            Dict with n, min/median/mean/p95/max in milliseconds
+        """
+        repeats = repeats or self.repeats
+        durations = []
+        budget_start = time.perf_counter()
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i in range(repeats):
+                start = time.perf_counter()
+                func(i)
+                durations.append((time.perf_counter() - start) * 1000)
+                if time.perf_counter() - budget_start > self.max_seconds:
+                    break
+
+        values = np.asarray(durations)
+        return {
+            "n": int(len(values)),
+            "min_ms": round(float(values.min()), 4),
+            "median_ms": round(float(np.median(values)), 4),
+            "mean_ms": round(float(values.mean()), 4),
+            "p95_ms": round(float(np.percentile(values, 95)), 4),
+            "max_ms": round(float(values.max()), 4)
+        }
+
+    def run_size(self, n_internships: int) -> Dict[str, Any]:
+        """
+        Run every benchmark against one synthetic catalog size.
+
+        Args:
+            n_internships: Number of internships in the catalog
+
+        Returns:
+            Dict mapping benchmark name to timing summary
+        """
+        print(f"\n📦 Catalog: {n_internships:,} internships")
+        data_dir = tempfile.mkdtemp(prefix=f"pmis_bench_{n_internships}_")
+        results = {}
+
+        try:
+            generate_catalog(data_dir, n_internships, seed=self.seed)
+
+            engines = []
+
+            def load(_):
+                engine = FixedRecommendationEngine(data_dir)
+                engine.load_data()
+                engines.append(engine)
+
+            results["load_data"] = self.time_call(load, repeats=min(self.repeats, 3))
+            engine = engines[-1]
+            ml_model_fixed.fixed_recommendation_engine = engine
+
+            internships = engine.data_loader.internships_df
+            sample = internships.sample(n=min(200, len(internships)), random_state=self.seed)
+            rows = [row for _, row in sample.iterrows()]
+            ids = sample["internship_id"].tolist()
+
+            results["score_pair"] = self.time_call(
+                lambda i: engine.calculate_student_internship_score(BENCH_STUDENT, rows[i % len(rows)]),
+                repeats=max(self.repeats, len(rows))
+            )
+
+            def recommend(i):
+                engine.clear_cache()
+                get_fixed_recommendations(
+                    student_id=f"BENCH_STU_{i:04d}",
+                    skills=BENCH_STUDENT["skills"],
+                    stream=BENCH_STUDENT["stream"],
+                    cgpa=BENCH_STUDENT["cgpa"],
+                    rural_urban=BENCH_STUDENT["rural_urban"],
+                    college_tier=BENCH_STUDENT["college_tier"],
+                    top_n=5
+                )
+
+            results["get_fixed_recommendations"] = self.time_call(recommend)
+
+            skills_set = {s.lower() for s in BENCH_STUDENT["skills"]}
+            results["suggest_courses"] = self.time_call(
+                lambda i: engine.course_scorer.suggest_courses_for_missing_skills(
+                    skills_set, ["machine learning", "sql", "tableau"], None, 3
+                ),
+                repeats=max(self.repeats, 50)
+            )
+
+            alumni_features = {
+                "skills": ", ".join(BENCH_STUDENT["skills"]),
+                "stream": BENCH_STUDENT["stream"],
+                "college_tier": BENCH_STUDENT["college_tier"]
+            }
+            results["similar_alumni"] = self.time_call(
+                lambda i: engine.alumni_loader.similar_alumni(alumni_features, max_results=3),
+                repeats=max(self.repeats, 50)
+            )
+
+            results["lookup_internship"] = self.time_call(
+                lambda i: engine.data_loader.get_internship_by_id(ids[i % len(ids)]),
+                repeats=max(self.repeats, len(ids))
+            )
+            results["lookup_app_stats"] = self.time_call(
+                lambda i: engine.app_stats_loader.get_stats_for_internship(ids[i % len(ids)]),
+                repeats=max(self.repeats, len(ids))
+            )
+            results["lookup_interview_meta"] = self.time_call(
+                lambda i: engine.interview_loader.get_interview_meta_for_internship(ids[i % len(ids)]),
+                repeats=max(self.repeats, len(ids))
+            )
+
+            for name, stats in results.items():
+                print(f"   {name:<28} median {stats['median_ms']:>10.3f} ms  (n={stats['n']})")
+
+        finally:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+        return results
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run the full suite.
+
+        Returns:
+            JSON-serializable results with environment metadata
+        """
+        print("🚀 PMIS Recommendation Benchmarks")
+        print("=" * 50)
+
+        report = {"meta": self._environment(), "results": {}}
+        for size in self.sizes:
+            report["results"][str(size)] = self.run_size(size)
+        return report
+
+    def _environment(self) -> Dict[str, Any]:
+        """Collect metadata needed to compare runs across commits."""
+        try:
+            commit = subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5
+            ).stdout.strip() or None
+        except Exception:
+            commit = None
+
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "git_commit": commit,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "sizes": self.sizes,
+            "repeats": self.repeats,
+            "max_seconds": self.max_seconds,
+            "seed": self.seed
+        }
+
+
+def main():
+    """Main entry point for the benchmark runner."""
+    parser = argparse.ArgumentParser(description="PMIS in-process recommendation benchmarks")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="Comma-separated catalog sizes (default: 1000,10000,100000)")
+    parser.add_argument("--repeats", type=int, default=5, help="Repetitions per benchmark")
+    parser.add_argument("--max-seconds", type=float, default=30.0, help="Time budget per benchmark")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for synthetic data")
+    parser.add_argument("--output", default=None, help="Write JSON results to this file (default: stdout)")
+    args = parser.parse_args()
+
+    # Keep application logging out of the timings
+    logging.disable(logging.INFO)
+
+    runner = BenchmarkRunner(
+        sizes=[int(s) for s in args.sizes.split(",") if s.strip()],
+        repeats=args.repeats,
+        max_seconds=args.max_seconds,
+        seed=args.seed
+    )
+    report = runner.run()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+        print(f"\n💾 Results written to {args.output}")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,397 @@
+"""
+PMIS In-Process Load Harness
+===========================
+
+Drives the FastAPI app in-process through an ASGI client (no server or
+network needed) at a configurable concurrency and request mix, or replays
+a recorded request log.
+
+Reports:
+- p50/p95/p99 latency overall and per endpoint
+- Throughput (requests/second)
+- Timeout-fallback rate (/recommendations answered with an empty list)
+- Process memory (RSS) over time and its growth
+
+Usage:
+    python -m tests.load_harness --requests 200 --concurrency 8
+    python -m tests.load_harness --mix recommendations=8,health=1,meta=1 --record run.jsonl
+    python -m tests.load_harness --replay run.jsonl --output load.json
+
+Author: QA Engineer
+Date: September 24, 2025
+"""
+
+import os
+import sys
+import io
+import json
+import time
+import asyncio
+import logging
+import argparse
+import resource
+import contextlib
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import httpx
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests.synthetic_catalog import BASE_SKILLS
+
+# Endpoint name -> (method, path) used by --mix
+ENDPOINTS = {
+    "recommendations": ("POST", "/recommendations"),
+    "health": ("GET", "/health"),
+    "health_detailed": ("GET", "/health/detailed"),
+    "meta": ("GET", "/meta")
+}
+
+DEFAULT_MIX = "recommendations=8,health=1,meta=1"
+
+STREAMS = ["Computer Science", "Information Technology", "Data Science", "Electronics", "Mechanical"]
+TIERS = ["Tier-1", "Tier-2", "Tier-3"]
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """
+    Parse a request mix like "recommendations=8,health=1".
+
+    Args:
+        mix: Comma-separated endpoint=weight pairs
+
+    Returns:
+        Dict mapping endpoint name to normalized weight
+    """
+    weights = {}
+    for part in mix.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{name}' (choose from {', '.join(ENDPOINTS)})")
+        weights[name] = float(weight or 1)
+
+    total = sum(weights.values())
+    if total <= 0:
+        raise ValueError("Request mix must have a positive total weight")
+    return {name: weight / total for name, weight in weights.items()}
+
+
+def generate_requests(n_requests: int, mix: Dict[str, float], n_students: int = 100,
+                      seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    Generate a seeded request sequence.
+
+    Student profiles are drawn from a fixed pool so repeated students exercise
+    the recommendation cache the way real traffic does.
+
+    Args:
+        n_requests: Number of requests
+        mix: Normalized endpoint weights
+        n_students: Size of the student pool
+        seed: Random seed
+
+    Returns:
+        List of {"method", "path", "body"} records
+    """
+    rng = np.random.default_rng(seed)
+    students = []
+    for i in range(max(n_students, 1)):
+        skills = rng.choice(BASE_SKILLS, size=int(rng.integers(1, 6)), replace=False)
+        students.append({
+            "student_id": f"LOAD_STU_{i:05d}",
+            "skills": [str(s).title() for s in skills],
+            "stream": str(rng.choice(STREAMS)),
+            "cgpa": round(float(rng.uniform(5.5, 9.8)), 2),
+            "rural_urban": str(rng.choice(["Urban", "Rural"])),
+            "college_tier": str(rng.choice(TIERS))
+        })
+
+    names = list(mix)
+    picks = rng.choice(len(names), size=n_requests, p=[mix[name] for name in names])
+    student_picks = rng.integers(0, len(students), size=n_requests)
+
+    requests = []
+    for pick, student in zip(picks, student_picks):
+        method, path = ENDPOINTS[names[pick]]
+        record = {"method": method, "path": path}
+        if method == "POST":
+            record["body"] = students[student]
+        requests.append(record)
+    return requests
+
+
+def load_request_log(path: str) -> List[Dict[str, Any]]:
+    """
+    Load a recorded request log (JSON lines with method, path and optional body).
+
+    Args:
+        path: Request log path
+
+    Returns:
+        List of request records
+    """
+    requests = []
+    with open(path) as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if "method" not in record or "path" not in record:
+                raise ValueError(f"{path}:{line_no}: request records need 'method' and 'path'")
+            requests.append(record)
+    return requests
+
+
+def current_rss_mb() -> float:
+    """Get the current resident set size in MB (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def latency_summary(latencies_ms: List[float]) -> Dict[str, float]:
+    """Summarize latencies as p50/p95/p99/mean/max in milliseconds."""
+    if not latencies_ms:
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "mean_ms": 0.0, "max_ms": 0.0}
+    values = np.asarray(latencies_ms)
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "mean_ms": round(float(values.mean()), 3),
+        "max_ms": round(float(values.max()), 3)
+    }
+
+
+class LoadHarness:
+    """Replays a request sequence against the ASGI app at fixed concurrency."""
+
+    def __init__(self, app, concurrency: int = 8, timeout: float = 30.0,
+                 memory_interval: float = 1.0, data_path: Optional[str] = None):
+        """
+        Initialize the load harness.
+
+        Args:
+            app: ASGI application
+            concurrency: Number of concurrent in-flight requests
+            timeout: Client-side timeout per request in seconds
+            memory_interval: Seconds between RSS samples
+            data_path: Optional dataset directory to load instead of the default
+        """
+        self.app = app
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.memory_interval = memory_interval
+        self.data_path = data_path
+        self.results: List[Dict[str, Any]] = []
+        self.memory_timeline: List[Dict[str, float]] = []
+
+    async def _send(self, client: httpx.AsyncClient, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one request and classify its outcome."""
+        method, path = record["method"].upper(), record["path"]
+        start = time.perf_counter()
+        status_code, fallback, error = None, False, None
+
+        try:
+            response = await client.request(method, path, json=record.get("body"))
+            status_code = response.status_code
+            if method == "POST" and path == "/recommendations" and status_code == 200:
+                fallback = response.json().get("total_recommendations", 0) == 0
+        except Exception as e:
+            error = type(e).__name__
+
+        return {
+            "endpoint": f"{method} {path}",
+            "latency_ms": (time.perf_counter() - start) * 1000,
+            "status": status_code,
+            "fallback": fallback,
+            "error": error
+        }
+
+    async def _sample_memory(self, started: float, stop: asyncio.Event):
+        """Record RSS until stopped."""
+        while True:
+            self.memory_timeline.append({
+                "t_s": round(time.perf_counter() - started, 3),
+                "rss_mb": round(current_rss_mb(), 2),
+                "completed": len(self.results)
+            })
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.memory_interval)
+                return
+            except asyncio.TimeoutError:
+                continue
+
+    async def run(self, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run the request sequence and build the report.
+
+        Args:
+            requests: Request records in dispatch order
+
+        Returns:
+            JSON-serializable report
+        """
+        async with self.app.router.lifespan_context(self.app):
+            if self.data_path:
+                from app.ml_model import initialize_ml_model
+                initialize_ml_model(self.data_path)
+
+            transport = httpx.ASGITransport(app=self.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadtest",
+                                         timeout=self.timeout) as client:
+                queue: asyncio.Queue = asyncio.Queue()
+                for record in requests:
+                    queue.put_nowait(record)
+
+                async def worker():
+                    while True:
+                        try:
+                            record = queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            return
+                        self.results.append(await self._send(client, record))
+
+                started = time.perf_counter()
+                stop = asyncio.Event()
+                sampler = asyncio.create_task(self._sample_memory(started, stop))
+
+                await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+                wall_s = time.perf_counter() - started
+
+                stop.set()
+                await sampler
+                self.memory_timeline.append({
+                    "t_s": round(wall_s, 3),
+                    "rss_mb": round(current_rss_mb(), 2),
+                    "completed": len(self.results)
+                })
+
+        return self._report(wall_s)
+
+    def _report(self, wall_s: float) -> Dict[str, Any]:
+        """Aggregate per-request results into the final report."""
+        by_endpoint: Dict[str, List[Dict[str, Any]]] = {}
+        for result in self.results:
+            by_endpoint.setdefault(result["endpoint"], []).append(result)
+
+        def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+            recommendation_calls = [r for r in results if r["endpoint"] == "POST /recommendations"
+                                    and r["status"] == 200]
+            fallbacks = sum(r["fallback"] for r in recommendation_calls)
+            errors = sum(1 for r in results if r["error"] or (r["status"] or 500) >= 500)
+            summary = {
+                "requests": len(results),
+                "errors": errors,
+                "error_rate": round(errors / len(results), 4) if results else 0.0,
+                "timeout_fallbacks": fallbacks,
+                "timeout_fallback_rate": round(fallbacks / len(recommendation_calls), 4)
+                if recommendation_calls else 0.0
+            }
+            summary.update(latency_summary([r["latency_ms"] for r in results]))
+            return summary
+
+        rss = [sample["rss_mb"] for sample in self.memory_timeline]
+        return {
+            "meta": {
+                "timestamp": datetime.now().isoformat(),
+                "concurrency": self.concurrency,
+                "data_path": self.data_path
+            },
+            "wall_seconds": round(wall_s, 3),
+            "throughput_rps": round(len(self.results) / wall_s, 3) if wall_s > 0 else 0.0,
+            "overall": summarize(self.results),
+            "endpoints": {name: summarize(results) for name, results in sorted(by_endpoint.items())},
+            "memory": {
+                "start_rss_mb": rss[0] if rss else None,
+                "end_rss_mb": rss[-1] if rss else None,
+                "peak_rss_mb": max(rss) if rss else None,
+                "growth_mb": round(rss[-1] - rss[0], 2) if rss else None,
+                "timeline": self.memory_timeline
+            }
+        }
+
+
+def print_report(report: Dict[str, Any]):
+    """Print a human-readable summary of a load report."""
+    overall = report["overall"]
+    print(f"\n📊 {overall['requests']} requests in {report['wall_seconds']:.2f}s "
+          f"({report['throughput_rps']:.1f} req/s, concurrency {report['meta']['concurrency']})")
+    print(f"   Latency p50 {overall['p50_ms']:.1f} ms | p95 {overall['p95_ms']:.1f} ms | p99 {overall['p99_ms']:.1f} ms")
+    print(f"   Errors: {overall['errors']} | Timeout fallbacks: {overall['timeout_fallbacks']} "
+          f"({overall['timeout_fallback_rate']:.1%} of recommendations)")
+
+    for name, summary in report["endpoints"].items():
+        print(f"   {name:<24} n={summary['requests']:<6} p50 {summary['p50_ms']:>9.1f} ms  "
+              f"p99 {summary['p99_ms']:>9.1f} ms")
+
+    memory = report["memory"]
+    if memory["start_rss_mb"] is not None:
+        print(f"   Memory: {memory['start_rss_mb']:.1f} MB -> {memory['end_rss_mb']:.1f} MB "
+              f"(peak {memory['peak_rss_mb']:.1f} MB, growth {memory['growth_mb']:+.1f} MB)")
+
+
+def main():
+    """Main entry point for the load harness."""
+    parser = argparse.ArgumentParser(description="PMIS in-process load harness")
+    parser.add_argument("--requests", type=int, default=200, help="Number of generated requests")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent in-flight requests")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Endpoint weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--students", type=int, default=100, help="Distinct student profiles in generated traffic")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for generated traffic")
+    parser.add_argument("--replay", default=None, help="Replay a JSON-lines request log instead of generating")
+    parser.add_argument("--record", default=None, help="Write the request sequence as a JSON-lines log")
+    parser.add_argument("--data-path", default=None, help="Dataset directory to load (default: app startup path)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Client-side timeout per request")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    # Keep application logging out of the measurements
+    logging.disable(logging.INFO)
+
+    if args.replay:
+        requests = load_request_log(args.replay)
+    else:
+        requests = generate_requests(args.requests, parse_mix(args.mix), args.students, args.seed)
+
+    if args.record:
+        with open(args.record, "w") as f:
+            for record in requests:
+                f.write(json.dumps(record) + "\n")
+
+    from app.main import app
+
+    print("🚀 PMIS Load Harness")
+    print("=" * 50)
+    print(f"   {len(requests)} requests, concurrency {args.concurrency}"
+          + (f", replaying {args.replay}" if args.replay else f", mix {args.mix}"))
+
+    harness = LoadHarness(app, concurrency=args.concurrency, timeout=args.timeout, data_path=args.data_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        report = asyncio.run(harness.run(requests))
+    report["meta"]["source"] = args.replay or "generated"
+
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report written to {args.output}")
+
+    return 0 if report["overall"]["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,396 @@
+"""
+PMIS Synthetic Catalog Generator
+===============================
+
+Deterministic, seeded generator for scale-testing datasets. Produces every
+table the recommendation engine loads, at arbitrary size, using the exact
+file names and schemas the loaders expect:
+
+- internships_enhanced.csv      -> EnhancedDataLoader
+- students.csv                  -> SkillVocabulary.build_from_data
+- application_statistics.csv    -> ApplicationStatsLoader
+- interview_process.csv         -> InterviewMetaLoader
+- alumni_success.csv            -> AlumniManager
+- internship_skills_courses_migrated.csv -> CourseReadinessScorer
+
+Rows are generated and written in fixed-size chunks, each from its own
+seeded random stream, so memory stays flat at any scale and the same seed
+and reference date always produce byte-identical files.
+
+Usage:
+    python -m tests.synthetic_catalog --out /tmp/pmis_1m --internships 1000000
+
+Author: QA Engineer
+Date: September 24, 2025
+"""
+
+import os
+import sys
+import argparse
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Rows generated per chunk (fixed so output does not depend on memory settings)
+CHUNK_ROWS = 50000
+
+BASE_SKILLS = [
+    "python", "sql", "java", "javascript", "typescript", "react", "node.js", "html", "css",
+    "machine learning", "deep learning", "tensorflow", "pytorch", "statistics", "data analysis",
+    "excel", "tableau", "power bi", "docker", "kubernetes", "aws", "azure", "linux", "git",
+    "c++", "go", "figma", "ui/ux design", "accounting", "financial analysis", "marketing",
+    "seo", "communication", "sales", "recruitment", "matlab", "autocad", "cybersecurity"
+]
+STREAMS = [
+    "Computer Science", "Information Technology", "Data Science", "Electronics",
+    "Mechanical", "Civil", "Commerce", "Business Administration", "Graphic Design"
+]
+DOMAINS = [
+    "ai/ml", "data science", "cybersecurity", "cloud computing", "software development",
+    "web development", "mobile apps", "finance", "consulting", "marketing", "sales", "hr"
+]
+LOCATIONS = [
+    "bangalore", "pune", "chennai", "mumbai", "delhi", "hyderabad", "kolkata",
+    "ahmedabad", "jaipur", "remote"
+]
+COMPANIES = [
+    "Google", "Microsoft", "Infosys", "TCS", "Wipro", "Zoho", "Freshworks", "Flipkart",
+    "Razorpay", "Swiggy", "State Bank of India", "Deloitte", "Acme Technologies", "StartupX"
+]
+INDUSTRIES = ["Technology", "Banking & Finance", "Consulting", "E-commerce", "Manufacturing"]
+EMPLOYEE_COUNTS = [20, 150, 800, 5000, 50000, 300000]
+DURATIONS = ["2 months", "3 months", "4 months", "6 months"]
+TIERS = ["Tier-1", "Tier-2", "Tier-3"]
+UNIVERSITIES = ["iit delhi", "bits pilani", "vit vellore", "anna university", "du", "jain university"]
+PROCESS_TYPES = ["Technical", "HR", "Case", "Aptitude", "Mixed"]
+MODES = ["Virtual", "In-person", "Hybrid"]
+OUTCOMES = ["selected", "completed", "PPO", "converted"]
+PLATFORMS = ["Coursera", "edX", "Udemy", "NPTEL", "Swayam"]
+DIFFICULTIES = ["Beginner", "Intermediate", "Advanced"]
+
+
+def build_skill_pool(n_skills: int) -> List[str]:
+    """
+    Build the skill pool: real skills first, then a synthetic long tail.
+
+    Args:
+        n_skills: Total number of distinct skills
+
+    Returns:
+        List of skill names
+    """
+    pool = BASE_SKILLS[:n_skills]
+    pool += [f"skill {i:05d}" for i in range(n_skills - len(pool))]
+    return pool
+
+
+def skill_weights(n_skills: int, exponent: float = 1.1) -> np.ndarray:
+    """
+    Zipf-like popularity weights, so a few skills dominate like in real postings.
+
+    Args:
+        n_skills: Number of skills
+        exponent: Power-law exponent
+
+    Returns:
+        Probabilities summing to 1
+    """
+    weights = 1.0 / np.arange(1, n_skills + 1) ** exponent
+    return weights / weights.sum()
+
+
+class SyntheticCatalogGenerator:
+    """
+    Generates loader-compatible PMIS datasets of any size.
+
+    Every table is produced chunk by chunk from a random stream derived from
+    (seed, table, chunk index), so tables can be generated independently and
+    in any order without changing their contents.
+    """
+
+    def __init__(self,
+                 n_internships: int,
+                 n_students: Optional[int] = None,
+                 n_alumni: Optional[int] = None,
+                 n_skills: int = 200,
+                 stats_coverage: float = 1.0,
+                 seed: int = 42,
+                 reference_date: Optional[date] = None):
+        """
+        Initialize the generator.
+
+        Args:
+            n_internships: Number of internships
+            n_students: Number of students (defaults to n_internships)
+            n_alumni: Number of alumni stories (defaults to n_internships // 10, at least 100)
+            n_skills: Number of distinct skills
+            stats_coverage: Fraction of internships with application statistics
+            seed: Random seed
+            reference_date: Date deadlines are generated around (defaults to today)
+        """
+        self.n_internships = n_internships
+        self.n_students = n_internships if n_students is None else n_students
+        self.n_alumni = max(100, n_internships // 10) if n_alumni is None else n_alumni
+        self.stats_coverage = min(max(stats_coverage, 0.0), 1.0)
+        self.seed = seed
+        self.reference_date = reference_date or date.today()
+
+        self.skills = np.array(build_skill_pool(n_skills), dtype=object)
+        self.skill_p = skill_weights(len(self.skills))
+
+        self._internship_width = max(4, len(str(n_internships)))
+        self._student_width = max(4, len(str(self.n_students)))
+
+    def _rng(self, table: str, chunk: int) -> np.random.Generator:
+        """Get the random stream of one chunk of one table."""
+        table_key = sum(ord(c) * (i + 1) for i, c in enumerate(table))
+        return np.random.default_rng([self.seed, table_key, chunk])
+
+    def _internship_ids(self, start: int, stop: int) -> List[str]:
+        return [f"INT_{i:0{self._internship_width}d}" for i in range(start + 1, stop + 1)]
+
+    def _skill_lists(self, rng: np.random.Generator, n: int, low: int, high: int) -> List[str]:
+        """Draw n comma-separated skill strings with low..high skills each."""
+        counts = rng.integers(low, high + 1, size=n)
+        drawn = rng.choice(len(self.skills), size=int(counts.sum()), p=self.skill_p)
+        parts = np.split(self.skills[drawn], np.cumsum(counts)[:-1])
+        return [", ".join(dict.fromkeys(part)) for part in parts]
+
+    def internships_chunk(self, chunk: int, start: int, stop: int) -> pd.DataFrame:
+        """Generate internships_enhanced.csv rows [start, stop)."""
+        rng = self._rng("internships", chunk)
+        n = stop - start
+
+        domains = rng.choice(DOMAINS, size=n)
+        companies = rng.choice(COMPANIES, size=n)
+        offsets = rng.integers(-15, 90, size=n)
+        deadlines = [(self.reference_date + timedelta(days=int(d))).isoformat() for d in offsets]
+
+        return pd.DataFrame({
+            'internship_id': self._internship_ids(start, stop),
+            'title': [f"{d.title()} Intern" for d in domains],
+            'company': companies,
+            'domain': domains,
+            'description': [f"Internship at {c} working on {d} projects." for c, d in zip(companies, domains)],
+            'required_skills': self._skill_lists(rng, n, 1, 6),
+            'location': rng.choice(LOCATIONS, size=n),
+            'duration': rng.choice(DURATIONS, size=n),
+            'stipend': rng.integers(0, 61, size=n) * 1000,
+            'is_active': rng.random(n) < 0.95,
+            'application_deadline': deadlines,
+            'is_accepting_applications': offsets >= 0,
+            'employee_count': rng.choice(EMPLOYEE_COUNTS, size=n),
+            'headquarters': rng.choice(LOCATIONS[:-1], size=n),
+            'industry': rng.choice(INDUSTRIES, size=n)
+        })
+
+    def students_chunk(self, chunk: int, start: int, stop: int) -> pd.DataFrame:
+        """Generate students.csv rows [start, stop)."""
+        rng = self._rng("students", chunk)
+        n = stop - start
+        numbers = np.arange(start + 1, stop + 1)
+
+        return pd.DataFrame({
+            'student_id': [f"STU_{i:0{self._student_width}d}" for i in numbers],
+            'name': [f"student {i}" for i in numbers],
+            'email': [f"student{i}@university.edu" for i in numbers],
+            'university': rng.choice(UNIVERSITIES, size=n),
+            'tier': rng.choice(TIERS, size=n, p=[0.15, 0.45, 0.40]),
+            'cgpa': np.round(rng.uniform(5.5, 9.8, size=n), 2),
+            'skills': self._skill_lists(rng, n, 1, 5),
+            'interests': rng.choice(DOMAINS, size=n),
+            'location': rng.choice(LOCATIONS[:-1], size=n),
+            'preferred_location': rng.choice(LOCATIONS, size=n)
+        })
+
+    def application_stats_chunk(self, chunk: int, start: int, stop: int) -> pd.DataFrame:
+        """Generate application_statistics.csv rows for internships [start, stop)."""
+        rng = self._rng("application_stats", chunk)
+        n = stop - start
+
+        covered = rng.random(n) < self.stats_coverage
+        applicants = rng.integers(0, 2000, size=n)
+        positions = rng.integers(0, 25, size=n)
+        selected = np.minimum(applicants, (positions * rng.uniform(1.0, 4.0, size=n)).astype(int))
+        historical = np.where(rng.random(n) < 0.3, np.round(rng.uniform(0.01, 0.5, size=n), 3), np.nan)
+        updated = [(self.reference_date - timedelta(days=int(d))).isoformat() for d in rng.integers(0, 30, size=n)]
+
+        df = pd.DataFrame({
+            'internship_id': self._internship_ids(start, stop),
+            'applicants_total': applicants,
+            'positions_available': positions,
+            'applicants_selected': selected,
+            'historical_selection_rate': historical,
+            'last_updated': updated
+        })
+        return df[covered]
+
+    def interview_meta_chunk(self, chunk: int, start: int, stop: int) -> pd.DataFrame:
+        """Generate interview_process.csv rows for internships [start, stop)."""
+        rng = self._rng("interview_meta", chunk)
+        n = stop - start
+
+        process_types = rng.choice(PROCESS_TYPES, size=n)
+        return pd.DataFrame({
+            'company_name': rng.choice(COMPANIES, size=n),
+            'internship_id': self._internship_ids(start, stop),
+            'process_type': process_types,
+            'rounds': rng.integers(1, 6, size=n),
+            'mode': rng.choice(MODES, size=n),
+            'expected_timeline_days': rng.integers(3, 45, size=n),
+            'notes': [f"{p} process" for p in process_types]
+        })
+
+    def alumni_chunk(self, chunk: int, start: int, stop: int) -> pd.DataFrame:
+        """Generate alumni_success.csv rows [start, stop)."""
+        rng = self._rng("alumni", chunk)
+        n = stop - start
+
+        internship_numbers = rng.integers(1, max(self.n_internships, 1) + 1, size=n)
+        domains = rng.choice(DOMAINS, size=n)
+        return pd.DataFrame({
+            'student_profile_hash': [f"hash_{i:08d}" for i in range(start + 1, stop + 1)],
+            'skills': self._skill_lists(rng, n, 2, 5),
+            'stream': rng.choice(STREAMS, size=n),
+            'college_tier': rng.choice(TIERS, size=n),
+            'rural_urban': rng.choice(["Urban", "Rural"], size=n, p=[0.65, 0.35]),
+            'internship_id': [f"INT_{i:0{self._internship_width}d}" for i in internship_numbers],
+            'company_name': rng.choice(COMPANIES, size=n),
+            'title': [f"{d.title()} Intern" for d in domains],
+            'outcome': rng.choice(OUTCOMES, size=n),
+            'testimonial': [f"Great learning experience in {d}." for d in domains],
+            'year': rng.integers(2020, 2026, size=n)
+        })
+
+    def courses(self) -> pd.DataFrame:
+        """Generate one to three courses per skill (internship_skills_courses_migrated.csv)."""
+        rng = self._rng("courses", 0)
+        per_skill = rng.integers(1, 4, size=len(self.skills))
+        skills = np.repeat(self.skills, per_skill)
+        n = len(skills)
+
+        weeks = rng.integers(4, 16, size=n)
+        prereq_idx = rng.integers(0, len(self.skills), size=n)
+        return pd.DataFrame({
+            'skill': skills,
+            'course_name': [f"{str(s).title()} Course {i + 1}" for i, s in enumerate(skills)],
+            'platform': rng.choice(PLATFORMS, size=n),
+            'course_link': [f"https://courses.example.com/{i + 1}" for i in range(n)],
+            'prerequisites': np.where(rng.random(n) < 0.5, self.skills[prereq_idx], ''),
+            'content_keywords': [f"{s} basics, {s} projects" for s in skills],
+            'difficulty': rng.choice(DIFFICULTIES, size=n),
+            'duration': [f"{w} weeks" for w in weeks],
+            'duration_hours': weeks * 40.0,
+            'rating': np.round(rng.uniform(3.5, 5.0, size=n), 1),
+            'expected_success_boost': np.round(rng.uniform(0.05, 0.2, size=n), 2),
+            'language': 'English'
+        })
+
+    def write_table(self, path: str, n_rows: int, make_chunk: Callable[[int, int, int], pd.DataFrame]) -> int:
+        """
+        Stream a chunked table to CSV.
+
+        Args:
+            path: Output CSV path
+            n_rows: Total rows to generate
+            make_chunk: Function (chunk, start, stop) -> DataFrame
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        header = True
+        for chunk, start in enumerate(range(0, max(n_rows, 1), CHUNK_ROWS)):
+            df = make_chunk(chunk, start, min(start + CHUNK_ROWS, n_rows))
+            df.to_csv(path, mode='w' if header else 'a', header=header, index=False)
+            header = False
+            written += len(df)
+        return written
+
+    def generate(self, out_dir: str) -> Dict[str, int]:
+        """
+        Write every table to out_dir.
+
+        Args:
+            out_dir: Output directory (created if needed)
+
+        Returns:
+            Dict mapping file name to row count
+        """
+        os.makedirs(out_dir, exist_ok=True)
+
+        tables = [
+            ("internships_enhanced.csv", self.n_internships, self.internships_chunk),
+            ("students.csv", self.n_students, self.students_chunk),
+            ("application_statistics.csv", self.n_internships, self.application_stats_chunk),
+            ("interview_process.csv", self.n_internships, self.interview_meta_chunk),
+            ("alumni_success.csv", self.n_alumni, self.alumni_chunk)
+        ]
+
+        counts = {}
+        for name, n_rows, make_chunk in tables:
+            counts[name] = self.write_table(os.path.join(out_dir, name), n_rows, make_chunk)
+
+        courses = self.courses()
+        courses.to_csv(os.path.join(out_dir, "internship_skills_courses_migrated.csv"), index=False)
+        counts["internship_skills_courses_migrated.csv"] = len(courses)
+
+        return counts
+
+
+def generate_catalog(out_dir: str, n_internships: int, seed: int = 42, **kwargs) -> Dict[str, int]:
+    """
+    Generate a complete synthetic dataset (convenience wrapper).
+
+    Args:
+        out_dir: Output directory
+        n_internships: Number of internships
+        seed: Random seed
+        **kwargs: Extra SyntheticCatalogGenerator options
+
+    Returns:
+        Dict mapping file name to row count
+    """
+    return SyntheticCatalogGenerator(n_internships, seed=seed, **kwargs).generate(out_dir)
+
+
+def main():
+    """Main entry point for the generator CLI."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic PMIS dataset")
+    parser.add_argument("--out", required=True, help="Output directory")
+    parser.add_argument("--internships", type=int, default=10000, help="Number of internships")
+    parser.add_argument("--students", type=int, default=None, help="Number of students (default: internships)")
+    parser.add_argument("--alumni", type=int, default=None, help="Number of alumni stories")
+    parser.add_argument("--skills", type=int, default=200, help="Number of distinct skills")
+    parser.add_argument("--stats-coverage", type=float, default=1.0,
+                        help="Fraction of internships with application statistics")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--reference-date", default=None,
+                        help="Date deadlines are generated around, YYYY-MM-DD (default: today)")
+    args = parser.parse_args()
+
+    reference_date = datetime.strptime(args.reference_date, "%Y-%m-%d").date() if args.reference_date else None
+
+    print("🚀 PMIS Synthetic Catalog Generator")
+    print("=" * 50)
+
+    counts = SyntheticCatalogGenerator(
+        n_internships=args.internships,
+        n_students=args.students,
+        n_alumni=args.alumni,
+        n_skills=args.skills,
+        stats_coverage=args.stats_coverage,
+        seed=args.seed,
+        reference_date=reference_date
+    ).generate(args.out)
+
+    for name, rows in counts.items():
+        print(f"   ✅ {name:<40} {rows:>10,} rows")
+    print(f"\n💾 Written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""
+Fairness Re-Ranking Test Suite for PMIS
+
+Checks the vectorized re-ranker in app/fairness.py against a plain
+per-student greedy loop, the per-prefix group quotas, and the vectorized
+per-internship group annotation. Runs in-process; no API server needed.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.fairness import FairnessReranker, DEFAULT_FAIRNESS_SCORE, PROTECTED_VALUES
+
+
+def greedy_rerank_one(scores: np.ndarray, protected: np.ndarray, target_shares: np.ndarray, k: int) -> List[int]:
+    """Per-student greedy loop the batched re-ranker must reproduce."""
+    order = sorted(range(len(scores)), key=lambda i: -scores[i])
+    selected = set()
+    counts = [0] * len(target_shares)
+    result = []
+
+    for pos in range(min(k, len(scores))):
+        pick = None
+        for g, share in enumerate(target_shares):
+            if counts[g] < int(share * (pos + 1)):
+                pick = next((i for i in order if protected[i, g] and i not in selected), None)
+                if pick is not None:
+                    break
+        if pick is None:
+            pick = next(i for i in order if i not in selected)
+
+        selected.add(pick)
+        result.append(pick)
+        for g in range(len(target_shares)):
+            counts[g] += int(protected[pick, g])
+    return result
+
+
+class FairnessRerankerTestSuite(unittest.TestCase):
+    """
+    Test suite for the group-aware greedy re-ranker.
+    """
+
+    def setUp(self):
+        """Set up a re-ranker from the shipped model config."""
+        self.reranker = FairnessReranker()
+        self.n_groups = len(self.reranker.attributes)
+        self.rng = np.random.default_rng(42)
+
+    def assert_matches_greedy(self, scores: np.ndarray, protected: np.ndarray):
+        """Assert rerank_batch reproduces the greedy loop for every row."""
+        batch = self.reranker.rerank_batch(scores, protected)
+        for s, row in enumerate(scores):
+            members = protected if protected.ndim == 2 else protected[s]
+            expected = greedy_rerank_one(row, members, self.reranker.target_shares, self.reranker.k)
+            self.assertEqual(batch[s].tolist(), expected, f"row {s}")
+
+    def test_batch_matches_greedy_shared_membership(self):
+        """Batched pass matches the greedy loop with ties and an empty group."""
+        cohort = self.rng.integers(0, 4, (200, 30)).astype(np.float64)
+        protected = self.rng.random((30, self.n_groups)) < 0.3
+        protected[:, -1] = False
+        self.assert_matches_greedy(cohort, protected)
+
+    def test_batch_matches_greedy_per_student_membership(self):
+        """Batched pass matches the greedy loop when a group has a single member."""
+        cohort = self.rng.integers(0, 4, (200, 30)).astype(np.float64)
+        protected = self.rng.random((200, 30, self.n_groups)) < 0.2
+        protected[:, :, 0] = False
+        protected[:, 5, 0] = True
+        self.assert_matches_greedy(cohort, protected)
+
+    def test_quotas_hold_on_every_prefix_when_group_runs_out(self):
+        """Unmet quota of an exhausted group falls through to the next group."""
+        # Rural has one (top-scored) member, tier members have the lowest tied scores, gender is empty
+        scores = np.repeat([4.0, 3.0, 2.0, 1.0], 5)
+        protected = np.zeros((20, self.n_groups), dtype=bool)
+        protected[0, 0] = True
+        protected[15:, 1] = True
+
+        picks = self.reranker.rerank(scores, protected)
+
+        self.assertEqual(
+            picks.tolist(),
+            greedy_rerank_one(scores, protected, self.reranker.target_shares, self.reranker.k)
+        )
+        for g, share in enumerate(self.reranker.target_shares):
+            available = int(protected[:, g].sum())
+            for p in range(1, len(picks) + 1):
+                self.assertGreaterEqual(
+                    protected[picks[:p], g].sum(), min(int(share * p), available), (g, p)
+                )
+
+    def test_annotation_matches_per_internship_computation(self):
+        """Vectorized annotation matches a per-internship computation (INT_3 has no history)."""
+        history = pd.DataFrame({
+            'internship_id': ['INT_1', 'INT_1', 'INT_1', 'INT_2', 'INT_2'],
+            'rural_urban': ['Rural', 'Urban', 'Rural', 'Urban', 'Urban'],
+            'college_tier': ['Tier_3', 'Tier_1', 'Tier_2', 'Tier_3', 'Tier_2'],
+            'gender': ['Female', 'Male', 'Male', 'Male', 'Female'],
+        })
+        with tempfile.TemporaryDirectory() as tmp:
+            history.to_csv(os.path.join(tmp, "fair_recommendations.csv"), index=False)
+            annotated = self.reranker.annotate_internships(
+                pd.DataFrame({'internship_id': ['INT_2', 'INT_3', 'INT_1']}), tmp
+            )
+
+        for _, row in annotated.iterrows():
+            rows = history[history['internship_id'] == row['internship_id']]
+            if rows.empty:
+                self.assertFalse(row[self.reranker.group_columns].any())
+                self.assertEqual(row['fairness_score'], DEFAULT_FAIRNESS_SCORE)
+                continue
+
+            ratios = []
+            for attr, target in zip(self.reranker.attributes, self.reranker.target_shares):
+                share = (rows[attr].str.lower().str.replace('_', '-') == PROTECTED_VALUES[attr]).mean()
+                self.assertEqual(row[f"protected_{attr}"], share >= target, (row['internship_id'], attr))
+                ratios.append(min(share / target, 1.0))
+            self.assertAlmostEqual(row['fairness_score'], np.mean(ratios))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -191,6 +191,128 @@ class SmokeTestSuite(unittest.TestCase):
         except Exception as e:
             self.fail(f"❌ Unexpected error testing invalid endpoint: {e}")
     
+    def test_internship_search_endpoint(self):
+        """Test that internship search applies filters and pagination."""
+        print("🔍 Testing internship search endpoint...")
+
+        try:
+            params = {"min_stipend": 10000, "max_stipend": 40000, "limit": 5}
+            response = self.session.get(f"{self.base_url}/internships/search", params=params)
+
+            if response.status_code == 503:
+                self.skipTest("Internship data not loaded")
+            self.assertEqual(response.status_code, 200,
+                f"Search endpoint returned {response.status_code}, expected 200")
+
+            data = response.json()
+            for field in ("total", "offset", "limit", "internships"):
+                self.assertIn(field, data, f"Search response missing '{field}' field")
+
+            self.assertLessEqual(len(data["internships"]), 5, "Search returned more than limit")
+            for internship in data["internships"]:
+                self.assertGreaterEqual(internship["stipend"], 10000)
+                self.assertLessEqual(internship["stipend"], 40000)
+
+            print(f"   ✅ Search matched {data['total']} internships")
+
+        except requests.exceptions.ConnectionError:
+            self.fail(f"❌ Cannot connect to {self.base_url}. Is the API running?")
+
+    def test_metrics_endpoint(self):
+        """Test that metrics are exposed in the Prometheus text format."""
+        print("📈 Testing metrics endpoint...")
+
+        try:
+            self.session.get(f"{self.base_url}/health")
+            response = self.session.get(f"{self.base_url}/metrics")
+
+            self.assertEqual(response.status_code, 200,
+                f"Metrics endpoint returned {response.status_code}, expected 200")
+            self.assertTrue(response.headers.get("content-type", "").startswith("text/plain"),
+                "Metrics should be served as text/plain")
+            self.assertIn("# TYPE pmis_http_request_duration_seconds histogram", response.text)
+            self.assertIn("pmis_dataset_rows", response.text)
+
+            print("   ✅ Metrics endpoint working correctly")
+
+        except requests.exceptions.ConnectionError:
+            self.fail(f"❌ Cannot connect to {self.base_url}. Is the API running?")
+
+    def test_admin_profile_disabled_without_token(self):
+        """Test that profiling endpoints are hidden when ADMIN_TOKEN is not configured."""
+        print("🔒 Testing admin profiling endpoints (disabled)...")
+
+        if os.getenv("ADMIN_TOKEN"):
+            self.skipTest("ADMIN_TOKEN is configured")
+
+        try:
+            response = self.session.get(f"{self.base_url}/admin/profile/cprofile")
+            self.assertEqual(response.status_code, 404,
+                f"Admin endpoint returned {response.status_code}, expected 404 without ADMIN_TOKEN")
+
+            response = self.session.post(f"{self.base_url}/admin/profile/sample",
+                                         params={"seconds": 0.1},
+                                         headers={"X-Admin-Token": "not-the-token"})
+            self.assertEqual(response.status_code, 404,
+                f"Admin endpoint returned {response.status_code}, expected 404 without ADMIN_TOKEN")
+
+            print("   ✅ Admin endpoints return 404 when disabled")
+
+        except requests.exceptions.ConnectionError:
+            self.fail(f"❌ Cannot connect to {self.base_url}. Is the API running?")
+
+    def test_admin_profile_rejects_wrong_token(self):
+        """Test that profiling endpoints reject a missing or wrong X-Admin-Token."""
+        print("🔒 Testing admin profiling endpoints (wrong token)...")
+
+        # The server must run with the same ADMIN_TOKEN as this test process
+        expected = os.getenv("ADMIN_TOKEN")
+        if not expected:
+            self.skipTest("ADMIN_TOKEN is not configured")
+
+        try:
+            for headers in ({}, {"X-Admin-Token": expected + "-wrong"}):
+                response = self.session.get(f"{self.base_url}/admin/profile/cprofile", headers=headers)
+                self.assertEqual(response.status_code, 403,
+                    f"Admin endpoint returned {response.status_code}, expected 403")
+
+                response = self.session.post(f"{self.base_url}/admin/profile/sample",
+                                             params={"seconds": 0.1}, headers=headers)
+                self.assertEqual(response.status_code, 403,
+                    f"Admin endpoint returned {response.status_code}, expected 403")
+
+            print("   ✅ Admin endpoints return 403 for a missing or wrong token")
+
+        except requests.exceptions.ConnectionError:
+            self.fail(f"❌ Cannot connect to {self.base_url}. Is the API running?")
+
+    def test_stats_endpoint(self):
+        """Test that catalog statistics are returned and stable between calls."""
+        print("📊 Testing stats endpoint...")
+
+        try:
+            response = self.session.get(f"{self.base_url}/stats")
+
+            if response.status_code == 503:
+                self.skipTest("Data not loaded")
+            self.assertEqual(response.status_code, 200,
+                f"Stats endpoint returned {response.status_code}, expected 200")
+
+            data = response.json()
+            for field in ("internships", "application_stats", "interview_meta", "alumni"):
+                self.assertIn(field, data, f"Stats response missing '{field}' field")
+                self.assertIsInstance(data[field], dict, f"Stats field '{field}' should be an object")
+
+            # Unchanged data is served from the cached response
+            again = self.session.get(f"{self.base_url}/stats")
+            self.assertEqual(again.status_code, 200)
+            self.assertEqual(again.json(), data, "Stats changed between calls without a data change")
+
+            print(f"   ✅ Stats endpoint working ({data['internships'].get('total_internships', 0)} internships)")
+
+        except requests.exceptions.ConnectionError:
+            self.fail(f"❌ Cannot connect to {self.base_url}. Is the API running?")
+
     def test_api_response_time(self):
         """Test that API responds within reasonable time."""
         print("⏱️  Testing API response time...")